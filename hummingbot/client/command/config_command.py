@@ -73,6 +73,7 @@ client_configs_to_display = ["autofill_import",
                              "gateway",
                              "gateway_api_host",
                              "gateway_api_port",
+                             "gateway_quote_cache_ttl",
                              "rate_oracle_source",
                              "extra_tokens",
                              "fetch_pairs_from_all_exchanges",
@@ -85,10 +86,21 @@ client_configs_to_display = ["autofill_import",
                              "other_commands_timeout",
                              "tables_format",
                              "tick_size",
+                             "connectors_tick_interval",
+                             "clock_profiling",
+                             "tick_profiling_enabled",
+                             "slow_tick_warning_threshold",
                              "market_data_collection",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "market_data_recording_enabled",
+                             "market_data_recording_interval",
+                             "markets_recorder",
+                             "write_behind_enabled",
+                             "write_behind_flush_interval",
+                             "write_behind_batch_size",
+                             "json_codec",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -28,6 +28,13 @@ class ExitCommand:
             # Freeze screen 1 second for better UI
             await asyncio.sleep(1)
 
+        if self.markets_recorder is not None:
+            self.markets_recorder.stop()
+            self.markets_recorder = None
+
+        if self.trade_fill_db is not None:
+            self.trade_fill_db.shutdown()
+
         if self._gateway_monitor is not None:
             self._gateway_monitor.stop()
 
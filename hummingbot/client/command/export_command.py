@@ -63,31 +63,31 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
+        # The trades (and their orders, for the age column) are read on a database reader thread
+        df: pd.DataFrame = await self.trade_fill_db.run_query(
+            lambda session: TradeFill.to_pandas(self._get_trades_from_session(
                 int(self.init_time * 1e3),
-                session=session)
-            if len(trades) == 0:
-                self.notify("No past trades to export.")
-                return
-            self.placeholder_mode = True
-            self.app.hide_input = True
-            path = self.client_config_map.log_file_path
-            if path is None:
-                path = str(DEFAULT_LOG_FILE_PATH)
-            file_name = await self.prompt_new_export_file_name(path)
-            if file_name is None:
-                return
-            file_path = os.path.join(path, file_name)
-            try:
-                df: pd.DataFrame = TradeFill.to_pandas(trades)
-                df.to_csv(file_path, header=True)
-                self.notify(f"Successfully exported trades to {file_path}")
-            except Exception as e:
-                self.notify(f"Error exporting trades to {path}: {e}")
-            self.app.change_prompt(prompt=">>> ")
-            self.placeholder_mode = False
-            self.app.hide_input = False
+                session=session)))
+        if len(df) == 0:
+            self.notify("No past trades to export.")
+            return
+        self.placeholder_mode = True
+        self.app.hide_input = True
+        path = self.client_config_map.log_file_path
+        if path is None:
+            path = str(DEFAULT_LOG_FILE_PATH)
+        file_name = await self.prompt_new_export_file_name(path)
+        if file_name is None:
+            return
+        file_path = os.path.join(path, file_name)
+        try:
+            df.to_csv(file_path, header=True)
+            self.notify(f"Successfully exported trades to {file_path}")
+        except Exception as e:
+            self.notify(f"Error exporting trades to {path}: {e}")
+        self.app.change_prompt(prompt=">>> ")
+        self.placeholder_mode = False
+        self.app.hide_input = False
 
     def _get_trades_from_session(self,  # type: HummingbotApplication
                                  start_timestamp: int,
@@ -41,17 +41,33 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
+        if days == 0 and self.performance_tracker is not None:
+            # The trades of the session are already aggregated by the performance tracker
+            if self.performance_tracker.trades_count == 0:
                 self.notify("\n  No past trades to report.")
                 return
             if verbose:
                 self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            safe_ensure_future(self.history_report(start_time, precision=precision))
+            return
+        safe_ensure_future(self.history_from_database(start_time, verbose, precision))
+
+    async def history_from_database(self,  # type: HummingbotApplication
+                                    start_time: float,
+                                    verbose: bool = False,
+                                    precision: Optional[int] = None):
+        # The trades are queried on a database reader thread, a large trades table does not block the event loop
+        trades: List[TradeFill] = await self.trade_fill_db.run_query(
+            lambda session: self._get_trades_from_session(
+                int(start_time * 1e3),
+                session=session,
+                config_file_path=self.strategy_file_name))
+        if not trades:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        await self.history_report(start_time, trades, precision)
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -67,15 +83,21 @@ class HistoryCommand:
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Optional[List[TradeFill]] = None,
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        """
+        Reports the performance of each market from the given trades, or from the trades aggregated by the performance
+        tracker when no trades are given.
+        """
+        if trades is None:
+            market_info: List[Tuple[str, str]] = self.performance_tracker.market_trading_pairs
+        else:
+            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -84,7 +106,11 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            if trades is None:
+                perf = await self.performance_tracker.performance_metrics(market, symbol, cur_balances)
+            else:
+                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -201,19 +227,13 @@ class HistoryCommand:
         This function is used by the KillSwitch class.
         Must be updated if the method of performance report gets updated.
         """
-        if not self.markets_recorder:
+        if not self.markets_recorder or self.performance_tracker is None:
             return s_decimal_0
         if any(not market.ready for market in self.markets.values()):
             return s_decimal_0
 
-        start_time = self.init_time
-
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+        # Read from the running trade aggregates, rather than querying and going through all the trades every time
+        avg_return = await self.history_report(self.init_time, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -47,10 +47,9 @@ class OrderBookCommand:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book(lines):
-            bids = order_book.snapshot[0][['price', 'amount']].head(lines)
-            bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(lines)
-            asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
+            bids, asks = order_book.get_snapshot(depth=lines)
+            bids = bids[['price', 'amount']].rename(columns={'price': 'bid_price', 'amount': 'bid_volume'})
+            asks = asks[['price', 'amount']].rename(columns={'price': 'ask_price', 'amount': 'ask_volume'})
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = [
                 "    " + line
@@ -234,10 +234,18 @@ class StartCommand(GatewayChainApiManager):
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            clock_profiling = self.client_config_map.clock_profiling
+            self.clock = Clock(
+                ClockMode.REALTIME,
+                tick_size=tick_size,
+                tick_profiling_enabled=clock_profiling.tick_profiling_enabled,
+                slow_tick_warning_threshold=clock_profiling.slow_tick_warning_threshold or None,
+            )
+            connectors_tick_interval = self.client_config_map.connectors_tick_interval
+            connectors_tick_interval = max(connectors_tick_interval, tick_size) if connectors_tick_interval > 0 else None
             for market in self.markets.values():
                 if market is not None:
-                    self.clock.add_iterator(market)
+                    self.clock.add_iterator(market, connectors_tick_interval)
                     self.markets_recorder.restore_market_states(self.strategy_file_name, market)
                     if len(market.limit_orders) > 0:
                         self.notify(f"Canceling dangling limit orders on {market.name}...")
@@ -57,6 +57,13 @@ class StopCommand:
         if self.markets_recorder is not None:
             self.markets_recorder.stop()
 
+        if self.trade_fill_db is not None:
+            # Waits for the records saved by the markets recorder, the worker threads are started again when needed
+            self.trade_fill_db.shutdown()
+
+        if self.performance_tracker is not None:
+            self.performance_tracker.stop()
+
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
@@ -65,4 +72,5 @@ class StopCommand:
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        self.performance_tracker = None
         self.market_trading_pairs_map.clear()
@@ -35,6 +35,11 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
+from hummingbot.core.web_assistant.connections.json_codec import (
+    JSON_CODEC_NAMES,
+    get_json_codec,
+    set_default_json_codec,
+)
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.pmm_script.pmm_script_iterator import PMMScriptIterator
 from hummingbot.strategy.strategy_base import StrategyBase
@@ -179,11 +184,86 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_recording_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable recording the order books and the public trades to binary market data files"
+            ),
+        ),
+    )
+    market_data_recording_interval: float = Field(
+        default=1.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval in seconds between the order book snapshots of the market data files (Default=1)"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
 
+class MarketsRecorderConfigMap(BaseClientModel):
+    write_behind_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable saving the orders and trades to the database in batches from a background thread"
+            ),
+        ),
+    )
+    write_behind_flush_interval: float = Field(
+        default=1.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum time in seconds the records wait before being saved (Default=1.0)"
+            ),
+        ),
+    )
+    write_behind_batch_size: int = Field(
+        default=100,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of pending records that triggers a save before the interval ends (Default=100)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "markets_recorder"
+
+
+class ClockProfilingConfigMap(BaseClientModel):
+    tick_profiling_enabled: bool = Field(
+        default=False,
+        description="Measure the tick duration of each clock iterator (connectors, strategy, trackers) and show the"
+                    "\nstatistics in the status command.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the measurement of the clock tick durations"
+            ),
+        ),
+    )
+    slow_tick_warning_threshold: float = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the duration in seconds of an iterator tick above which a warning is logged"
+                " (0 to use the tick size)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "clock_profiling"
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -595,6 +675,15 @@ class GatewayConfigMap(BaseClientModel):
             prompt=lambda cm: "Please enter your Gateway API port",
         ),
     )
+    gateway_quote_cache_ttl: float = Field(
+        default=2.0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the time in seconds the gateway AMM price quotes are reused, 0 to disable caching (Default=2.0)"
+            ),
+        ),
+    )
 
     class Config:
         title = "gateway"
@@ -1118,7 +1207,31 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    connectors_tick_interval: float = Field(
+        default=0,
+        ge=0,
+        description="The time interval between the ticks of the connectors, rounded to a multiple of the tick size."
+                    "\nUse it with a small tick size to run the strategy logic more often than the connectors."
+                    " \n0 to tick the connectors with the tick size.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What tick interval (in seconds) do you want to use for the connectors? (Enter 0 to use the tick size)"
+            ),
+        ),
+    )
+    clock_profiling: ClockProfilingConfigMap = Field(default=ClockProfilingConfigMap())
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    markets_recorder: MarketsRecorderConfigMap = Field(default=MarketsRecorderConfigMap())
+    json_codec: str = Field(
+        default="json",
+        description="The JSON library used to encode and decode the exchange API messages (json, orjson, msgspec or"
+                    "\nfastest to use the fastest one installed). It applies to the connectors created afterwards.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Which JSON library do you want to use for the exchange API messages? {JSON_CODEC_NAMES}"
+            ),
+        ),
+    )
 
     class Config:
         title = "client_config_map"
@@ -1234,13 +1347,36 @@ class ClientConfigMap(BaseClientModel):
             raise ValueError(ret)
         return v
 
+    @validator("connectors_tick_interval", pre=True)
+    def validate_connectors_tick_interval(cls, v: float):
+        """Used for client-friendly error output."""
+        ret = validate_float(v, min_value=0)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
+    @validator("json_codec", pre=True)
+    def validate_json_codec(cls, v: str):
+        """Used for client-friendly error output."""
+        try:
+            get_json_codec(v)
+        except ImportError:
+            raise ValueError(f"The {v} library is not installed.")
+        return v
+
     # === post-validations ===
 
     @root_validator()
     def post_validations(cls, values: Dict):
         cls.rate_oracle_source_on_validated(values)
+        cls.json_codec_on_validated(values)
         return values
 
+    @classmethod
+    def json_codec_on_validated(cls, values: Dict):
+        if "json_codec" in values:
+            set_default_json_codec(values["json_codec"])
+
     @classmethod
     def rate_oracle_source_on_validated(cls, values: Dict):
         rate_source_mode: RateSourceModeBase = values["rate_oracle_source"]
@@ -20,6 +20,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.gateway_ssl_config_map import SSLConfigMap
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
+from hummingbot.client.performance_tracker import PerformanceTracker
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, AllConnectorSettings, ConnectorType
 from hummingbot.client.tab import __all__ as tab_classes
 from hummingbot.client.tab.data_types import CommandTab
@@ -104,6 +105,7 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.performance_tracker: Optional[PerformanceTracker] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
@@ -326,11 +328,23 @@ class HummingbotApplication(*commands):
             self.strategy_file_name,
             self.strategy_name,
             self.client_config_map.market_data_collection,
+            self.client_config_map.markets_recorder,
         )
         self.markets_recorder.start()
+        self._initialize_performance_tracker()
         if self._mqtt is not None:
             self._mqtt.start_market_events_fw()
 
+    def _initialize_performance_tracker(self):
+        # Listening before reading the trades already recorded, the fills in both are only counted once
+        self.performance_tracker = PerformanceTracker(list(self.markets.values()))
+        self.performance_tracker.start()
+        with self.trade_fill_db.get_new_session() as session:
+            self.performance_tracker.add_trade_fills(self._get_trades_from_session(
+                int(self.init_time * 1e3),
+                session=session,
+                config_file_path=self.strategy_file_name))
+
     def _initialize_notifiers(self):
         self.notifiers.extend(
             [
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
-from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
@@ -71,6 +71,17 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_accumulator(cls,
+                                      accumulator: "MarketPerformanceAccumulator",
+                                      current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Creates the performance metrics from the running trade aggregates of a market, without going through the trades
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_accumulator(accumulator, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -248,6 +259,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -302,15 +316,30 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._initialize_balances_and_values(
+            trading_pair, current_balances, Decimal(str(trades[0].price)), Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_balances_and_values(self,
+                                              trading_pair: str,
+                                              current_balances: Dict[str, Decimal],
+                                              start_price: Decimal,
+                                              last_trade_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_trade_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +347,166 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
 
-        await self._calculate_fees(quote, trades)
+    async def _initialize_metrics_from_accumulator(self,
+                                                   accumulator: "MarketPerformanceAccumulator",
+                                                   current_balances: Dict[str, Decimal]):
+        self.num_buys = accumulator.num_buys
+        self.num_sells = accumulator.num_sells
+        self.num_trades = self.num_buys + self.num_sells
+
+        self.b_vol_base = accumulator.b_vol_base
+        self.s_vol_base = accumulator.s_vol_base
+        self.b_vol_quote = accumulator.b_vol_quote
+        self.s_vol_quote = accumulator.s_vol_quote
+        self.tot_vol_base = self.b_vol_base + self.s_vol_base
+        self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
+        self.avg_b_price = abs(self.divide(self.b_vol_quote, self.b_vol_base))
+        self.avg_s_price = abs(self.divide(self.s_vol_quote, self.s_vol_base))
+        self.avg_tot_price = self.divide(abs(self.b_vol_quote) + abs(self.s_vol_quote),
+                                         abs(self.b_vol_base) + abs(self.s_vol_base))
+
+        await self._initialize_balances_and_values(
+            accumulator.trading_pair, current_balances, accumulator.start_price, accumulator.last_price)
+        if accumulator.are_derivatives:
+            self.trade_pnl = accumulator.derivative_pnl
+        else:
+            self.trade_pnl = self.cur_value - self.hold_value
+
+        self.fees.update(accumulator.fees)
+        await self._calculate_fee_in_quote(accumulator.quote)
 
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+
+class MarketPerformanceAccumulator:
+    """
+    Running aggregates of the trades of a market (volumes, fees and the PnL of the closed derivative positions), updated
+    in O(1) for each trade fill. The result is the same as grouping the trades as PerformanceMetrics does.
+    """
+    # The orders opening or closing long and short positions
+    _POSITION_ORDERS_DIRECTIONS: Dict[Tuple[str, str], str] = {
+        (TradeType.BUY.name, PositionAction.OPEN.value): "long",
+        (TradeType.SELL.name, PositionAction.CLOSE.value): "long",
+        (TradeType.SELL.name, PositionAction.OPEN.value): "short",
+        (TradeType.BUY.name, PositionAction.CLOSE.value): "short",
+    }
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair = trading_pair
+        self.base, self.quote = split_hb_trading_pair(trading_pair)
+
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self.start_price: Decimal = s_decimal_nan
+        self.last_price: Decimal = s_decimal_nan
+        self.derivative_pnl: Decimal = s_decimal_0
+
+        self._no_position_buys: int = 0
+        self._no_position_sells: int = 0
+        # The open and close position orders are paired in their creation order (see PerformanceMetrics.position_order)
+        # Each order is [sum of the fill prices, number of fills, amount], the price of an order is the fills average
+        self._position_orders: Dict[Tuple[str, str], List[List[Decimal]]] = {
+            orders_key: [] for orders_key in self._POSITION_ORDERS_DIRECTIONS
+        }
+        # The position orders list and the index of each order id, None for the orders not opening or closing positions
+        self._orders_positions: Dict[str, Optional[Tuple[Tuple[str, str], int]]] = {}
+        self._positions_pnl: Dict[Tuple[str, int], Decimal] = {}
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        return ((self.num_buys > 0 and self._no_position_buys == 0) or
+                (self.num_sells > 0 and self._no_position_sells == 0))
+
+    def add_trade_fill(self, trade_fill: TradeFill):
+        self.add_trade(trade_type=trade_fill.trade_type,
+                       order_id=trade_fill.order_id,
+                       price=Decimal(str(trade_fill.price)),
+                       amount=Decimal(str(trade_fill.amount)),
+                       position=trade_fill.position,
+                       trade_fee=TradeFeeBase.from_json(trade_fill.trade_fee))
+
+    def add_trade(self,
+                  trade_type: str,
+                  order_id: str,
+                  price: Decimal,
+                  amount: Decimal,
+                  position: Optional[str],
+                  trade_fee: TradeFeeBase):
+        """
+        Adds a trade fill to the aggregates
+        :param trade_type: the TradeType name of the fill
+        :param position: the PositionAction value of the fill
+        """
+        position = position or PositionAction.NIL.value
+        trade_type = trade_type.upper()
+        if trade_type == TradeType.BUY.name:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote -= amount * price
+            self._no_position_buys += position == PositionAction.NIL.value
+        elif trade_type == TradeType.SELL.name:
+            self.num_sells += 1
+            self.s_vol_base -= amount
+            self.s_vol_quote += amount * price
+            self._no_position_sells += position == PositionAction.NIL.value
+        else:
+            return
+
+        if trade_fee.percent is not None:
+            if trade_fee.type_descriptor_for_json() == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.s_vol_quote -= amount * price * trade_fee.percent
+            self.fees[self.quote] += price * amount * trade_fee.percent
+        for flat_fee in trade_fee.flat_fees:
+            self.fees[flat_fee.token] += flat_fee.amount
+
+        if self.start_price.is_nan():
+            self.start_price = price
+        self.last_price = price
+        self._add_position_fill(trade_type, order_id, price, amount, position)
+
+    def _add_position_fill(self, trade_type: str, order_id: str, price: Decimal, amount: Decimal, position: str):
+        if order_id not in self._orders_positions:
+            # The first fill of an order decides of its position
+            orders_key = (trade_type, position)
+            orders = self._position_orders.get(orders_key)
+            if orders is None:
+                self._orders_positions[order_id] = None
+                return
+            orders.append([s_decimal_0, 0, s_decimal_0])
+            self._orders_positions[order_id] = (orders_key, len(orders) - 1)
+        order_position = self._orders_positions[order_id]
+        if order_position is None:
+            return
+        orders_key, index = order_position
+        order = self._position_orders[orders_key][index]
+        order[0] += price
+        order[1] += 1
+        order[2] += amount
+        self._update_position_pnl(self._POSITION_ORDERS_DIRECTIONS[orders_key], index)
+
+    def _update_position_pnl(self, direction: str, index: int):
+        if direction == "long":
+            opens = self._position_orders[(TradeType.BUY.name, PositionAction.OPEN.value)]
+            closes = self._position_orders[(TradeType.SELL.name, PositionAction.CLOSE.value)]
+        else:
+            opens = self._position_orders[(TradeType.SELL.name, PositionAction.OPEN.value)]
+            closes = self._position_orders[(TradeType.BUY.name, PositionAction.CLOSE.value)]
+        if index >= len(opens) or index >= len(closes):
+            return
+        open_sum, open_fills, _ = opens[index]
+        close_sum, close_fills, close_amount = closes[index]
+        price_change = close_sum / close_fills - open_sum / open_fills
+        pnl = price_change * close_amount if direction == "long" else -price_change * close_amount
+        self.derivative_pnl += pnl - self._positions_pnl.get((direction, index), s_decimal_0)
+        self._positions_pnl[(direction, index)] = pnl
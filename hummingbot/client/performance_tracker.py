@@ -0,0 +1,89 @@
+import asyncio
+import threading
+from decimal import Decimal
+from typing import Dict, List, Set, Tuple
+
+from hummingbot.client.performance import MarketPerformanceAccumulator, PerformanceMetrics
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.model.trade_fill import TradeFill
+
+
+class PerformanceTracker:
+    """
+    Keeps the running trade aggregates of each market and trading pair, so the performance metrics can be calculated
+    without querying and going through all the trades of the session.
+
+    The tracker is seeded once with the trades already in the database (`add_trade_fills`), then updated with the
+    order filled events of the markets. Fills already added are ignored, so the events of the trades recorded while
+    seeding are not counted twice.
+    """
+
+    def __init__(self, markets: List[ConnectorBase]):
+        self._markets: List[ConnectorBase] = markets
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._accumulators: Dict[Tuple[str, str], MarketPerformanceAccumulator] = {}
+        self._added_fills: Set[Tuple[str, str, str]] = set()
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    @property
+    def market_trading_pairs(self) -> List[Tuple[str, str]]:
+        return list(self._accumulators)
+
+    @property
+    def trades_count(self) -> int:
+        return sum(accumulator.num_trades for accumulator in self._accumulators.values())
+
+    def start(self):
+        for market in self._markets:
+            market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def add_trade_fills(self, trade_fills: List[TradeFill]):
+        for trade_fill in trade_fills:
+            if self._is_new_fill(trade_fill.market, trade_fill.order_id, trade_fill.exchange_trade_id):
+                self._accumulator(trade_fill.market, trade_fill.symbol).add_trade_fill(trade_fill)
+
+    async def performance_metrics(self,
+                                  market: str,
+                                  trading_pair: str,
+                                  current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        return await PerformanceMetrics.create_from_accumulator(
+            self._accumulators[(market, trading_pair)], current_balances)
+
+    def _accumulator(self, market: str, trading_pair: str) -> MarketPerformanceAccumulator:
+        key = (market, trading_pair)
+        if key not in self._accumulators:
+            self._accumulators[key] = MarketPerformanceAccumulator(trading_pair)
+        return self._accumulators[key]
+
+    def _is_new_fill(self, market: str, order_id: str, exchange_trade_id: str) -> bool:
+        if not exchange_trade_id:
+            return True
+        fill_key = (market, order_id, exchange_trade_id)
+        if fill_key in self._added_fills:
+            return False
+        self._added_fills.add(fill_key)
+        return True
+
+    def _did_fill_order(self,
+                        event_tag: int,
+                        market: ConnectorBase,
+                        evt: OrderFilledEvent):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
+            return
+
+        if self._is_new_fill(market.display_name, evt.order_id, evt.exchange_trade_id):
+            self._accumulator(market.display_name, evt.trading_pair).add_trade(
+                trade_type=evt.trade_type.name,
+                order_id=evt.order_id,
+                price=evt.price,
+                amount=evt.amount,
+                position=evt.position,
+                trade_fee=evt.trade_fee,
+            )
@@ -3,7 +3,7 @@ import logging
 from collections import defaultdict
 from decimal import Decimal
 from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -29,6 +29,39 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersByExchangeOrderIdView(Mapping):
+    """
+    Read-only view of the orders in a ClientOrderTracker, mapped by exchange order ID.
+    Lookups use the tracker index, so they don't require building a new dictionary with all the orders.
+    """
+
+    def __init__(self, tracker: "ClientOrderTracker", include_cached_orders: bool):
+        self._tracker = tracker
+        self._include_cached_orders = include_cached_orders
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._tracker._fetch_order_by_exchange_order_id(
+            exchange_order_id=exchange_order_id, include_cached_orders=self._include_cached_orders
+        )
+        if order is None:
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._orders_map())
+
+    def __len__(self) -> int:
+        return len(self._orders_map())
+
+    def _orders_map(self) -> Dict[str, InFlightOrder]:
+        tracker = self._tracker
+        containers = [tracker.active_orders.values()]
+        if self._include_cached_orders:
+            containers.append(tracker.cached_orders.values())
+        containers.append(tracker.lost_orders.values())
+        return {order.exchange_order_id: order for order in chain(*containers)}
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -58,6 +91,11 @@ class ClientOrderTracker:
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
         self._lost_orders: Dict[str, InFlightOrder] = {}
 
+        # Index of the tracked orders by exchange order ID. Orders without exchange order ID are kept apart until
+        # the exchange order ID is assigned. Entries are validated when read, and stale ones are pruned periodically.
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
@@ -91,15 +129,11 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.cached_orders, **self.lost_orders}
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
-        Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
+        Same as `all_fillable_orders`, but the orders are mapped by exchange order ID (read-only view).
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderIdView(tracker=self, include_cached_orders=True)
 
     @property
     def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
@@ -109,14 +143,11 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.lost_orders}
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
-        Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
+        Same as `all_updatable_orders`, but the orders are mapped by exchange order ID (read-only view).
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderIdView(tracker=self, include_cached_orders=False)
 
     @property
     def current_timestamp(self) -> int:
@@ -142,6 +173,7 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._index_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -162,6 +194,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_order(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -174,11 +207,11 @@ class ClientOrderTracker:
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
+        if client_order_id is not None:
+            found_order = self._in_flight_orders.get(client_order_id) or self._cached_orders.get(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._fetch_order_by_exchange_order_id(
+                exchange_order_id=exchange_order_id, include_cached_orders=True, include_lost_orders=False
             )
 
         return found_order
@@ -191,9 +224,9 @@ class ClientOrderTracker:
         if client_order_id in self._lost_orders:
             found_order = self._lost_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+            order = self._fetch_order_by_exchange_order_id(exchange_order_id=exchange_order_id)
+            if order is not None and self._lost_orders.get(order.client_order_id) is order:
+                found_order = order
 
         return found_order
 
@@ -249,6 +282,7 @@ class ClientOrderTracker:
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
                     self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._index_order(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -291,6 +325,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._index_order(tracked_order)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
         else:
@@ -304,6 +339,56 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _fetch_order_by_exchange_order_id(
+        self, exchange_order_id: str, include_cached_orders: bool = True, include_lost_orders: bool = True
+    ) -> Optional[InFlightOrder]:
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None or order.exchange_order_id != exchange_order_id:
+            if order is not None:
+                # The order exchange order ID changed since it was indexed
+                del self._orders_by_exchange_order_id[exchange_order_id]
+                self._index_order(order)
+            self._index_orders_with_new_exchange_order_id()
+            order = self._orders_by_exchange_order_id.get(exchange_order_id)
+
+        if order is not None and not self._is_tracked(
+            order=order, include_cached_orders=include_cached_orders, include_lost_orders=include_lost_orders
+        ):
+            order = None
+        return order
+
+    def _is_tracked(self, order: InFlightOrder, include_cached_orders: bool = True, include_lost_orders: bool = True):
+        client_order_id = order.client_order_id
+        return (self._in_flight_orders.get(client_order_id) is order
+                or (include_cached_orders and self._cached_orders.get(client_order_id) is order)
+                or (include_lost_orders and self._lost_orders.get(client_order_id) is order))
+
+    def _index_order(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+        else:
+            self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+            if len(self._orders_by_exchange_order_id) > 2 * (
+                len(self._in_flight_orders) + len(self._lost_orders) + self.MAX_CACHE_SIZE
+            ):
+                self._prune_exchange_order_id_index()
+
+    def _index_orders_with_new_exchange_order_id(self):
+        pending_orders: List[InFlightOrder] = list(self._orders_without_exchange_order_id.values())
+        for order in pending_orders:
+            if order.exchange_order_id is not None:
+                self._index_order(order)
+            elif not self._is_tracked(order=order):
+                del self._orders_without_exchange_order_id[order.client_order_id]
+
+    def _prune_exchange_order_id_index(self):
+        self._orders_by_exchange_order_id = {
+            exchange_order_id: order
+            for exchange_order_id, order in self._orders_by_exchange_order_id.items()
+            if order.exchange_order_id == exchange_order_id and self._is_tracked(order=order)
+        }
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -103,7 +103,8 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             raise
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
-        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        # The raw messages are decoded by the data source (see _process_websocket_messages)
+        ws: WSAssistant = await self._api_factory.get_ws_assistant(decode_json=False)
         await ws.connect(ws_url=CONSTANTS.WSS_URL.format(self._domain),
                          ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
         return ws
@@ -132,6 +133,25 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raw_message, time.time(), {"trading_pair": trading_pair})
             message_queue.put_nowait(order_book_message)
 
+    async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        json_codec = websocket_assistant.json_codec
+        async for ws_response in websocket_assistant.iter_messages():
+            raw_message = ws_response.data
+            if raw_message is None:  # data will be None when the websocket is disconnected
+                continue
+            try:
+                data: Dict[str, Any] = json_codec.loads(raw_message)
+            except json_codec.decode_errors:
+                self.logger().warning(f"Invalid message received from the order book stream: {raw_message}")
+                continue
+            channel: str = self._channel_originating_message(event_message=data)
+            if channel in self._get_messages_queue_keys():
+                self._message_queue[channel].put_nowait(data)
+            else:
+                await self._process_message_for_unknown_channel(
+                    event_message=data, websocket_assistant=websocket_assistant
+                )
+
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         channel = ""
         if "result" not in event_message:
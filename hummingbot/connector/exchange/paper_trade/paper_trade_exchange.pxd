@@ -1,3 +1,4 @@
+from libc.stdint cimport int64_t
 from libcpp.set cimport set as cpp_set
 from libcpp.string cimport string
 from libcpp.unordered_map cimport unordered_map
@@ -17,6 +18,9 @@ ctypedef cpp_set[CPPLimitOrder].iterator SingleTradingPairLimitOrdersIterator
 ctypedef cpp_set[CPPLimitOrder].reverse_iterator SingleTradingPairLimitOrdersRIterator
 ctypedef cpp_set[CPPOrderExpirationEntry] LimitOrderExpirationSet
 ctypedef cpp_set[CPPOrderExpirationEntry].iterator LimitOrderExpirationSetIterator
+# Top of book version of the order book of each trading pair at the last crossing check of its limit orders
+ctypedef unordered_map[string, int64_t] CrossingCheckVersions
+ctypedef unordered_map[string, int64_t].iterator CrossingCheckVersionsIterator
 
 cdef class QuantizationParams:
     cdef:
@@ -31,6 +35,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef:
         LimitOrders _bid_limit_orders
         LimitOrders _ask_limit_orders
+        CrossingCheckVersions _bid_crossing_check_versions
+        CrossingCheckVersions _ask_crossing_check_versions
         bint _paper_trade_market_initialized
         dict _trading_pairs
         object _queued_orders
@@ -75,6 +81,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef double c_next_event_timestamp(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
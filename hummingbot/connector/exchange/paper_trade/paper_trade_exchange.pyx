@@ -11,6 +11,7 @@ from cpython cimport PyObject
 from cython.operator cimport address, dereference as deref, postincrement as inc
 from libcpp cimport bool as cppbool
 from libcpp.vector cimport vector
+from libc.math cimport INFINITY, NAN
 
 from hummingbot.connector.budget_checker import BudgetChecker
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector
@@ -320,6 +321,25 @@ cdef class PaperTradeExchange(ExchangeBase):
         self.c_process_market_orders()
         self.c_process_crossed_limit_orders()
 
+    cdef double c_next_event_timestamp(self):
+        cdef:
+            LimitOrdersIterator map_it
+
+        # Queued market orders and open limit orders are processed on every tick, the exchange is idle otherwise
+        if len(self._queued_orders) > 0:
+            return NAN
+        map_it = self._bid_limit_orders.begin()
+        while map_it != self._bid_limit_orders.end():
+            if not deref(map_it).second.empty():
+                return NAN
+            inc(map_it)
+        map_it = self._ask_limit_orders.begin()
+        while map_it != self._ask_limit_orders.end():
+            if not deref(map_it).second.empty():
+                return NAN
+            inc(map_it)
+        return INFINITY
+
     cdef str c_buy(self,
                    str trading_pair_str,
                    object amount,
@@ -349,6 +369,8 @@ cdef class PaperTradeExchange(ExchangeBase):
             self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, True, trading_pair_str,
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
+            # The new order has to be checked against the book even if the best prices do not change
+            self._bid_crossing_check_versions.erase(cpp_trading_pair_str)
 
             map_it = self._bid_limit_orders.find(cpp_trading_pair_str)
 
@@ -410,6 +432,9 @@ cdef class PaperTradeExchange(ExchangeBase):
             self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, False, trading_pair_str,
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
+            # The new order has to be checked against the book even if the best prices do not change
+            self._ask_crossing_check_versions.erase(cpp_trading_pair_str)
+
             map_it = self._ask_limit_orders.find(cpp_trading_pair_str)
 
             if map_it == self._ask_limit_orders.end():
@@ -829,8 +854,10 @@ cdef class PaperTradeExchange(ExchangeBase):
                 self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
             else:
                 self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+            return True
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
+            return False
 
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
@@ -840,23 +867,42 @@ cdef class PaperTradeExchange(ExchangeBase):
         Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
         This implies someone was ready to fill the limit order, if that limit order was on the market.
 
+        The orders left after a check do not cross the book, so the trading pair is only checked again once the best
+        prices of its order book change or new orders are added.
+
         :param is_buy: are the limit orders on the bid side?
         :param limit_orders_map_ptr: pointer to the limit orders map
         :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
         """
         cdef:
-            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
-            object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
+            string cpp_trading_pair = deref(deref(map_it_ptr)).first
+            CrossingCheckVersions *checked_versions_ptr = (address(self._bid_crossing_check_versions)
+                                                           if is_buy
+                                                           else address(self._ask_crossing_check_versions))
+            CrossingCheckVersionsIterator checked_version_it = checked_versions_ptr.find(cpp_trading_pair)
+            OrderBook order_book = self.c_get_order_book(cpp_trading_pair.decode("utf8"))
+            int64_t top_of_book_version = order_book._top_of_book_version
+            double opposite_order_book_price
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        if (checked_version_it != checked_versions_ptr.end()
+                and deref(checked_version_it).second == top_of_book_version):
+            return
+        try:
+            opposite_order_book_price = order_book.c_get_price(is_buy)
+        except EnvironmentError:
+            # Nothing crosses an empty book, the pair is checked again on the next tick
+            return
+        deref(checked_versions_ptr)[cpp_trading_pair] = top_of_book_version
+
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
+                if opposite_order_book_price > <double>(<object>cpp_limit_order_ptr.getPrice()):
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
@@ -864,13 +910,15 @@ cdef class PaperTradeExchange(ExchangeBase):
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
+                if opposite_order_book_price < <double>(<object>cpp_limit_order_ptr.getPrice()):
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
-            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+            if not self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it):
+                # The order that could not be processed still crosses the book, it is retried on the next tick
+                checked_versions_ptr.erase(cpp_trading_pair)
 
     cdef c_process_crossed_limit_orders(self):
         cdef:
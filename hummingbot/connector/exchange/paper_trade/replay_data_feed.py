@@ -0,0 +1,166 @@
+import gzip
+import heapq
+import json
+from os import PathLike
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from hummingbot.connector.market_data_recorder import MarketDataReader
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+_json_decoder = json.JSONDecoder()
+
+
+def _open_text_file(file_path: Union[str, PathLike]) -> IO[str]:
+    if str(file_path).endswith(".gz"):
+        return gzip.open(file_path, "rt")
+    return open(file_path, "r")
+
+
+def read_json_objects(file_path: Union[str, PathLike]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily reads the JSON objects of a JSON-lines file (optionally gzip compressed), one line at a time.
+    Several objects on the same line are accepted, since the dumps of the recording scripts are not newline terminated.
+    """
+    with _open_text_file(file_path) as file:
+        for line in file:
+            line = line.strip()
+            position = 0
+            while position < len(line):
+                json_object, position = _json_decoder.raw_decode(line, position)
+                yield json_object
+                while position < len(line) and line[position].isspace():
+                    position += 1
+
+
+def read_order_book_snapshots(file_path: Union[str, PathLike], trading_pair: str) -> Iterator[OrderBookMessage]:
+    """
+    Reads the order book snapshots recorded by the download_order_book_and_trades script, lines with the format
+    {"ts": timestamp, "bids": [[price, amount], ...], "asks": [[price, amount], ...]}
+    """
+    for snapshot in read_json_objects(file_path):
+        timestamp = float(snapshot["ts"])
+        yield OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "trading_pair": trading_pair,
+                "update_id": int(timestamp * 1e3),
+                "bids": snapshot["bids"],
+                "asks": snapshot["asks"],
+            },
+            timestamp=timestamp,
+        )
+
+
+def read_order_book_diffs(file_path: Union[str, PathLike], trading_pair: str) -> Iterator[OrderBookMessage]:
+    """
+    Reads order book diffs, lines with the format
+    {"ts": timestamp, "update_id": update_id, "bids": [[price, amount], ...], "asks": [[price, amount], ...]}
+    where an amount of 0 removes the price level
+    """
+    for diff in read_json_objects(file_path):
+        timestamp = float(diff["ts"])
+        yield OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "trading_pair": trading_pair,
+                "update_id": int(diff.get("update_id", timestamp * 1e3)),
+                "bids": diff["bids"],
+                "asks": diff["asks"],
+            },
+            timestamp=timestamp,
+        )
+
+
+def read_trades(file_path: Union[str, PathLike], trading_pair: str) -> Iterator[OrderBookMessage]:
+    """
+    Reads the public trades recorded by the download_order_book_and_trades script, lines with the format
+    {"ts": timestamp, "price": price, "q_base": amount, "side": "buy" | "sell"}
+    """
+    for trade_number, trade in enumerate(read_json_objects(file_path)):
+        timestamp = float(trade["ts"])
+        trade_type = TradeType.SELL if trade["side"] == "sell" else TradeType.BUY
+        yield OrderBookMessage(
+            message_type=OrderBookMessageType.TRADE,
+            content={
+                "trading_pair": trading_pair,
+                "trade_type": float(trade_type.value),
+                "trade_id": trade.get("trade_id", trade_number),
+                "update_id": int(timestamp * 1e3),
+                "price": trade["price"],
+                "amount": trade["q_base"],
+            },
+            timestamp=timestamp,
+        )
+
+
+class ReplayDataFeed:
+    """
+    Merges several streams of recorded order book messages (snapshots, diffs and trades, of one or several trading
+    pairs) into a single stream in timestamp order. The streams are consumed lazily, so only the next message of each
+    stream is held in memory. The messages of each stream must be sorted by timestamp, messages with the same
+    timestamp are delivered in the order of the streams (order book streams should then be given before trade streams).
+
+    The feeds are usually loaded from the binary market data files (.hbmd) written by `MarketDataRecorder`, with
+    `from_market_data_files`, or from the JSON-lines dumps of older recordings, with `from_recording_files`.
+    """
+
+    def __init__(self, message_streams: Iterable[Iterable[OrderBookMessage]]):
+        self._messages: Iterator[OrderBookMessage] = heapq.merge(
+            *message_streams, key=lambda message: message.timestamp
+        )
+        self._next_message: Optional[OrderBookMessage] = next(self._messages, None)
+
+    @classmethod
+    def from_market_data_files(cls, file_paths: Iterable[Union[str, PathLike]]) -> "ReplayDataFeed":
+        """
+        Replays the market data files written by `MarketDataRecorder`, of one or several trading pairs. The files of
+        each trading pair are read in chronological order, as they are named after their first timestamp.
+
+        :param file_paths: the paths of the market data files, e.g. the values of `MarketDataRecorder.file_paths`
+        """
+        file_paths_by_trading_pair: Dict[str, List[str]] = {}
+        for file_path in sorted(str(file_path) for file_path in file_paths):
+            trading_pair = MarketDataReader([file_path]).trading_pair
+            file_paths_by_trading_pair.setdefault(trading_pair, []).append(file_path)
+        return cls(MarketDataReader(trading_pair_file_paths).iter_messages()
+                   for trading_pair_file_paths in file_paths_by_trading_pair.values())
+
+    @classmethod
+    def from_recording_files(cls,
+                             trading_pair: str,
+                             snapshots_file_path: Optional[Union[str, PathLike]] = None,
+                             diffs_file_path: Optional[Union[str, PathLike]] = None,
+                             trades_file_path: Optional[Union[str, PathLike]] = None) -> "ReplayDataFeed":
+        """
+        Replays the JSON-lines dumps of a trading pair (see `read_order_book_snapshots`, `read_order_book_diffs` and
+        `read_trades`)
+        """
+        message_streams: List[Iterator[OrderBookMessage]] = []
+        if snapshots_file_path is not None:
+            message_streams.append(read_order_book_snapshots(snapshots_file_path, trading_pair))
+        if diffs_file_path is not None:
+            message_streams.append(read_order_book_diffs(diffs_file_path, trading_pair))
+        if trades_file_path is not None:
+            message_streams.append(read_trades(trades_file_path, trading_pair))
+        return cls(message_streams)
+
+    @property
+    def next_timestamp(self) -> float:
+        """
+        Timestamp of the next message, infinity if the feed is exhausted
+        """
+        return self._next_message.timestamp if self._next_message is not None else float("inf")
+
+    @property
+    def exhausted(self) -> bool:
+        return self._next_message is None
+
+    def messages_until(self, timestamp: float) -> Iterator[OrderBookMessage]:
+        """
+        Consumes the messages with a timestamp lower or equal to the given one
+        """
+        while self._next_message is not None and self._next_message.timestamp <= timestamp:
+            message = self._next_message
+            self._next_message = next(self._messages, None)
+            yield message
@@ -0,0 +1,9 @@
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange cimport PaperTradeExchange
+
+
+cdef class ReplayExchange(PaperTradeExchange):
+    cdef:
+        object _data_feed
+        bint _stop_at_end_of_data
+
+    cdef c_apply_message(self, object message)
@@ -0,0 +1,149 @@
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from libc.math cimport INFINITY, isnan
+
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange cimport PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.replay_data_feed import ReplayDataFeed
+from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.network_iterator import NetworkStatus
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    The order books of a replay are only updated by the replay exchange, nothing is fetched from the network
+    """
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def listen_for_subscriptions(self):
+        pass
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker whose order books are set up and updated by the replay exchange. The books are ready from the
+    start, and starting the tracker does not run any network task.
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(data_source=ReplayOrderBookTrackerDataSource(trading_pairs), trading_pairs=trading_pairs)
+        for trading_pair in trading_pairs:
+            self._order_book_initialized_events[trading_pair].set()
+        self._order_books_initialized.set()
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+cdef class ReplayExchange(PaperTradeExchange):
+    """
+    Paper trade exchange whose order books are replayed from recorded order book snapshots, diffs and trades instead
+    of being streamed from an exchange. It is meant to run under a clock in backtest mode: on every tick the messages
+    of the data feed up to the tick timestamp are applied to the order books, the recorded trades matching the
+    simulated limit orders the same way live trades do in paper trade.
+
+    The exchange name is the one of the exchange the data was recorded from, its trade fee schema is used for the fills.
+    The data feed is consumed lazily, so recordings larger than the memory can be replayed. Once the feed is exhausted
+    the exchange stops the clock, unless `stop_at_end_of_data` is False.
+    """
+
+    def __init__(self,
+                 client_config_map: "ClientConfigAdapter",
+                 data_feed: ReplayDataFeed,
+                 trading_pairs: List[str],
+                 exchange_name: str,
+                 stop_at_end_of_data: bool = True):
+        cdef:
+            CompositeOrderBook order_book
+
+        PaperTradeExchange.__init__(
+            self,
+            client_config_map,
+            ReplayOrderBookTracker(trading_pairs),
+            ReplayExchange,
+            exchange_name=exchange_name,
+        )
+        self._data_feed = data_feed
+        self._stop_at_end_of_data = stop_at_end_of_data
+        for trading_pair in trading_pairs:
+            order_book = CompositeOrderBook()
+            order_book.c_add_listener(self.ORDER_BOOK_TRADE_EVENT_TAG, self._order_book_trade_listener)
+            base_asset, quote_asset = self.split_trading_pair(trading_pair)
+            self._trading_pairs[trading_pair] = TradingPair(trading_pair, base_asset, quote_asset)
+            self.order_book_tracker._order_books[trading_pair] = order_book
+        self._paper_trade_market_initialized = True
+
+    @property
+    def data_feed(self) -> ReplayDataFeed:
+        return self._data_feed
+
+    @property
+    def display_name(self) -> str:
+        return f"{self._exchange_name}_Replay"
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
+
+    @staticmethod
+    def convert_from_exchange_trading_pair(exchange_trading_pair: str) -> Optional[str]:
+        return exchange_trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(hb_trading_pair: str) -> str:
+        return hb_trading_pair
+
+    async def check_network(self) -> NetworkStatus:
+        return NetworkStatus.CONNECTED
+
+    cdef c_apply_message(self, object message):
+        cdef:
+            CompositeOrderBook order_book = self.order_book_tracker.order_books[message.trading_pair]
+
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            order_book.apply_numpy_snapshot(message.bids_array, message.asks_array, message.update_id)
+        elif message.type is OrderBookMessageType.DIFF:
+            order_book.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+        elif message.type is OrderBookMessageType.TRADE:
+            # The trade event is what matches the recorded trades against the simulated limit orders
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=message.trading_pair,
+                timestamp=message.timestamp,
+                price=float(message.content["price"]),
+                amount=float(message.content["amount"]),
+                trade_id=message.trade_id,
+                type=TradeType.SELL if message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+            ))
+
+    cdef c_tick(self, double timestamp):
+        if self._stop_at_end_of_data and self._data_feed.exhausted:
+            raise StopIteration
+        for message in self._data_feed.messages_until(timestamp):
+            self.c_apply_message(message)
+        PaperTradeExchange.c_tick(self, timestamp)
+
+    cdef double c_next_event_timestamp(self):
+        cdef:
+            double paper_trade_event_timestamp = PaperTradeExchange.c_next_event_timestamp(self)
+
+        if isnan(paper_trade_event_timestamp):
+            return paper_trade_event_timestamp
+        if self._data_feed.exhausted:
+            # One more tick to stop the clock
+            return INFINITY if not self._stop_at_end_of_data else self._current_timestamp
+        return self._data_feed.next_timestamp
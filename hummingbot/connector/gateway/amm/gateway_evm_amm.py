@@ -29,7 +29,6 @@ from hummingbot.core.event.events import (
 from hummingbot.core.gateway import check_transaction_exceptions
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
@@ -223,10 +222,8 @@ class GatewayEVMAMM(ConnectorBase):
         Updates inflight order statuses from API results
         This is used by the MarketsRecorder class to orchestrate market classes at a higher level.
         """
-        self._order_tracker._in_flight_orders.update({
-            key: GatewayInFlightOrder.from_json(value)
-            for key, value in saved_states.items()
-        })
+        for value in saved_states.values():
+            self._order_tracker.start_tracking_order(GatewayInFlightOrder.from_json(value))
 
     def create_approval_order_id(self, token_symbol: str) -> str:
         return f"approve-{self.connector_name}-{token_symbol}"
@@ -408,7 +405,6 @@ class GatewayEVMAMM(ConnectorBase):
             return Decimal(str(price))
         return None
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -907,6 +903,8 @@ class GatewayEVMAMM(ConnectorBase):
             new_nonce: int = resp_json.get("nonce")
 
         self._nonce = new_nonce
+        # A transaction of the wallet went through, the cached quotes of the network may be stale
+        self._get_gateway_instance().quote_cache.update_nonce(self.chain, self.network, new_nonce)
 
     async def _status_polling_loop(self):
         await self.update_balances(on_interval=False)
@@ -0,0 +1,627 @@
+import heapq
+import logging
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Type
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.logger import HummingbotLogger
+
+# File layout: a file header (magic, format version, trading pair) followed by blocks, each one made of a block header
+# and a payload holding the columns of its records one after the other, optionally compressed.
+FILE_MAGIC = b"HBMD"
+FILE_FORMAT_VERSION = 1
+FILE_EXTENSION = ".hbmd"
+_FILE_HEADER = struct.Struct("<4sHH")
+# block type, codec id, records count, payload size, first timestamp, last timestamp
+_BLOCK_HEADER = struct.Struct("<BBIIdd")
+
+# Blocks of order book levels changes, an amount of 0 removing the level
+ORDER_BOOK_DIFFS_BLOCK = 1
+# Blocks of all the order book levels, the book is replaced by the levels of the block
+ORDER_BOOK_KEYFRAME_BLOCK = 2
+# Blocks of public trades, the side column holding the TradeType value
+TRADES_BLOCK = 3
+
+BID_SIDE = 1
+ASK_SIDE = 2
+
+RECORD_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "<f8"),
+    ("side", "u1"),
+    ("price", "<f8"),
+    ("amount", "<f8"),
+)
+RECORD_DTYPE = np.dtype(list(RECORD_COLUMNS))
+
+
+class BlockCodecBase(ABC):
+    """
+    Compresses the payloads of the blocks of the market data files. The codec of each block is stored in its header,
+    so files written with any codec can be read as long as its library is installed.
+    """
+
+    codec_id: int = 0
+    name: str = ""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        ...
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        ...
+
+
+class NoCompressionBlockCodec(BlockCodecBase):
+    codec_id = 0
+    name = "none"
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+class ZstdBlockCodec(BlockCodecBase):
+    codec_id = 1
+    name = "zstd"
+
+    def __init__(self):
+        import zstandard
+
+        self._compressor = zstandard.ZstdCompressor()
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+class LZ4BlockCodec(BlockCodecBase):
+    codec_id = 2
+    name = "lz4"
+
+    def __init__(self):
+        import lz4.frame
+
+        self._lz4_frame = lz4.frame
+
+    def compress(self, data: bytes) -> bytes:
+        return self._lz4_frame.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._lz4_frame.decompress(data)
+
+
+BLOCK_CODECS: Dict[str, Type[BlockCodecBase]] = {
+    NoCompressionBlockCodec.name: NoCompressionBlockCodec,
+    ZstdBlockCodec.name: ZstdBlockCodec,
+    LZ4BlockCodec.name: LZ4BlockCodec,
+}
+
+
+def get_block_codec(name: str) -> BlockCodecBase:
+    """
+    Creates the codec registered with the given name.
+
+    :param name: one of the keys of `BLOCK_CODECS`
+    :return: the codec instance
+    :raises ValueError: if the name is unknown
+    :raises ImportError: if the compression library of the codec is not installed
+    """
+    if name not in BLOCK_CODECS:
+        raise ValueError(f"Invalid block codec {name}, please choose a value from {list(BLOCK_CODECS.keys())}.")
+    return BLOCK_CODECS[name]()
+
+
+def _block_codec_from_id(codec_id: int, codecs: Dict[int, BlockCodecBase]) -> BlockCodecBase:
+    codec = codecs.get(codec_id)
+    if codec is None:
+        codec_class = next((codec_class for codec_class in BLOCK_CODECS.values() if codec_class.codec_id == codec_id),
+                           None)
+        if codec_class is None:
+            raise ValueError(f"Unknown block codec id {codec_id}.")
+        codec = codecs[codec_id] = codec_class()
+    return codec
+
+
+def encode_records(records: np.ndarray) -> bytes:
+    """
+    Serializes the records column by column, similar values being next to each other compress better
+    """
+    return b"".join(np.ascontiguousarray(records[column]).tobytes() for column, _ in RECORD_COLUMNS)
+
+
+def decode_records(data: bytes, records_count: int) -> np.ndarray:
+    records = np.empty(records_count, dtype=RECORD_DTYPE)
+    offset = 0
+    for column, column_type in RECORD_COLUMNS:
+        column_dtype = np.dtype(column_type)
+        records[column] = np.frombuffer(data, dtype=column_dtype, count=records_count, offset=offset)
+        offset += column_dtype.itemsize * records_count
+    return records
+
+
+def _levels_records(timestamp: float, side: int, levels: np.ndarray) -> np.ndarray:
+    records = np.empty(len(levels), dtype=RECORD_DTYPE)
+    records["timestamp"] = timestamp
+    records["side"] = side
+    records["price"] = levels[:, 0]
+    records["amount"] = levels[:, 1]
+    return records
+
+
+def levels_diff(previous_levels: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """
+    Computes the levels changes turning the previous levels into the new ones.
+
+    :param previous_levels: the [price, amount] rows of the previous levels of a side of the book
+    :param levels: the [price, amount] rows of the new levels of the same side
+    :return: the [price, amount] rows of the new or updated levels, and of the removed levels with a 0 amount
+    """
+    if len(previous_levels) == 0:
+        return levels[:, :2]
+    sorting_indexes = np.argsort(previous_levels[:, 0], kind="stable")
+    previous_prices = previous_levels[sorting_indexes, 0]
+    previous_amounts = previous_levels[sorting_indexes, 1]
+    positions = np.minimum(np.searchsorted(previous_prices, levels[:, 0]), len(previous_prices) - 1)
+    unchanged = (previous_prices[positions] == levels[:, 0]) & (previous_amounts[positions] == levels[:, 1])
+    removed_prices = previous_prices[~np.isin(previous_prices, levels[:, 0])]
+    removed_levels = np.column_stack((removed_prices, np.zeros(len(removed_prices))))
+    return np.concatenate((levels[~unchanged, :2], removed_levels))
+
+
+@dataclass
+class MarketDataBlockHeader:
+    block_type: int
+    codec_id: int
+    records_count: int
+    payload_size: int
+    first_timestamp: float
+    last_timestamp: float
+    payload_offset: int
+
+
+class MarketDataFileWriter:
+    """
+    Writes the market data blocks of a trading pair to a file. The order book records of every file start with a
+    keyframe, so it can be read without the previous files.
+    """
+
+    def __init__(self, file_path: str, trading_pair: str, codec: BlockCodecBase, first_timestamp: float):
+        self._file_path: str = file_path
+        self._codec: BlockCodecBase = codec
+        self._first_timestamp: float = first_timestamp
+        self._file: BinaryIO = open(file_path, "wb")
+        trading_pair_bytes = trading_pair.encode("utf-8")
+        self._file.write(_FILE_HEADER.pack(FILE_MAGIC, FILE_FORMAT_VERSION, len(trading_pair_bytes)))
+        self._file.write(trading_pair_bytes)
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def first_timestamp(self) -> float:
+        return self._first_timestamp
+
+    @property
+    def size(self) -> int:
+        return self._file.tell()
+
+    def write_block(self, block_type: int, records: np.ndarray):
+        if len(records) == 0:
+            return
+        payload = self._codec.compress(encode_records(records))
+        self._file.write(_BLOCK_HEADER.pack(
+            block_type,
+            self._codec.codec_id,
+            len(records),
+            len(payload),
+            float(records["timestamp"][0]),
+            float(records["timestamp"][-1]),
+        ))
+        self._file.write(payload)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class _TradingPairRecording:
+    """
+    Recording state of a trading pair: the pending snapshots and trades, and the book levels last written, from which
+    the diffs of the next snapshot are computed.
+    """
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair: str = trading_pair
+        self.pending_snapshots: List[Tuple[float, np.ndarray, np.ndarray]] = []
+        self.pending_trades: List[Tuple[float, int, float, float]] = []
+        self.bids: np.ndarray = np.empty((0, 2), dtype=np.float64)
+        self.asks: np.ndarray = np.empty((0, 2), dtype=np.float64)
+        self.last_keyframe_timestamp: Optional[float] = None
+        self.file_writer: Optional[MarketDataFileWriter] = None
+        self.file_paths: List[str] = []
+
+
+class MarketDataRecorder:
+    """
+    Records the order books and the public trades of trading pairs to compact binary files, one series of files per
+    trading pair, to be read with `MarketDataReader`.
+
+    The order books are recorded as keyframes (all the levels) every `keyframe_interval` seconds and at the start of
+    each file, and as the levels changes in between. Each record is a fixed width (timestamp, side, price, amount) row,
+    and the records are written by blocks stored column by column, optionally compressed with zstd or lz4.
+
+    `record_order_book` and `record_trade` only queue the data, the diffs computation, the encoding and the writes are
+    done by `flush`, which is called from a background thread once the recorder is started. The files are rotated when
+    they cover `rotation_interval` seconds or reach `max_file_size` bytes.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 directory: str,
+                 exchange: str,
+                 trading_pairs: List[str],
+                 codec: str = NoCompressionBlockCodec.name,
+                 keyframe_interval: float = 60,
+                 rotation_interval: float = 3600,
+                 max_file_size: int = 256 * 1024 * 1024,
+                 flush_interval: float = 1.0):
+        self._directory: str = directory
+        self._exchange: str = exchange
+        self._codec: BlockCodecBase = get_block_codec(codec)
+        self._keyframe_interval: float = keyframe_interval
+        self._rotation_interval: float = rotation_interval
+        self._max_file_size: int = max_file_size
+        self._flush_interval: float = flush_interval
+        self._recordings: Dict[str, _TradingPairRecording] = {
+            trading_pair: _TradingPairRecording(trading_pair) for trading_pair in trading_pairs
+        }
+        self._pending_lock: threading.Lock = threading.Lock()
+        self._flush_lock: threading.Lock = threading.Lock()
+        self._flush_event: threading.Event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stopped: bool = False
+        self._trade_event_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._process_trade_event)
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return list(self._recordings.keys())
+
+    @property
+    def file_paths(self) -> Dict[str, List[str]]:
+        """
+        The files written for each trading pair, in chronological order
+        """
+        return {trading_pair: list(recording.file_paths) for trading_pair, recording in self._recordings.items()}
+
+    def start(self):
+        if self._writer_thread is None:
+            self._writer_stopped = False
+            self._writer_thread = threading.Thread(target=self._writer_loop,
+                                                   name="MarketDataRecorderWriter",
+                                                   daemon=True)
+            self._writer_thread.start()
+
+    def stop(self):
+        if self._writer_thread is not None:
+            self._writer_stopped = True
+            self._flush_event.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+        self.flush()
+        for recording in self._recordings.values():
+            if recording.file_writer is not None:
+                recording.file_writer.close()
+                recording.file_writer = None
+
+    def subscribe_to_order_book(self, order_book: OrderBook):
+        """
+        Records the public trades of the order book
+        """
+        order_book.add_listener(OrderBookEvent.TradeEvent, self._trade_event_forwarder)
+
+    def record_order_book(self,
+                          trading_pair: str,
+                          timestamp: float,
+                          order_book: OrderBook,
+                          depth: Optional[int] = None):
+        bids, asks = order_book.get_snapshot_arrays(depth=depth)
+        self.record_order_book_levels(trading_pair, timestamp, bids, asks)
+
+    def record_order_book_levels(self, trading_pair: str, timestamp: float, bids: np.ndarray, asks: np.ndarray):
+        """
+        Queues a snapshot of the order book of the trading pair.
+
+        :param bids: the bid levels, as rows starting with the price and amount columns
+        :param asks: the ask levels, as rows starting with the price and amount columns
+        """
+        with self._pending_lock:
+            self._recordings[trading_pair].pending_snapshots.append((timestamp, bids, asks))
+
+    def record_trade(self, trade: OrderBookTradeEvent):
+        with self._pending_lock:
+            self._recordings[trade.trading_pair].pending_trades.append(
+                (trade.timestamp, trade.type.value, trade.price, trade.amount)
+            )
+
+    def flush(self):
+        """
+        Writes the queued snapshots and trades to the files
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                pending = [(recording, recording.pending_snapshots, recording.pending_trades)
+                           for recording in self._recordings.values()]
+                for recording in self._recordings.values():
+                    recording.pending_snapshots = []
+                    recording.pending_trades = []
+            for recording, snapshots, trades in pending:
+                self._write_recording(recording, snapshots, trades)
+
+    def _write_recording(self,
+                         recording: _TradingPairRecording,
+                         snapshots: List[Tuple[float, np.ndarray, np.ndarray]],
+                         trades: List[Tuple[float, int, float, float]]):
+        if recording.file_writer is not None and recording.file_writer.size >= self._max_file_size:
+            recording.file_writer.close()
+            recording.file_writer = None
+        if len(trades) > 0:
+            trades_records = np.array(trades, dtype=RECORD_DTYPE)
+            self._file_writer(recording, float(trades_records["timestamp"][0])).write_block(
+                TRADES_BLOCK, trades_records
+            )
+        diffs_records: List[np.ndarray] = []
+        for timestamp, bids, asks in snapshots:
+            bids = np.asarray(bids, dtype=np.float64)[:, :2]
+            asks = np.asarray(asks, dtype=np.float64)[:, :2]
+            if recording.file_writer is not None and self._rotation_due(recording.file_writer, timestamp):
+                self._write_diffs_records(recording.file_writer, diffs_records)
+                diffs_records = []
+            file_writer = self._file_writer(recording, timestamp)
+            if (recording.last_keyframe_timestamp is None
+                    or timestamp - recording.last_keyframe_timestamp >= self._keyframe_interval):
+                self._write_diffs_records(file_writer, diffs_records)
+                diffs_records = []
+                file_writer.write_block(ORDER_BOOK_KEYFRAME_BLOCK, np.concatenate((
+                    _levels_records(timestamp, BID_SIDE, bids), _levels_records(timestamp, ASK_SIDE, asks)
+                )))
+                recording.last_keyframe_timestamp = timestamp
+            else:
+                diffs_records.append(_levels_records(timestamp, BID_SIDE, levels_diff(recording.bids, bids)))
+                diffs_records.append(_levels_records(timestamp, ASK_SIDE, levels_diff(recording.asks, asks)))
+            recording.bids = bids
+            recording.asks = asks
+        if recording.file_writer is not None:
+            self._write_diffs_records(recording.file_writer, diffs_records)
+            recording.file_writer.flush()
+
+    @staticmethod
+    def _write_diffs_records(file_writer: MarketDataFileWriter, diffs_records: List[np.ndarray]):
+        if len(diffs_records) > 0:
+            file_writer.write_block(ORDER_BOOK_DIFFS_BLOCK, np.concatenate(diffs_records))
+
+    def _rotation_due(self, file_writer: MarketDataFileWriter, timestamp: float) -> bool:
+        # The size is checked once per flush, before writing anything
+        return timestamp - file_writer.first_timestamp >= self._rotation_interval
+
+    def _file_writer(self, recording: _TradingPairRecording, timestamp: float) -> MarketDataFileWriter:
+        """
+        Gets the file the records of the timestamp have to be written to, rotating the current file if needed
+        """
+        file_writer = recording.file_writer
+        if file_writer is not None and self._rotation_due(file_writer, timestamp):
+            file_writer.close()
+            file_writer = None
+        if file_writer is None:
+            file_name = (f"{self._exchange}_{recording.trading_pair}_"
+                         f"{time.strftime('%Y%m%d-%H%M%S', time.gmtime(timestamp))}")
+            file_path = os.path.join(self._directory, file_name + FILE_EXTENSION)
+            suffix = 1
+            while os.path.exists(file_path):
+                file_path = os.path.join(self._directory, f"{file_name}_{suffix}{FILE_EXTENSION}")
+                suffix += 1
+            file_writer = recording.file_writer = MarketDataFileWriter(
+                file_path, recording.trading_pair, self._codec, timestamp
+            )
+            recording.file_paths.append(file_path)
+            # The new file has to start with a keyframe to be readable on its own
+            recording.last_keyframe_timestamp = None
+        return file_writer
+
+    def _writer_loop(self):
+        while not self._writer_stopped:
+            self._flush_event.wait(self._flush_interval)
+            self._flush_event.clear()
+            if self._writer_stopped:
+                break
+            try:
+                self.flush()
+            except Exception:
+                self.logger().error("Unexpected error while writing the market data.", exc_info=True)
+
+    def _process_trade_event(self, event_tag: int, order_book: OrderBook, event: OrderBookTradeEvent):
+        if event.trading_pair in self._recordings:
+            self.record_trade(event)
+
+
+class MarketDataReader:
+    """
+    Reads the market data files written by `MarketDataRecorder` for a trading pair. The blocks are located from their
+    headers, so only the blocks needed are decompressed: the order book at a given timestamp is rebuilt from the last
+    keyframe before the timestamp and the diffs after it.
+    """
+
+    def __init__(self, file_paths: List[str]):
+        self._file_paths: List[str] = list(file_paths)
+        self._codecs: Dict[int, BlockCodecBase] = {}
+        self._trading_pair: Optional[str] = None
+        self._blocks: List[Tuple[str, MarketDataBlockHeader]] = []
+        # The files are given in chronological order, so the blocks of each type are in chronological order too
+        for file_path in self._file_paths:
+            self._blocks.extend((file_path, block_header) for block_header in self._read_block_headers(file_path))
+
+    @property
+    def trading_pair(self) -> Optional[str]:
+        return self._trading_pair
+
+    @property
+    def block_headers(self) -> List[MarketDataBlockHeader]:
+        return [block_header for _, block_header in self._blocks]
+
+    def _read_block_headers(self, file_path: str) -> Iterator[MarketDataBlockHeader]:
+        with open(file_path, "rb") as file:
+            magic, version, trading_pair_size = _FILE_HEADER.unpack(file.read(_FILE_HEADER.size))
+            if magic != FILE_MAGIC or version != FILE_FORMAT_VERSION:
+                raise ValueError(f"{file_path} is not a market data file of version {FILE_FORMAT_VERSION}.")
+            self._trading_pair = file.read(trading_pair_size).decode("utf-8")
+            while True:
+                header_data = file.read(_BLOCK_HEADER.size)
+                if len(header_data) < _BLOCK_HEADER.size:
+                    # End of the file, or a block being written
+                    break
+                block_type, codec_id, records_count, payload_size, first_timestamp, last_timestamp = (
+                    _BLOCK_HEADER.unpack(header_data)
+                )
+                payload_offset = file.tell()
+                if os.fstat(file.fileno()).st_size < payload_offset + payload_size:
+                    break
+                file.seek(payload_size, os.SEEK_CUR)
+                yield MarketDataBlockHeader(block_type, codec_id, records_count, payload_size,
+                                            first_timestamp, last_timestamp, payload_offset)
+
+    def _read_records(self, file_path: str, block_header: MarketDataBlockHeader) -> np.ndarray:
+        with open(file_path, "rb") as file:
+            file.seek(block_header.payload_offset)
+            payload = file.read(block_header.payload_size)
+        data = _block_codec_from_id(block_header.codec_id, self._codecs).decompress(payload)
+        return decode_records(data, block_header.records_count)
+
+    def iter_records(self,
+                     block_types: Tuple[int, ...],
+                     start_timestamp: float = float("-inf"),
+                     end_timestamp: float = float("inf")) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Lazily reads the records of the blocks of the given types overlapping the time range.
+
+        :return: an iterator over the block types and the records of the blocks
+        """
+        for file_path, block_header in self._blocks:
+            if (block_header.block_type not in block_types or block_header.last_timestamp < start_timestamp
+                    or block_header.first_timestamp > end_timestamp):
+                continue
+            records = self._read_records(file_path, block_header)
+            mask = (records["timestamp"] >= start_timestamp) & (records["timestamp"] <= end_timestamp)
+            yield block_header.block_type, records[mask]
+
+    def trades(self, start_timestamp: float = float("-inf"), end_timestamp: float = float("inf")) -> np.ndarray:
+        records = [records for _, records in self.iter_records((TRADES_BLOCK,), start_timestamp, end_timestamp)]
+        return np.concatenate(records) if len(records) > 0 else np.empty(0, dtype=RECORD_DTYPE)
+
+    def order_book_at(self, timestamp: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rebuilds the order book as it was at the timestamp.
+
+        :return: the bids (by decreasing price) and asks (by increasing price) as [price, amount] rows
+        """
+        order_book_blocks = [(file_path, block_header) for file_path, block_header in self._blocks
+                             if block_header.block_type != TRADES_BLOCK]
+        keyframe_index = None
+        for index, (_, block_header) in enumerate(order_book_blocks):
+            if block_header.first_timestamp > timestamp:
+                break
+            if block_header.block_type == ORDER_BOOK_KEYFRAME_BLOCK:
+                keyframe_index = index
+        bids: Dict[float, float] = {}
+        asks: Dict[float, float] = {}
+        if keyframe_index is not None:
+            for file_path, block_header in order_book_blocks[keyframe_index:]:
+                if block_header.first_timestamp > timestamp:
+                    break
+                records = self._read_records(file_path, block_header)
+                if block_header.block_type == ORDER_BOOK_KEYFRAME_BLOCK:
+                    bids.clear()
+                    asks.clear()
+                for record_timestamp, side, price, amount in records[records["timestamp"] <= timestamp].tolist():
+                    levels = bids if side == BID_SIDE else asks
+                    if amount > 0:
+                        levels[price] = amount
+                    else:
+                        levels.pop(price, None)
+        return (
+            np.array(sorted(bids.items(), reverse=True), dtype=np.float64).reshape(-1, 2),
+            np.array(sorted(asks.items()), dtype=np.float64).reshape(-1, 2),
+        )
+
+    def iter_messages(self) -> Iterator[OrderBookMessage]:
+        """
+        Lazily converts the records to order book messages in timestamp order: snapshots for the keyframes, diffs for
+        the levels changes and trades, so the recordings can be replayed with `ReplayDataFeed`.
+        """
+        return heapq.merge(self._iter_order_book_messages(), self._iter_trade_messages(),
+                           key=lambda message: message.timestamp)
+
+    def _iter_order_book_messages(self) -> Iterator[OrderBookMessage]:
+        for block_type, records in self.iter_records((ORDER_BOOK_DIFFS_BLOCK, ORDER_BOOK_KEYFRAME_BLOCK)):
+            message_type = (OrderBookMessageType.SNAPSHOT if block_type == ORDER_BOOK_KEYFRAME_BLOCK
+                            else OrderBookMessageType.DIFF)
+            boundaries = np.flatnonzero(np.diff(records["timestamp"])) + 1
+            for group in np.split(records, boundaries):
+                if len(group) == 0:
+                    continue
+                timestamp = float(group["timestamp"][0])
+                bids = group[group["side"] == BID_SIDE]
+                asks = group[group["side"] == ASK_SIDE]
+                yield OrderBookMessage(
+                    message_type=message_type,
+                    content={
+                        "trading_pair": self._trading_pair,
+                        "update_id": int(timestamp * 1e3),
+                        "bids": np.column_stack((bids["price"], bids["amount"])).tolist(),
+                        "asks": np.column_stack((asks["price"], asks["amount"])).tolist(),
+                    },
+                    timestamp=timestamp,
+                )
+
+    def _iter_trade_messages(self) -> Iterator[OrderBookMessage]:
+        trade_number = 0
+        for _, records in self.iter_records((TRADES_BLOCK,)):
+            for timestamp, side, price, amount in records.tolist():
+                yield OrderBookMessage(
+                    message_type=OrderBookMessageType.TRADE,
+                    content={
+                        "trading_pair": self._trading_pair,
+                        "trade_type": float(side),
+                        "trade_id": trade_number,
+                        "update_id": int(timestamp * 1e3),
+                        "price": price,
+                        "amount": amount,
+                    },
+                    timestamp=timestamp,
+                )
+                trade_number += 1
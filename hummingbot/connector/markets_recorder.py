@@ -1,18 +1,21 @@
 import asyncio
+import csv
 import logging
 import os.path
 import threading
 import time
+from concurrent.futures import Future, wait
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
-from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap, MarketsRecorderConfigMap
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.market_data_recorder import MarketDataRecorder
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -71,7 +74,8 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 markets_recorder_config: Optional[MarketsRecorderConfigMap] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -82,6 +86,19 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_recording_task: Optional[asyncio.Task] = None
+        self._market_data_recorders: Dict[str, MarketDataRecorder] = {}
+        self._markets_recorder_config: MarketsRecorderConfigMap = markets_recorder_config or MarketsRecorderConfigMap()
+        # Write-behind mode: the writes are queued by the event handlers and saved in batches by a background thread
+        self._pending_writes: List[Callable[[Session], Any]] = []
+        self._pending_market_states: Dict[str, Dict[str, Any]] = {}
+        self._pending_writes_lock: threading.Lock = threading.Lock()
+        self._flush_lock: threading.RLock = threading.RLock()
+        self._flush_event: threading.Event = threading.Event()
+        self._write_behind_thread: Optional[threading.Thread] = None
+        self._write_behind_stopped: bool = False
+        self._last_write: Optional[Future] = None
+        self._csv_writers: Dict[str, Tuple[TextIO, Any]] = {}
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -129,28 +146,28 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    market_data_records: List[MarketData] = []
+                    for market in self._markets:
+                        exchange = market.display_name
+                        for trading_pair in market.trading_pairs:
+                            mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                            best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                            best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                            order_book = market.get_order_book(trading_pair)
+                            depth = self._market_data_collection_config.market_data_collection_depth + 1
+                            market_data_records.append(MarketData(
+                                timestamp=self.db_timestamp,
+                                exchange=exchange,
+                                trading_pair=trading_pair,
+                                mid_price=mid_price,
+                                best_bid=best_bid,
+                                best_ask=best_ask,
+                                order_book={
+                                    "bid": list(order_book.bid_entries())[:depth],
+                                    "ask": list(order_book.ask_entries())[:depth]}
+                            ))
+                    # The order books are read on the event loop, the records are saved on the database writer thread
+                    await self._sql_manager.run_transaction(lambda session: session.add_all(market_data_records))
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -158,6 +175,52 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _start_market_data_file_recording(self):
+        for market in self._markets:
+            recorder = MarketDataRecorder(directory=data_path(),
+                                          exchange=market.display_name,
+                                          trading_pairs=market.trading_pairs)
+            recorder.start()
+            self._market_data_recorders[market.display_name] = recorder
+        self._market_data_recording_task = self._ev_loop.create_task(self._record_market_data_files())
+
+    async def _record_market_data_files(self):
+        """
+        Records the order books and the public trades of the markets to binary market data files (see
+        `MarketDataRecorder`), which can be replayed with the replay exchange
+        """
+        subscribed_to_trades = False
+        while True:
+            try:
+                if all(ex.ready for ex in self._markets):
+                    timestamp = time.time()
+                    depth = self._market_data_collection_config.market_data_collection_depth
+                    for market in self._markets:
+                        recorder = self._market_data_recorders[market.display_name]
+                        for trading_pair in market.trading_pairs:
+                            order_book = market.get_order_book(trading_pair)
+                            if not subscribed_to_trades:
+                                recorder.subscribe_to_order_book(order_book)
+                            recorder.record_order_book(trading_pair, timestamp, order_book, depth)
+                    subscribed_to_trades = True
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error while recording the market data files.", exc_info=True)
+            finally:
+                await self._sleep(self._market_data_collection_config.market_data_recording_interval)
+
+    def _stop_market_data_file_recording(self):
+        if self._market_data_recording_task is not None:
+            self._market_data_recording_task.cancel()
+            self._market_data_recording_task = None
+        for recorder in self._market_data_recorders.values():
+            try:
+                recorder.stop()
+            except Exception:
+                self.logger().error("Unexpected error while writing the market data files.", exc_info=True)
+        self._market_data_recorders.clear()
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -174,12 +237,24 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind_enabled(self) -> bool:
+        return self._markets_recorder_config.write_behind_enabled
+
+    @property
+    def pending_writes_count(self) -> int:
+        return len(self._pending_writes)
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_config.market_data_collection_enabled:
             self._start_market_data_recording()
+        if self._market_data_collection_config.market_data_recording_enabled:
+            self._start_market_data_file_recording()
+        if self.write_behind_enabled:
+            self._start_write_behind()
 
     def stop(self):
         for market in self._markets:
@@ -187,11 +262,149 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        self._stop_market_data_file_recording()
+        self._stop_write_behind()
+        try:
+            # The records still queued are saved before returning, so nothing is lost when the strategy stops
+            self.flush()
+        finally:
+            self._close_csv_writers()
+
+    def _start_write_behind(self):
+        if self._write_behind_thread is None:
+            self._write_behind_stopped = False
+            self._write_behind_thread = threading.Thread(target=self._write_behind_loop,
+                                                         name="MarketsRecorderWriteBehind",
+                                                         daemon=True)
+            self._write_behind_thread.start()
+
+    def _stop_write_behind(self):
+        if self._write_behind_thread is not None:
+            self._write_behind_stopped = True
+            self._flush_event.set()
+            self._write_behind_thread.join()
+            self._write_behind_thread = None
+
+    def _write_behind_loop(self):
+        while not self._write_behind_stopped:
+            self._flush_event.wait(self._markets_recorder_config.write_behind_flush_interval)
+            self._flush_event.clear()
+            if self._write_behind_stopped:
+                break
+            try:
+                self.flush()
+            except Exception:
+                self.logger().error("Unexpected error while saving the pending records to the database.",
+                                    exc_info=True)
+
+    def _write(self, write_function: Callable[[Session], Any], market: Optional[ConnectorBase] = None):
+        """
+        Executes the write function in a new transaction, followed by the update of the market states if a market
+        is given. In write-behind mode the write function is queued instead, and only the last market states of each
+        market are kept, so they are saved once per batch.
+
+        The write function can return a function to be called once its records are committed, e.g. to export them
+        to a file. It is only called once, and not at all if the records could not be saved.
+
+        :param write_function: function that adds or updates records using the session it receives
+        :param market: the connector whose tracking states have to be saved with the records
+        """
+        if self.write_behind_enabled:
+            with self._pending_writes_lock:
+                self._pending_writes.append(write_function)
+                if market is not None:
+                    self._pending_market_states[market.display_name] = market.tracking_states
+                pending_writes_count = len(self._pending_writes)
+            if pending_writes_count >= self._markets_recorder_config.write_behind_batch_size:
+                self._flush_event.set()
+        else:
+            # The market states are read now, the transaction is executed later on the database writer thread
+            saved_state = market.tracking_states if market is not None else None
+
+            def write_with_market_states(session: Session):
+                on_saved = write_function(session)
+                if market is not None:
+                    self._save_market_state(self._config_file_path, market.display_name, saved_state, session)
+                return on_saved
+
+            # Completed once the records are saved and exported, flush waits for it
+            saved: Future = Future()
+            self._sql_manager.submit_transaction(write_with_market_states).add_done_callback(
+                lambda write: self._did_write(write, saved))
+            self._last_write = saved
+
+    def _did_write(self, write: Future, saved: Future):
+        if write.exception() is not None:
+            self.logger().error("Unexpected error while saving the records to the database.",
+                                exc_info=write.exception())
+        else:
+            self._call_on_saved([write.result()])
+        saved.set_result(None)
+
+    def _call_on_saved(self, on_saved_functions: List[Optional[Callable[[], Any]]]):
+        for on_saved in on_saved_functions:
+            if on_saved is not None:
+                try:
+                    on_saved()
+                except Exception:
+                    self.logger().error("Unexpected error while exporting the saved records.", exc_info=True)
+
+    def flush(self):
+        """
+        Saves all the queued records and market states in a single transaction. If the transaction fails, the records
+        are saved again one transaction at a time, so a failing record does not drop the whole batch. If write-behind
+        mode is disabled, the records are submitted to the database writer when the events are processed, and this
+        waits for them to be saved.
+        """
+        if self._last_write is not None:
+            wait([self._last_write])
+        with self._flush_lock:
+            with self._pending_writes_lock:
+                pending_writes, self._pending_writes = self._pending_writes, []
+                pending_market_states, self._pending_market_states = self._pending_market_states, {}
+            if len(pending_writes) == 0 and len(pending_market_states) == 0:
+                return
+
+            def write_pending_records(session: Session) -> List[Optional[Callable[[], Any]]]:
+                on_saved_functions = [write_function(session) for write_function in pending_writes]
+                for market_name, saved_state in pending_market_states.items():
+                    self._save_market_state(self._config_file_path, market_name, saved_state, session)
+                return on_saved_functions
+
+            try:
+                on_saved_functions = self._sql_manager.execute_transaction(write_pending_records)
+            except Exception:
+                self.logger().warning("Error while saving the pending records to the database, saving them one at "
+                                      "a time.", exc_info=True)
+                on_saved_functions = self._write_one_at_a_time(pending_writes, pending_market_states)
+            # Only the records committed are exported, once each even if the batch was retried
+            self._call_on_saved(on_saved_functions)
+            for csv_file, _ in self._csv_writers.values():
+                csv_file.flush()
+
+    def _write_one_at_a_time(self,
+                             write_functions: List[Callable[[Session], Any]],
+                             market_states: Dict[str, Dict[str, Any]]) -> List[Optional[Callable[[], Any]]]:
+        on_saved_functions = []
+        for write_function in write_functions:
+            try:
+                on_saved_functions.append(self._sql_manager.execute_transaction(write_function))
+            except Exception:
+                self.logger().error("Unexpected error while saving a record to the database, the record is dropped.",
+                                    exc_info=True)
+        for market_name, saved_state in market_states.items():
+            try:
+                self._sql_manager.execute_transaction(
+                    lambda session, market_name=market_name, saved_state=saved_state: self._save_market_state(
+                        self._config_file_path, market_name, saved_state, session))
+            except Exception:
+                self.logger().error(f"Unexpected error while saving the {market_name} market states to the database.",
+                                    exc_info=True)
+        return on_saved_functions
 
     def store_executor(self, executor: Dict):
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                session.add(PositionExecutors(**executor))
+        position_executor: PositionExecutors = PositionExecutors(**executor)
+        self._write(lambda session: session.add(position_executor))
 
     def get_position_executors(self,
                                controller_name: str = None,
@@ -234,17 +447,21 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        self._save_market_state(config_file_path, market.display_name, market.tracking_states, session)
+
+    def _save_market_state(self, config_file_path: str, market_name: str, saved_state: Dict[str, Any],
+                           session: Session):
+        market_states: Optional[MarketState] = self._get_market_states(config_file_path, market_name, session)
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -258,10 +475,14 @@ class MarketsRecorder:
                           config_file_path: str,
                           market: ConnectorBase,
                           session: Session) -> Optional[MarketState]:
+        return self._get_market_states(config_file_path, market.display_name, session)
+
+    @staticmethod
+    def _get_market_states(config_file_path: str, market_name: str, session: Session) -> Optional[MarketState]:
         query: Query = (session
                         .query(MarketState)
                         .filter(MarketState.config_file_path == config_file_path,
-                                MarketState.market == market.display_name))
+                                MarketState.market == market_name))
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
@@ -277,31 +498,32 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+
+        self._write(write, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -316,57 +538,58 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
+                                                                           trade_fill_record.exchange_trade_id,
+                                                                           trade_fill_record.symbol)})
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            self._update_order_record(session, order_id, event_type, timestamp)
+            session.add(order_status)
+            session.add(trade_fill_record)
+            # The row is read as saved in the database while the session is open, and exported once the fill is
+            # committed
+            session.flush()
+            session.refresh(trade_fill_record)
+            csv_row = self._trade_fill_csv_row(trade_fill_record)
+            return lambda: self.append_to_csv(*csv_row)
+
+        self._write(write, market)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -378,26 +601,51 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+
+        self._write(write)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        with open(file_path, newline="") as csv_file:
+            return tuple(next(csv.reader(csv_file), ())) == header
 
-    def append_to_csv(self, trade: TradeFill):
+    def _get_csv_writer(self, csv_path: str, header: tuple):
+        """
+        Returns the append-only writer of the CSV file, opening it the first time. The header of an existing file is
+        only checked then, and the file is renamed if it doesn't match the current one.
+        """
+        if csv_path not in self._csv_writers:
+            if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, header))):
+                move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+            csv_file = open(csv_path, mode="a", newline="")
+            writer = csv.writer(csv_file, lineterminator=os.linesep)
+            if csv_file.tell() == 0:
+                writer.writerow(header)
+            self._csv_writers[csv_path] = (csv_file, writer)
+        return self._csv_writers[csv_path][1]
+
+    def _close_csv_writers(self):
+        for csv_file, _ in self._csv_writers.values():
+            csv_file.close()
+        self._csv_writers.clear()
+
+    def _trade_fill_csv_row(self, trade: TradeFill) -> Tuple[str, Tuple[str, ...], Tuple[Any, ...]]:
+        """
+        :return: the path of the trades CSV file, the field names and the field values of the trade fill
+        """
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -410,15 +658,21 @@ class MarketsRecorder:
             '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
+        return csv_path, field_names, field_data
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+    def append_to_csv(self, csv_path: str, field_names: Tuple[str, ...], field_data: Tuple[Any, ...]):
+        self._get_csv_writer(csv_path, field_names).writerow(field_data)
+        if not self.write_behind_enabled:
+            self._csv_writers[csv_path][0].flush()
 
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+    @staticmethod
+    def _update_order_record(session: Session, order_id: str, event_type: MarketEvent,
+                             timestamp: int) -> Optional[Order]:
+        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        if order_record is not None:
+            order_record.last_status = event_type.name
+            order_record.last_update_timestamp = timestamp
+        return order_record
 
     def _update_order_status(self,
                              event_tag: int,
@@ -436,18 +690,15 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write(session: Session):
+            order_record: Optional[Order] = self._update_order_record(session, order_id, event_type, timestamp)
+            if order_record is not None:
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._write(write, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -483,15 +734,12 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        self._write(lambda session: session.add(rp_update), connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -501,17 +749,14 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        self._write(lambda session: session.add(rp_fees), connector)
 
     @staticmethod
     async def _sleep(delay):
@@ -7,6 +7,7 @@ from hummingbot.connector.utilities.oms_connector import oms_connector_constants
 from hummingbot.connector.utilities.oms_connector.oms_connector_auth import OMSConnectorAuth
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodecBase, get_default_json_codec
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
@@ -39,9 +40,12 @@ class OMSConnectorWSPreProcessor(WSPreProcessorBase):
 
 
 class OMSConnectorWSPostProcessor(WSPostProcessorBase):
+    def __init__(self, json_codec: Optional[JSONCodecBase] = None):
+        self._json_codec = json_codec or get_default_json_codec()
+
     async def post_process(self, response: WSResponse) -> WSResponse:
         if CONSTANTS.MSG_DATA_FIELD in response.data:
-            response.data[CONSTANTS.MSG_DATA_FIELD] = json.loads(response.data[CONSTANTS.MSG_DATA_FIELD])
+            response.data[CONSTANTS.MSG_DATA_FIELD] = self._json_codec.loads(response.data[CONSTANTS.MSG_DATA_FIELD])
         return response
 
 
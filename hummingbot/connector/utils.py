@@ -1,5 +1,4 @@
 import gzip
-import json
 import os
 import platform
 from collections import namedtuple
@@ -11,6 +10,7 @@ from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.utils.tracking_nonce import NonceCreator, get_tracking_nonce
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodecBase, get_default_json_codec
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
@@ -112,11 +112,14 @@ class GZipCompressionWSPostProcessor(WSPostProcessorBase):
     Performs the necessary response processing from both public and private websocket streams.
     """
 
+    def __init__(self, json_codec: Optional[JSONCodecBase] = None):
+        self._json_codec = json_codec or get_default_json_codec()
+
     async def post_process(self, response: WSResponse) -> WSResponse:
         if not isinstance(response.data, bytes):
             # Unlike Market WebSocket, the return data of Account and Order Websocket are not compressed by GZIP.
             return response
         encoded_msg: bytes = gzip.decompress(response.data)
-        msg: Dict[str, Any] = json.loads(encoded_msg.decode("utf-8"))
+        msg: Dict[str, Any] = self._json_codec.loads(encoded_msg)
 
         return WSResponse(data=msg)
@@ -0,0 +1,265 @@
+import asyncio
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+# Lower bound for the time a waiter sleeps before checking the capacity again. It prevents busy looping when the
+# computed time until capacity is freed is rounded down to zero.
+MIN_WAKEUP_DELAY = 0.001
+
+
+class RollingWindowCounter:
+    """
+    Keeps the weights consumed for a single RateLimit during its (safety margin extended) time window.
+    Entries are stored in a deque ordered by timestamp and the total weight is kept as a running sum, so checking the
+    used capacity only costs the expired entries that have to be removed from the head of the window.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.rate_limit: RateLimit = rate_limit
+        self._window: float = rate_limit.time_interval * (1 + safety_margin_pct)
+        self._entries: Deque[Tuple[float, int]] = deque()
+        self._used_capacity: int = 0
+        self.waiters: Deque["RollingWindowWaiter"] = deque()
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    def flush(self, now: float):
+        """
+        Removes the entries that have passed the rate limit period
+        :param now: the current timestamp
+        """
+        entries = self._entries
+        while len(entries) > 0 and now - entries[0][0] > self._window:
+            _, weight = entries.popleft()
+            self._used_capacity -= weight
+
+    def capacity_used(self, now: float) -> int:
+        self.flush(now)
+        return self._used_capacity
+
+    def has_capacity(self, weight: int, now: float) -> bool:
+        """
+        Checks if a task with the given weight can be added to the window.
+        Note: a task with a weight bigger than the limit is only accepted when the window is empty.
+        """
+        used_capacity = self.capacity_used(now)
+        return used_capacity + weight <= self.rate_limit.limit or used_capacity == 0
+
+    def time_until_capacity(self, weight: int, now: float) -> float:
+        """
+        Calculates the time until enough capacity is freed to register a task with the given weight
+        :param weight: the weight of the task to register
+        :param now: the current timestamp
+        :return: the number of seconds to wait (0 if the task can be registered right away)
+        """
+        if self.has_capacity(weight=weight, now=now):
+            return 0.0
+        required_release = self._used_capacity + weight - self.rate_limit.limit
+        released = 0
+        expiration_timestamp = now
+        for timestamp, entry_weight in self._entries:
+            released += entry_weight
+            expiration_timestamp = timestamp + self._window
+            if released >= required_release:
+                break
+        return max(expiration_timestamp - now, 0.0)
+
+    def register(self, timestamp: float, weight: int):
+        self._entries.append((timestamp, weight))
+        self._used_capacity += weight
+
+
+class RollingWindowWaiter:
+    """
+    Represents a task waiting for capacity in one or more RollingWindowCounter queues.
+    """
+
+    def __init__(self, future: asyncio.Future):
+        self.future: asyncio.Future = future
+
+    def wake_up(self):
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class AsyncRollingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that checks for rate limit and waits for the capacity to be freed.
+    Instead of polling, waiters are queued (FIFO) in the counters of each of the involved rate limits. The task at the
+    head of all its queues sleeps exactly until the required capacity is released, and wakes up the next task in the
+    queues once it has registered its weights.
+    """
+
+    def __init__(self,
+                 counters: List[Tuple[RollingWindowCounter, int]],
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 lock: asyncio.Lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 ):
+        """
+        :param counters: List of rolling window counters with the weight this API request consumes in each of them
+        :param rate_limit: The RateLimit associated with this API Request
+        :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
+        :param lock: A shared asyncio.Lock (kept for compatibility with AsyncRequestContextBase)
+        :param safety_margin_pct: Percentage of the time interval added as safety margin
+        :param retry_interval: Not used, waiters are woken up when capacity is available
+        """
+        super().__init__(
+            task_logs=[],
+            rate_limit=rate_limit,
+            related_limits=related_limits,
+            lock=lock,
+            safety_margin_pct=safety_margin_pct,
+            retry_interval=retry_interval,
+        )
+        self._counters: List[Tuple[RollingWindowCounter, int]] = counters
+
+    def flush(self):
+        now = self._time()
+        for counter, _ in self._counters:
+            counter.flush(now)
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if an additional task is within the defined RateLimit(s). Logs a warning message if the limit is about
+        to be reached.
+        :return: True if it is within capacity to add a new task
+        """
+        now = self._time()
+        for counter, weight in self._counters:
+            if not counter.has_capacity(weight=weight, now=now):
+                self._notify_limit_reached(counter=counter, now=now)
+                return False
+        return True
+
+    def time_until_capacity(self) -> float:
+        """
+        :return: the number of seconds until all the rate limits have capacity for the new task
+        """
+        now = self._time()
+        return max([counter.time_until_capacity(weight=weight, now=now) for counter, weight in self._counters],
+                   default=0.0)
+
+    async def acquire(self):
+        if len(self._counters) == 0:
+            return
+        if not any(len(counter.waiters) > 0 for counter, _ in self._counters) and self.within_capacity():
+            self._register()
+            return
+
+        loop = asyncio.get_event_loop()
+        waiter = RollingWindowWaiter(future=loop.create_future())
+        for counter, _ in self._counters:
+            if waiter not in counter.waiters:
+                counter.waiters.append(waiter)
+        try:
+            while True:
+                timer_handle = None
+                if all(counter.waiters[0] is waiter for counter, _ in self._counters):
+                    if self.within_capacity():
+                        self._register()
+                        break
+                    delay = max(self.time_until_capacity(), MIN_WAKEUP_DELAY)
+                    timer_handle = loop.call_later(delay, waiter.wake_up)
+                try:
+                    await waiter.future
+                finally:
+                    if timer_handle is not None:
+                        timer_handle.cancel()
+                waiter.future = loop.create_future()
+        finally:
+            self._remove_waiter(waiter)
+
+    def _register(self):
+        now = self._time()
+        for counter, weight in self._counters:
+            counter.register(timestamp=now, weight=weight)
+
+    def _remove_waiter(self, waiter: RollingWindowWaiter):
+        for counter, _ in self._counters:
+            if waiter in counter.waiters:
+                counter.waiters.remove(waiter)
+            if len(counter.waiters) > 0:
+                counter.waiters[0].wake_up()
+
+    def _notify_limit_reached(self, counter: RollingWindowCounter, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            rate_limit = counter.rate_limit
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {counter.capacity_used(now)} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            AsyncRequestContextBase._last_max_cap_warning_ts = now
+
+    def _time(self):
+        return time.time()
+
+
+class AsyncRollingWindowThrottler(AsyncThrottlerBase):
+    """
+    Alternative to AsyncThrottler with the same `execute_task(limit_id)` and linked limits semantics.
+    Instead of scanning a shared list of task logs on every request, it keeps a rolling window counter per limit_id
+    (a deque of timestamps and weights with a running sum). Tasks waiting for capacity are woken up in FIFO order
+    when the capacity they need is released, instead of checking the limits every `retry_interval`.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
+                 limits_share_percentage: Optional[Decimal] = None
+                 ):
+        # The counters have to exist before the parent constructor calls set_rate_limits
+        self._counters: Dict[str, RollingWindowCounter] = {}
+        self._safety_margin_pct: float = safety_margin_pct
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage,
+        )
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        self._counters = {
+            limit.limit_id: RollingWindowCounter(rate_limit=limit, safety_margin_pct=self._safety_margin_pct)
+            for limit in self._rate_limits
+        }
+
+    def get_counter(self, limit_id: str) -> Optional[RollingWindowCounter]:
+        return self._counters.get(limit_id)
+
+    def execute_task(self, limit_id: str) -> AsyncRollingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        counters = []
+        if rate_limit is not None:
+            counters.append((self._counters[rate_limit.limit_id], rate_limit.weight))
+            counters.extend((self._counters[limit.limit_id], weight) for limit, weight in related_rate_limits)
+        return AsyncRollingWindowRequestContext(
+            counters=counters,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+        )
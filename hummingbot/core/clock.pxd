@@ -10,3 +10,16 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _tick_profiling_enabled
+        double _slow_tick_warning_threshold
+        object _tick_stats
+        dict _iterator_names
+        dict _tick_intervals
+        dict _last_tick_periods
+        bint _fast_forward
+        dict _next_event_ticks
+
+    cdef c_profiled_tick(self, object iterator)
+    cdef bint c_is_tick_due(self, object iterator)
+    cdef bint c_fast_forward(self, double timestamp) except? False
+    cdef bint c_is_backtest_tick_due(self, object iterator)
@@ -3,11 +3,15 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import List, Optional
+
+from libc.math cimport ceil, isfinite, isinf, isnan
+from libc.stdint cimport INT64_MAX, int64_t
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_tick_stats import ClockTickStats
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -21,12 +25,24 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 tick_profiling_enabled: bool = False,
+                 slow_tick_warning_threshold: Optional[float] = None,
+                 fast_forward: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param tick_profiling_enabled: if True, the tick durations of the child iterators are measured
+        :param slow_tick_warning_threshold: (tick profiling only) duration in seconds of an iterator tick above which a
+        warning is logged. Defaults to the tick size.
+        :param fast_forward: (back testing mode only) if True, the clock jumps directly to the next tick needed by an
+        iterator instead of ticking every tick size (see TimeIterator.c_next_event_timestamp)
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +52,13 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._tick_stats = ClockTickStats()
+        self._iterator_names = {}
+        self._tick_intervals = {}
+        self._last_tick_periods = {}
+        self._fast_forward = fast_forward
+        self._next_event_ticks = {}
+        self.enable_tick_profiling(tick_profiling_enabled, slow_tick_warning_threshold)
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +80,43 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def fast_forward(self) -> bool:
+        return self._fast_forward
+
+    @fast_forward.setter
+    def fast_forward(self, value: bool):
+        self._fast_forward = value
+
+    @property
+    def tick_profiling_enabled(self) -> bool:
+        return self._tick_profiling_enabled
+
+    @property
+    def slow_tick_warning_threshold(self) -> float:
+        return self._slow_tick_warning_threshold
+
+    @property
+    def tick_stats(self) -> ClockTickStats:
+        return self._tick_stats
+
+    def enable_tick_profiling(self, enabled: bool = True, slow_tick_warning_threshold: Optional[float] = None):
+        """
+        Enables or disables the measurement of the tick duration of each child iterator. When disabled the ticks run
+        without any instrumentation.
+
+        :param enabled: whether the ticks are profiled
+        :param slow_tick_warning_threshold: duration in seconds of an iterator tick above which a warning is logged,
+        defaults to the tick size
+        """
+        self._tick_profiling_enabled = enabled
+        self._slow_tick_warning_threshold = (
+            self._tick_size if slow_tick_warning_threshold is None else slow_tick_warning_threshold
+        )
+
+    def reset_tick_stats(self):
+        self._tick_stats = ClockTickStats()
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -69,7 +129,13 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self, iterator: TimeIterator, tick_interval: Optional[float] = None):
+        """
+        :param iterator: the time iterator to tick
+        :param tick_interval: time interval between the ticks of the iterator, every clock tick if None
+        """
+        if tick_interval is not None:
+            self.set_tick_interval(iterator, tick_interval)
         if self._current_context is not None:
             self._current_context.append(iterator)
         if self._started:
@@ -81,6 +147,129 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._tick_intervals.pop(iterator, None)
+        self._last_tick_periods.pop(iterator, None)
+
+    def set_tick_interval(self, iterator: TimeIterator, tick_interval: Optional[float]):
+        """
+        Sets the time interval between the ticks of an iterator, rounded to a multiple of the tick size. The iterator
+        is ticked on its first clock tick, then on the clock ticks that are multiples of the interval (or on the first
+        clock tick after it if that one was skipped). Iterators ticking on the same clock tick are always ticked in the
+        order they were added to the clock.
+
+        :param iterator: the time iterator
+        :param tick_interval: time interval in seconds, at least the tick size. None to tick on every clock tick
+        """
+        cdef int64_t ticks_per_interval
+
+        if tick_interval is not None and tick_interval < self._tick_size:
+            raise ValueError(f"The tick interval ({tick_interval}) can't be smaller than the tick size "
+                             f"({self._tick_size}).")
+        ticks_per_interval = 1 if tick_interval is None else round(tick_interval / self._tick_size)
+        self._last_tick_periods.pop(iterator, None)
+        if ticks_per_interval == 1:
+            self._tick_intervals.pop(iterator, None)
+        else:
+            self._tick_intervals[iterator] = ticks_per_interval
+
+    def get_tick_interval(self, iterator: TimeIterator) -> float:
+        return self._tick_intervals.get(iterator, 1) * self._tick_size
+
+    cdef bint c_is_tick_due(self, object iterator):
+        cdef:
+            object ticks_per_interval = self._tick_intervals.get(iterator)
+            int64_t tick_period
+
+        if ticks_per_interval is None:
+            return True
+        tick_period = <int64_t>round(self._current_tick / self._tick_size) // <int64_t>ticks_per_interval
+        if self._last_tick_periods.get(iterator) == tick_period:
+            return False
+        self._last_tick_periods[iterator] = tick_period
+        return True
+
+    cdef bint c_fast_forward(self, double timestamp) except? False:
+        """
+        Moves the clock to the earliest tick needed by an iterator: the next tick for the iterators ticked every tick
+        size, the start of the next interval period for the iterators with a tick interval, and the tick of the next
+        event for the iterators declaring their events. The clock never moves past the first tick at or after the
+        timestamp.
+
+        :return: False if no iterator needs any more ticks and the timestamp is not finite, True otherwise
+        """
+        cdef:
+            TimeIterator child_iterator
+            double event_timestamp
+            double start_time = self._start_time
+            double tick_size = self._tick_size
+            int64_t start_tick = <int64_t>round(start_time / tick_size)
+            int64_t current_tick = <int64_t>round(self._current_tick / tick_size)
+            int64_t next_tick = INT64_MAX
+            int64_t candidate_tick
+            object ticks_per_interval
+
+        self._next_event_ticks.clear()
+        for ci in self._child_iterators:
+            child_iterator = ci
+            event_timestamp = child_iterator.c_next_event_timestamp()
+            if isnan(event_timestamp):
+                ticks_per_interval = self._tick_intervals.get(ci)
+                if ticks_per_interval is None or ci not in self._last_tick_periods:
+                    candidate_tick = current_tick + 1
+                else:
+                    candidate_tick = (current_tick // <int64_t>ticks_per_interval + 1) * <int64_t>ticks_per_interval
+            elif isinf(event_timestamp):
+                self._next_event_ticks[ci] = INT64_MAX
+                continue
+            else:
+                candidate_tick = start_tick + <int64_t>ceil((event_timestamp - start_time) / tick_size - 1e-9)
+                self._next_event_ticks[ci] = candidate_tick
+            next_tick = min(next_tick, max(candidate_tick, current_tick + 1))
+            if next_tick == current_tick + 1:
+                break
+
+        if isfinite(timestamp):
+            next_tick = min(next_tick, start_tick + <int64_t>ceil((timestamp - start_time) / tick_size - 1e-9))
+        elif next_tick == INT64_MAX:
+            return False
+        self._current_tick = start_time + (next_tick - start_tick) * tick_size
+        return True
+
+    cdef bint c_is_backtest_tick_due(self, object iterator):
+        cdef:
+            object event_tick
+
+        if self._fast_forward:
+            event_tick = self._next_event_ticks.get(iterator)
+            if event_tick is not None:
+                return <int64_t>event_tick <= <int64_t>round(self._current_tick / self._tick_size)
+        return len(self._tick_intervals) == 0 or self.c_is_tick_due(iterator)
+
+    cdef c_profiled_tick(self, object iterator):
+        cdef:
+            TimeIterator child_iterator = iterator
+            double start = time.perf_counter()
+            double duration
+            bint is_slow
+
+        try:
+            child_iterator.c_tick(self._current_tick)
+        finally:
+            duration = time.perf_counter() - start
+            is_slow = duration > self._slow_tick_warning_threshold
+            iterator_name = self._iterator_names.get(iterator)
+            if iterator_name is None:
+                iterator_name = self._iterator_names[iterator] = self._iterator_display_name(iterator)
+            self._tick_stats.record_iterator_tick(iterator_name, duration, is_slow)
+            if is_slow:
+                self.logger().warning(f"Slow clock tick: {iterator_name} took {duration * 1e3:.1f} ms "
+                                      f"(tick size {self._tick_size * 1e3:.0f} ms).")
+
+    @staticmethod
+    def _iterator_display_name(iterator: TimeIterator) -> str:
+        name = getattr(iterator, "name", None)
+        class_name = type(iterator).__name__
+        return f"{class_name} ({name})" if isinstance(name, str) and name != class_name else class_name
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +279,8 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+            int skipped_ticks
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -109,26 +300,41 @@ cdef class Clock:
 
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                if self._tick_profiling_enabled:
+                    # The ticks between the previous one and the next one are skipped if the previous tick was late
+                    skipped_ticks = <int>round((next_tick_time - self._current_tick) / self._tick_size) - 1
+                    if skipped_ticks > 0:
+                        self._tick_stats.record_skipped_ticks(skipped_ticks)
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
+                tick_start = time.perf_counter() if self._tick_profiling_enabled else 0
                 for ci in self._current_context:
                     child_iterator = ci
+                    if len(self._tick_intervals) > 0 and not self.c_is_tick_due(child_iterator):
+                        continue
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        if self._tick_profiling_enabled:
+                            self.c_profiled_tick(child_iterator)
+                        else:
+                            child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                if self._tick_profiling_enabled:
+                    self._tick_stats.record_tick(time.perf_counter() - tick_start, self._tick_size)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double tick_start
 
         if not self._started:
             for ci in self._child_iterators:
@@ -138,15 +344,30 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
+                if not self._fast_forward:
+                    self._current_tick += self._tick_size
+                elif not self.c_fast_forward(timestamp):
+                    return
+                tick_start = time.perf_counter() if self._tick_profiling_enabled else 0
                 for ci in self._child_iterators:
                     child_iterator = ci
+                    if not self.c_is_backtest_tick_due(child_iterator):
+                        if self._fast_forward and ci in self._next_event_ticks:
+                            # Not ticked until its next event, but orders can still be placed on the iterator (e.g.
+                            # an idle exchange), so its time keeps following the clock
+                            child_iterator._current_timestamp = self._current_tick
+                        continue
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        if self._tick_profiling_enabled:
+                            self.c_profiled_tick(child_iterator)
+                        else:
+                            child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         raise
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                if self._tick_profiling_enabled:
+                    self._tick_stats.record_tick(time.perf_counter() - tick_start, self._tick_size)
         except StopIteration:
             return
         finally:
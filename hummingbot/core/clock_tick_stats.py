@@ -0,0 +1,121 @@
+import bisect
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+
+# Upper bounds (in seconds) of the tick duration histogram buckets, the last bucket collects the longer ticks
+TICK_DURATION_BUCKETS: Tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+def _bucket_label(upper_bound: float) -> str:
+    return f"<{upper_bound * 1e3:g}ms"
+
+
+@dataclass
+class TickDurationHistogram:
+    """
+    Distribution of the tick durations of a time iterator
+    """
+    bucket_counts: List[int] = field(default_factory=lambda: [0] * (len(TICK_DURATION_BUCKETS) + 1))
+    ticks: int = 0
+    total_duration: float = 0
+    max_duration: float = 0
+    slow_ticks: int = 0
+
+    @property
+    def average_duration(self) -> float:
+        return self.total_duration / self.ticks if self.ticks > 0 else 0
+
+    def record(self, duration: float, is_slow: bool = False):
+        self.bucket_counts[bisect.bisect_left(TICK_DURATION_BUCKETS, duration)] += 1
+        self.ticks += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+        if is_slow:
+            self.slow_ticks += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [_bucket_label(upper_bound) for upper_bound in TICK_DURATION_BUCKETS]
+        labels.append(f">={TICK_DURATION_BUCKETS[-1] * 1e3:g}ms")
+        return {
+            "ticks": self.ticks,
+            "average_duration": self.average_duration,
+            "max_duration": self.max_duration,
+            "slow_ticks": self.slow_ticks,
+            "histogram": dict(zip(labels, self.bucket_counts)),
+        }
+
+
+class ClockTickStats:
+    """
+    Tick profiling information collected by the clock: the tick duration histogram of each time iterator, and the
+    number of ticks that took longer than the tick size (late) or were not run because of a late tick (skipped).
+    """
+
+    def __init__(self):
+        self._iterators_stats: Dict[str, TickDurationHistogram] = {}
+        self._ticks_stats: TickDurationHistogram = TickDurationHistogram()
+        self._late_ticks: int = 0
+        self._skipped_ticks: int = 0
+
+    @property
+    def iterators_stats(self) -> Dict[str, TickDurationHistogram]:
+        return self._iterators_stats
+
+    @property
+    def ticks_stats(self) -> TickDurationHistogram:
+        """
+        Durations of the whole ticks, all the iterators included
+        """
+        return self._ticks_stats
+
+    @property
+    def late_ticks(self) -> int:
+        return self._late_ticks
+
+    @property
+    def skipped_ticks(self) -> int:
+        return self._skipped_ticks
+
+    def record_iterator_tick(self, iterator_name: str, duration: float, is_slow: bool = False):
+        iterator_stats = self._iterators_stats.get(iterator_name)
+        if iterator_stats is None:
+            iterator_stats = self._iterators_stats[iterator_name] = TickDurationHistogram()
+        iterator_stats.record(duration, is_slow)
+
+    def record_tick(self, duration: float, tick_size: float):
+        is_late = duration > tick_size
+        self._ticks_stats.record(duration, is_late)
+        if is_late:
+            self._late_ticks += 1
+
+    def record_skipped_ticks(self, skipped_ticks: int):
+        self._skipped_ticks += skipped_ticks
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ticks": self._ticks_stats.to_dict(),
+            "late_ticks": self._late_ticks,
+            "skipped_ticks": self._skipped_ticks,
+            "iterators": {name: stats.to_dict() for name, stats in self._iterators_stats.items()},
+        }
+
+    def to_data_frame(self) -> pd.DataFrame:
+        columns = ["Iterator", "Ticks", "Avg (ms)", "Max (ms)", "Slow"]
+        data = [
+            [name, stats.ticks, stats.average_duration * 1e3, stats.max_duration * 1e3, stats.slow_ticks]
+            for name, stats in sorted(self._iterators_stats.items(), key=lambda item: -item[1].total_duration)
+        ]
+        return pd.DataFrame(data=data, columns=columns)
+
+    def format_status(self) -> str:
+        lines = [
+            "  Clock ticks:",
+            f"    Ticks: {self._ticks_stats.ticks}   Avg: {self._ticks_stats.average_duration * 1e3:.3f} ms   "
+            f"Max: {self._ticks_stats.max_duration * 1e3:.3f} ms   Late: {self._late_ticks}   "
+            f"Skipped: {self._skipped_ticks}",
+        ]
+        if len(self._iterators_stats) > 0:
+            lines.extend(["    " + line for line in self.to_data_frame().to_string(index=False).split("\n")])
+        return "\n".join(lines)
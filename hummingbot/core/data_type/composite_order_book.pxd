@@ -1,8 +1,12 @@
 # distutils: language=c++
 from hummingbot.core.data_type.order_book cimport OrderBook
+cimport numpy as np
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
+    cdef c_update_top_of_book_version(self, double previous_best_bid, double previous_best_ask)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef c_rebuild_depth_index(self, bint is_buy)
+    cdef np.ndarray c_snapshot_array(self, bint is_buy, Py_ssize_t depth, double price_bucket)
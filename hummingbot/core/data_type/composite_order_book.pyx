@@ -3,10 +3,13 @@
 
 from typing import Iterator
 
+import numpy as np
+
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from libcpp.set cimport set
 from libcpp.vector cimport vector
+from libc.math cimport ceil, floor
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -28,6 +31,8 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._version += 1
+        self._top_of_book_version += 1
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +76,16 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self._version += 1
+        self._top_of_book_version += 1
+
+    cdef c_update_top_of_book_version(self, double previous_best_bid, double previous_best_ask):
+        # The traded entries hide the levels they consumed, so while there are any, the composite best prices can move
+        # with any change of the book
+        if self._traded_order_book._bid_book.size() > 0 or self._traded_order_book._ask_book.size() > 0:
+            self._top_of_book_version += 1
+        else:
+            OrderBook.c_update_top_of_book_version(self, previous_best_bid, previous_best_ask)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -175,6 +190,49 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef c_rebuild_depth_index(self, bint is_buy):
+        cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+            vector[double] *cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+            double base_volume = 0
+            double quote_volume = 0
+
+        deref(prices).clear()
+        deref(cumulative_base).clear()
+        deref(cumulative_quote).clear()
+
+        # The index is built from the composite entries, the original entries minus the traded amounts
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            base_volume += order_book_row.amount
+            quote_volume += order_book_row.amount * order_book_row.price
+            deref(prices).push_back(order_book_row.price)
+            deref(cumulative_base).push_back(base_volume)
+            deref(cumulative_quote).push_back(quote_volume)
+
+    cdef np.ndarray c_snapshot_array(self, bint is_buy, Py_ssize_t depth, double price_bucket):
+        cdef:
+            list levels = []
+            double price
+            double buckets_count
+
+        # The snapshot is built from the composite entries, the original entries minus the traded amounts
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            price = order_book_row.price
+            if price_bucket > 0:
+                buckets_count = price / price_bucket
+                if abs(buckets_count - round(buckets_count)) >= 1e-9:
+                    price = (ceil(buckets_count) if is_buy else floor(buckets_count)) * price_bucket
+                if len(levels) > 0 and levels[-1][0] == price:
+                    levels[-1][1] += order_book_row.amount
+                    levels[-1][2] = max(levels[-1][2], order_book_row.update_id)
+                    continue
+            if len(levels) == depth:
+                break
+            levels.append([price, order_book_row.amount, order_book_row.update_id])
+
+        return np.array(levels, dtype=np.float64).reshape(len(levels), 3)
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -20,17 +20,36 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef int64_t _version
+    cdef int64_t _top_of_book_version
+    cdef bint _depth_index_enabled
+    cdef vector[double] _bid_depth_prices
+    cdef vector[double] _bid_depth_base
+    cdef vector[double] _bid_depth_quote
+    cdef vector[double] _ask_depth_prices
+    cdef vector[double] _ask_depth_base
+    cdef vector[double] _ask_depth_quote
+    cdef int64_t _bid_depth_version
+    cdef int64_t _ask_depth_version
+    cdef dict _query_cache
+    cdef int64_t _query_cache_version
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_update_top_of_book_version(self, double previous_best_bid, double previous_best_ask)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=*)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=*)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef c_rebuild_depth_index(self, bint is_buy)
+    cdef np.ndarray c_snapshot_array(self, bint is_buy, Py_ssize_t depth, double price_bucket)
+    cdef OrderBookQueryResult c_query_depth_index(self, int query_type, bint is_buy, double value)
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
@@ -31,10 +31,109 @@ from hummingbot.core.event.events import (
 )
 
 cimport numpy as np
+from libc.math cimport ceil, floor, isnan
 
 ob_logger = None
 NaN = float("nan")
 
+# Maximum number of memoized query results for a single version of the book
+QUERY_CACHE_MAX_SIZE = 1000
+
+
+# The queries answered with the depth index
+cdef enum:
+    PRICE_FOR_VOLUME = 0
+    VWAP_FOR_VOLUME = 1
+    PRICE_FOR_QUOTE_VOLUME = 2
+    QUOTE_VOLUME_FOR_BASE_AMOUNT = 3
+    VOLUME_FOR_PRICE = 4
+    QUOTE_VOLUME_FOR_PRICE = 5
+
+
+cdef int64_t c_fill_entries(np.ndarray[np.float64_t, ndim=2] array, vector[OrderBookEntry] &entries):
+    """
+    Appends the [price, amount, update_id] rows of the array to the entries vector.
+
+    :return: the largest update id of the rows (0 if there are no rows)
+    """
+    cdef:
+        Py_ssize_t i
+        Py_ssize_t rows_count = array.shape[0]
+        int64_t row_update_id
+        int64_t last_update_id = 0
+
+    entries.reserve(entries.size() + rows_count)
+    for i in range(rows_count):
+        row_update_id = <int64_t>array[i, 2]
+        entries.push_back(OrderBookEntry(array[i, 0], array[i, 1], row_update_id))
+        if row_update_id > last_update_id:
+            last_update_id = row_update_id
+    return last_update_id
+
+
+cdef inline void c_append_depth_level(vector[double] &prices,
+                                      vector[double] &cumulative_base,
+                                      vector[double] &cumulative_quote,
+                                      double price,
+                                      double amount):
+    cdef:
+        double previous_base = cumulative_base.back() if cumulative_base.size() > 0 else 0
+        double previous_quote = cumulative_quote.back() if cumulative_quote.size() > 0 else 0
+    prices.push_back(price)
+    cumulative_base.push_back(previous_base + amount)
+    cumulative_quote.push_back(previous_quote + amount * price)
+
+
+cdef inline bint c_same_price(double price, double other_price):
+    # NaN is the price of an empty side of the book
+    return price == other_price or (isnan(price) and isnan(other_price))
+
+
+cdef inline double c_bucket_price(double price, double price_bucket, bint is_buy):
+    """
+    :return: the price of the bucket containing the price, rounded away from the mid price (down for bids, up for asks)
+    """
+    cdef:
+        double buckets_count = price / price_bucket
+    # Avoid floating point errors moving exact multiples of the bucket size to the next bucket
+    if abs(buckets_count - round(buckets_count)) < 1e-9:
+        return price
+    return (ceil(buckets_count) if is_buy else floor(buckets_count)) * price_bucket
+
+
+cdef inline Py_ssize_t c_first_level_reaching(vector[double] &cumulative, double target):
+    """
+    :return: the index of the first level whose cumulative volume reaches the target (the number of levels if none)
+    """
+    cdef:
+        Py_ssize_t low = 0
+        Py_ssize_t high = cumulative.size()
+        Py_ssize_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if cumulative[middle] >= target:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef inline Py_ssize_t c_levels_count_up_to_price(vector[double] &prices, double price, bint is_buy):
+    """
+    :return: the number of levels from the top of the book with a price not worse than the given one
+    """
+    cdef:
+        Py_ssize_t low = 0
+        Py_ssize_t high = prices.size()
+        Py_ssize_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if (prices[middle] > price) if is_buy else (prices[middle] < price):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
@@ -55,6 +154,13 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._version = 0
+        self._top_of_book_version = 0
+        self._depth_index_enabled = False
+        self._bid_depth_version = -1
+        self._ask_depth_version = -1
+        self._query_cache = {}
+        self._query_cache_version = -1
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,6 +171,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -95,6 +203,8 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._version += 1
+        self.c_update_top_of_book_version(previous_best_bid, previous_best_ask)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -104,6 +214,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
@@ -135,6 +247,12 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
+        self.c_update_top_of_book_version(previous_best_bid, previous_best_ask)
+
+    cdef c_update_top_of_book_version(self, double previous_best_bid, double previous_best_ask):
+        if not (c_same_price(previous_best_bid, self._best_bid) and c_same_price(previous_best_ask, self._best_ask)):
+            self._top_of_book_version += 1
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -161,6 +279,36 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def version(self) -> int:
+        """
+        Counter increased every time the book changes
+        """
+        return self._version
+
+    @property
+    def top_of_book_version(self) -> int:
+        """
+        Counter increased every time the best bid or best ask price changes. Changes deeper in the book, or of the
+        amounts at the best prices, do not increase it.
+        """
+        return self._top_of_book_version
+
+    @property
+    def depth_index_enabled(self) -> bool:
+        return self._depth_index_enabled
+
+    def enable_depth_index(self, enabled: bool = True):
+        """
+        Enables the depth index, the cumulative base and quote volume of each price level, rebuilt lazily when the book
+        changes. The volume and price queries become binary searches on the index, and their results are memoized until
+        the next change of the book (the same result instance is returned for repeated identical queries).
+        """
+        self._depth_index_enabled = enabled
+        self._bid_depth_version = -1
+        self._ask_depth_version = -1
+        self._query_cache.clear()
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -171,12 +319,82 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        return self.get_snapshot()
+
+    def get_snapshot(self,
+                     depth: Optional[int] = None,
+                     price_bucket: Optional[float] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        DataFrame version of get_snapshot_arrays, with the OrderBookRow fields as columns
+        """
+        bids_array, asks_array = self.get_snapshot_arrays(depth=depth, price_bucket=price_bucket)
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def get_snapshot_arrays(self,
+                            depth: Optional[int] = None,
+                            price_bucket: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top levels of the order book as (n, 3) float64 arrays of price, amount and update id, ordered from the top of
+        the book (descending prices for the bids, ascending for the asks)
+
+        :param depth: maximum number of levels per side, the whole book if None
+        :param price_bucket: if set, the levels are aggregated in buckets of this price size, bids rounded down and
+        asks rounded up. The amounts in a bucket are added, and the depth is then the number of buckets
+        :return: bids array, asks array
+        """
+        if depth is not None and depth < 0:
+            raise ValueError(f"The snapshot depth must be positive ({depth}).")
+        if price_bucket is not None and price_bucket <= 0:
+            raise ValueError(f"The snapshot price bucket must be positive ({price_bucket}).")
+        return (
+            self.c_snapshot_array(False, -1 if depth is None else depth, 0 if price_bucket is None else price_bucket),
+            self.c_snapshot_array(True, -1 if depth is None else depth, 0 if price_bucket is None else price_bucket),
+        )
+
+    cdef np.ndarray c_snapshot_array(self, bint is_buy, Py_ssize_t depth, double price_bucket):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            Py_ssize_t max_levels = deref(book).size()
+            Py_ssize_t levels_count = 0
+            Py_ssize_t entries_count = 0
+            OrderBookEntry entry
+            double price
+            np.ndarray[np.float64_t, ndim=2] array
+
+        if 0 <= depth < max_levels:
+            max_levels = depth
+        # Buckets never outnumber the levels, so the array is allocated once and trimmed
+        array = np.empty((max_levels, 3), dtype=np.float64)
+
+        while entries_count < <Py_ssize_t>deref(book).size():
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+            entries_count += 1
+
+            price = entry.getPrice()
+            if price_bucket > 0:
+                price = c_bucket_price(price, price_bucket, is_buy)
+                if levels_count > 0 and array[levels_count - 1, 0] == price:
+                    array[levels_count - 1, 1] += entry.getAmount()
+                    array[levels_count - 1, 2] = max(array[levels_count - 1, 2], <double>entry.getUpdateId())
+                    continue
+            if levels_count == max_levels:
+                break
+            array[levels_count, 0] = price
+            array[levels_count, 1] = entry.getAmount()
+            array[levels_count, 2] = entry.getUpdateId()
+            levels_count += 1
+
+        return array[:levels_count] if levels_count < max_levels else array
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -208,16 +426,19 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        If update_id is not specified the largest update id of the entries is used.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -227,24 +448,22 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(c_fill_entries(bids_array, cpp_bids), c_fill_entries(asks_array, cpp_asks))
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        If update_id is not specified the largest update id of the entries is used.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -254,13 +473,8 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(c_fill_entries(bids_array, cpp_bids), c_fill_entries(asks_array, cpp_asks))
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -323,6 +537,9 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            return self.c_query_depth_index(PRICE_FOR_VOLUME, is_buy, volume)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount
@@ -343,6 +560,10 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+
+        if self._depth_index_enabled:
+            return self.c_query_depth_index(VWAP_FOR_VOLUME, is_buy, volume)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 total_cost += order_book_row.amount * order_book_row.price
@@ -375,6 +596,9 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            return self.c_query_depth_index(PRICE_FOR_QUOTE_VOLUME, is_buy, quote_volume)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount * order_book_row.price
@@ -396,6 +620,9 @@ cdef class OrderBook(PubSub):
             double cumulative_base_amount = 0
             double row_amount = 0
 
+        if self._depth_index_enabled:
+            return self.c_query_depth_index(QUOTE_VOLUME_FOR_BASE_AMOUNT, is_buy, base_amount)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 row_amount = order_book_row.amount
@@ -422,6 +649,9 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            return self.c_query_depth_index(VOLUME_FOR_PRICE, is_buy, price)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
@@ -442,6 +672,9 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            return self.c_query_depth_index(QUOTE_VOLUME_FOR_PRICE, is_buy, price)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
@@ -457,6 +690,120 @@ cdef class OrderBook(PubSub):
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef c_rebuild_depth_index(self, bint is_buy):
+        cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+            vector[double] *cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+
+        deref(prices).clear()
+        deref(cumulative_base).clear()
+        deref(cumulative_quote).clear()
+        deref(prices).reserve(deref(book).size())
+        deref(cumulative_base).reserve(deref(book).size())
+        deref(cumulative_quote).reserve(deref(book).size())
+
+        # The levels are indexed from the top of the book
+        if is_buy:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                c_append_depth_level(
+                    deref(prices), deref(cumulative_base), deref(cumulative_quote), entry.getPrice(), entry.getAmount()
+                )
+                inc(ask_it)
+        else:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                c_append_depth_level(
+                    deref(prices), deref(cumulative_base), deref(cumulative_quote), entry.getPrice(), entry.getAmount()
+                )
+                inc(bid_it)
+
+    cdef OrderBookQueryResult c_query_depth_index(self, int query_type, bint is_buy, double value):
+        cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+            vector[double] *cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+            vector[double] *cumulative
+            Py_ssize_t levels_count
+            Py_ssize_t level
+            double previous_base = 0
+            double previous_quote = 0
+            double incremental_amount
+            double total_volume
+            double result_price = NaN
+            double result_volume = 0
+            OrderBookQueryResult result
+
+        if self._query_cache_version != self._version or len(self._query_cache) >= QUERY_CACHE_MAX_SIZE:
+            self._query_cache.clear()
+            self._query_cache_version = self._version
+        cache_key = (query_type, is_buy, value)
+        cached_result = self._query_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        if (self._ask_depth_version if is_buy else self._bid_depth_version) != self._version:
+            self.c_rebuild_depth_index(is_buy)
+            if is_buy:
+                self._ask_depth_version = self._version
+            else:
+                self._bid_depth_version = self._version
+        levels_count = deref(prices).size()
+
+        if query_type == VOLUME_FOR_PRICE or query_type == QUOTE_VOLUME_FOR_PRICE:
+            cumulative = cumulative_base if query_type == VOLUME_FOR_PRICE else cumulative_quote
+            level = c_levels_count_up_to_price(deref(prices), value, is_buy)
+            if level > 0:
+                result_price = deref(prices)[level - 1]
+                result_volume = deref(cumulative)[level - 1]
+            result = OrderBookQueryResult(value, NaN, result_price, result_volume)
+        elif query_type == PRICE_FOR_QUOTE_VOLUME:
+            level = c_first_level_reaching(deref(cumulative_quote), value)
+            if level < levels_count:
+                result_price = deref(prices)[level]
+                result_volume = deref(cumulative_quote)[level]
+            elif levels_count > 0:
+                result_volume = deref(cumulative_quote)[levels_count - 1]
+            result = OrderBookQueryResult(NaN, value, result_price, min(result_volume, value))
+        else:
+            level = c_first_level_reaching(deref(cumulative_base), value)
+            if level < levels_count and level > 0:
+                previous_base = deref(cumulative_base)[level - 1]
+                previous_quote = deref(cumulative_quote)[level - 1]
+
+            if query_type == PRICE_FOR_VOLUME:
+                if level < levels_count:
+                    result_price = deref(prices)[level]
+                    result_volume = deref(cumulative_base)[level]
+                elif levels_count > 0:
+                    result_volume = deref(cumulative_base)[levels_count - 1]
+                result = OrderBookQueryResult(NaN, value, result_price, min(result_volume, value))
+            elif query_type == VWAP_FOR_VOLUME:
+                if level < levels_count:
+                    incremental_amount = value - previous_base
+                    total_volume = previous_base + incremental_amount
+                    result_price = (previous_quote + incremental_amount * deref(prices)[level]) / total_volume
+                    result_volume = total_volume
+                elif levels_count > 0:
+                    result_volume = deref(cumulative_base)[levels_count - 1]
+                result = OrderBookQueryResult(NaN, value, result_price, min(result_volume, value))
+            else:
+                if level < levels_count:
+                    result_volume = previous_quote + (value - previous_base) * deref(prices)[level]
+                elif levels_count > 0:
+                    result_volume = deref(cumulative_quote)[levels_count - 1]
+                result = OrderBookQueryResult(NaN, value, NaN, result_volume)
+
+        self._query_cache[cache_key] = result
+        return result
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -478,6 +825,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_numpy_snapshot(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_numpy_diffs(diff.bids_array, diff.asks_array, diff.update_id)
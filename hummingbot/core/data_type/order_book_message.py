@@ -1,7 +1,9 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
-from typing import Dict, List, Optional
+from functools import cached_property, total_ordering
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -52,17 +54,70 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
-    @property
+    @cached_property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        return self._rows_from_prices_and_amounts(self._asks_prices_and_amounts)
 
-    @property
+    @cached_property
     def bids(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
-        ]
+        return self._rows_from_prices_and_amounts(self._bids_prices_and_amounts)
+
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        """
+        The asks as a float64 array with the [price, amount, update_id] columns expected by
+        `OrderBook.apply_numpy_diffs` and `OrderBook.apply_numpy_snapshot`. The entries are parsed only once.
+        """
+        if type(self).asks is not OrderBookMessage.asks:
+            # The subclass parses the content in its own way
+            return self._array_from_rows(self.asks)
+        return self._array_from_prices_and_amounts(self._asks_prices_and_amounts)
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        """
+        The bids as a float64 array with the [price, amount, update_id] columns expected by
+        `OrderBook.apply_numpy_diffs` and `OrderBook.apply_numpy_snapshot`. The entries are parsed only once.
+        """
+        if type(self).bids is not OrderBookMessage.bids:
+            # The subclass parses the content in its own way
+            return self._array_from_rows(self.bids)
+        return self._array_from_prices_and_amounts(self._bids_prices_and_amounts)
+
+    @cached_property
+    def _asks_prices_and_amounts(self) -> np.ndarray:
+        return self._parse_prices_and_amounts(self.content["asks"])
+
+    @cached_property
+    def _bids_prices_and_amounts(self) -> np.ndarray:
+        return self._parse_prices_and_amounts(self.content["bids"])
+
+    @staticmethod
+    def _parse_prices_and_amounts(entries: List[Any]) -> np.ndarray:
+        try:
+            prices_and_amounts = np.array(entries, dtype=np.float64)
+            if prices_and_amounts.ndim != 2 or prices_and_amounts.shape[1] < 2:
+                raise ValueError("The entries are not [price, amount, ...] lists.")
+        except (ValueError, TypeError):
+            # The entries have extra non numeric fields, or a different number of fields
+            prices_and_amounts = np.array(
+                [(price, amount) for price, amount, *trash in entries], dtype=np.float64
+            ).reshape(-1, 2)
+        return prices_and_amounts[:, :2]
+
+    def _array_from_prices_and_amounts(self, prices_and_amounts: np.ndarray) -> np.ndarray:
+        array = np.empty((prices_and_amounts.shape[0], 3), dtype=np.float64)
+        array[:, :2] = prices_and_amounts
+        array[:, 2] = self.update_id
+        return array
+
+    @staticmethod
+    def _array_from_rows(rows: List[OrderBookRow]) -> np.ndarray:
+        return np.array([(row.price, row.amount, row.update_id) for row in rows], dtype=np.float64).reshape(-1, 3)
+
+    def _rows_from_prices_and_amounts(self, prices_and_amounts: np.ndarray) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount in prices_and_amounts.tolist()]
 
     @property
     def has_update_id(self) -> bool:
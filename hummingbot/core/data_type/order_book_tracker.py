@@ -2,6 +2,7 @@ import asyncio
 import logging
 import time
 from collections import defaultdict, deque
+from dataclasses import dataclass
 from enum import Enum
 from typing import Deque, Dict, List, Optional, Tuple
 
@@ -10,9 +11,10 @@ import pandas as pd
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,6 +23,34 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class OrderBookDiffBatchStats:
+    """
+    Statistics of the diff batches applied to an order book when the tracker works in batching mode.
+
+    The lag is the time (in seconds) between the timestamp of the oldest message of a batch and the moment the batch
+    is applied, i.e. how far behind the stream the order book is.
+    """
+    batches_applied: int = 0
+    diffs_applied: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    last_lag: float = 0
+    max_lag: float = 0
+
+    @property
+    def average_batch_size(self) -> float:
+        return self.diffs_applied / self.batches_applied if self.batches_applied > 0 else 0
+
+    def register_batch(self, batch_size: int, lag: float):
+        self.batches_applied += 1
+        self.diffs_applied += batch_size
+        self.last_batch_size = batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
     _obt_logger: Optional[HummingbotLogger] = None
@@ -31,11 +61,27 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 max_concurrent_snapshot_requests: Optional[int] = None,
+                 batch_diffs: bool = False):
+        """
+        :param max_concurrent_snapshot_requests: maximum number of order book snapshots requested at the same time
+            while initializing the order books (no limit if not specified, in which case only the rate limits of the
+            data source throttler apply)
+        :param batch_diffs: if True all the diff messages queued for an order book are merged by price level and
+            applied at once, instead of one message at a time
+        """
         self._domain: Optional[str] = domain
+        self._max_concurrent_snapshot_requests: Optional[int] = max_concurrent_snapshot_requests
+        self._batch_diffs: bool = batch_diffs
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_initialized_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        self._initialized_order_books_count: int = 0
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +91,7 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._diff_batch_stats: Dict[str, OrderBookDiffBatchStats] = defaultdict(OrderBookDiffBatchStats)
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +115,31 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        The trading pairs whose order book is already initialized, even if the initialization of the rest of the order
+        books is still in progress.
+        """
+        return [
+            trading_pair
+            for trading_pair in self._trading_pairs
+            if self._order_book_initialized_events[trading_pair].is_set()
+        ]
+
+    @property
+    def diff_batch_stats(self) -> Dict[str, OrderBookDiffBatchStats]:
+        return self._diff_batch_stats
+
+    def pending_messages_count(self, trading_pair: str) -> int:
+        """
+        Number of messages received for the trading pair that have not been applied to its order book yet.
+        """
+        pending_count = len(self._saved_message_queues.get(trading_pair, ()))
+        if trading_pair in self._tracking_message_queues:
+            pending_count += self._tracking_message_queues[trading_pair].qsize()
+        return pending_count
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,10 +210,15 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_initialized_events.values():
+            event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    async def wait_trading_pair_ready(self, trading_pair: str):
+        await self._order_book_initialized_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -175,16 +252,50 @@ class OrderBookTracker:
     async def _init_order_books(self):
         """
         Initialize order books
+
+        The snapshots are requested concurrently (the data source throttler enforces the exchange rate limits) and the
+        tracking of each order book starts as soon as its own snapshot is received.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        self._initialized_order_books_count = 0
+        semaphore: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(self._max_concurrent_snapshot_requests)
+            if self._max_concurrent_snapshot_requests is not None
+            else None
+        )
+        await safe_gather(*[
+            self._init_order_book(trading_pair=trading_pair, semaphore=semaphore)
+            for trading_pair in self._trading_pairs
+        ])
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str, semaphore: Optional[asyncio.Semaphore]):
+        while True:
+            try:
+                if semaphore is None:
+                    order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                else:
+                    async with semaphore:
+                        order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                    f"Retrying after 5 seconds."
+                )
+                await self._sleep(delay=5.0)
+
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_initialized_events[trading_pair].set()
+        self._initialized_order_books_count += 1
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{self._initialized_order_books_count}/{len(self._trading_pairs)} completed.")
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -260,21 +371,31 @@ class OrderBookTracker:
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        next_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                # Process the message left over by the last batch and the saved messages first if there are any
+                if next_message is not None:
+                    message, next_message = next_message, None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    if self._batch_diffs:
+                        diff_messages, next_message = self._drain_queued_diffs(
+                            first_message=message, saved_messages=saved_messages, message_queue=message_queue
+                        )
+                        self._apply_diffs_batch(trading_pair=trading_pair, diff_messages=diff_messages)
+                    else:
+                        order_book.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+                        diff_messages = [message]
+                    past_diffs_window.extend(diff_messages)
+                    diff_messages_accepted += len(diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -295,6 +416,57 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _drain_queued_diffs(
+        first_message: OrderBookMessage,
+        saved_messages: Deque[OrderBookMessage],
+        message_queue: asyncio.Queue,
+    ) -> Tuple[List[OrderBookMessage], Optional[OrderBookMessage]]:
+        """
+        Takes all the diff messages already available for the order book, without waiting for new ones.
+
+        :return: the diff messages, and the first non-diff message found (if any), which has to be processed after the
+            diffs to keep the order of the stream
+        """
+        diff_messages: List[OrderBookMessage] = [first_message]
+        while True:
+            if len(saved_messages) > 0:
+                message = saved_messages.popleft()
+            elif not message_queue.empty():
+                message = message_queue.get_nowait()
+            else:
+                return diff_messages, None
+            if message.type is not OrderBookMessageType.DIFF:
+                return diff_messages, message
+            diff_messages.append(message)
+
+    def _apply_diffs_batch(self, trading_pair: str, diff_messages: List[OrderBookMessage]):
+        """
+        Merges the diff messages by price level and applies the result to the order book with a single update.
+
+        For each price level the entry with the highest update id wins (the latest message if the update ids are the
+        same), so the result is the same as applying the messages one by one.
+        """
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        update_id: int = diff_messages[0].update_id
+        oldest_timestamp: Optional[float] = None
+
+        for message in diff_messages:
+            update_id = max(update_id, message.update_id)
+            if message.timestamp is not None and (oldest_timestamp is None or message.timestamp < oldest_timestamp):
+                oldest_timestamp = message.timestamp
+            for rows, merged_rows in ((message.bids, bids), (message.asks, asks)):
+                for row in rows:
+                    merged_row = merged_rows.get(row.price)
+                    if merged_row is None or merged_row.update_id <= row.update_id:
+                        merged_rows[row.price] = row
+
+        self._order_books[trading_pair].apply_diffs(list(bids.values()), list(asks.values()), update_id)
+
+        lag = max(0.0, time.time() - oldest_timestamp) if oldest_timestamp is not None else 0.0
+        self._diff_batch_stats[trading_pair].register_batch(batch_size=len(diff_messages), lag=lag)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
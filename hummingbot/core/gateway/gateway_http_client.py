@@ -12,6 +12,7 @@ from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import OrderType, PositionSide
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_quote_cache import GatewayQuoteCache
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -65,6 +66,7 @@ class GatewayHttpClient:
         if GatewayHttpClient.__instance is None:
             self._base_url = f"https://{api_host}:{api_port}"
         self._client_config_map = client_config_map
+        self._quote_cache = GatewayQuoteCache(ttl=client_config_map.gateway.gateway_quote_cache_ttl)
         GatewayHttpClient.__instance = self
 
     @classmethod
@@ -104,6 +106,10 @@ class GatewayHttpClient:
     def base_url(self, url: str):
         self._base_url = url
 
+    @property
+    def quote_cache(self) -> GatewayQuoteCache:
+        return self._quote_cache
+
     def log_error_codes(self, resp: Dict[str, Any]):
         """
         If the API returns an error code, interpret the code, log a useful
@@ -330,7 +336,13 @@ class GatewayHttpClient:
         if chain is not None and network is not None:
             req_data["chain"] = chain
             req_data["network"] = network
-        return await self.api_request("get", "chain/status", req_data, fail_silently=fail_silently)
+        resp = await self.api_request("get", "chain/status", req_data, fail_silently=fail_silently)
+        # A new block can move the pool prices, the cached quotes of the network are dropped
+        for status in (resp if isinstance(resp, list) else [resp]):
+            if isinstance(status, dict) and status.get("chain", chain) and status.get("network", network):
+                self._quote_cache.update_block_number(
+                    status.get("chain", chain), status.get("network", network), status.get("currentBlockNumber"))
+        return resp
 
     async def approve_token(
             self,
@@ -388,22 +400,37 @@ class GatewayHttpClient:
             quote_asset: str,
             amount: Decimal,
             side: TradeType,
-            fail_silently: bool = False
+            fail_silently: bool = False,
+            use_cache: bool = True,
     ) -> Dict[str, Any]:
+        """
+        Gets an AMM price quote. Unless `use_cache` is False, the quote is served from the quote cache when a quote
+        of a close amount was fetched recently, and identical concurrent requests share a single gateway call.
+        """
         if side not in [TradeType.BUY, TradeType.SELL]:
             raise ValueError("Only BUY and SELL prices are supported.")
 
-        # XXX(martin_kou): The amount is always output with 18 decimal places.
-        return await self.api_request("post", "amm/price", {
-            "chain": chain,
-            "network": network,
-            "connector": connector,
-            "base": base_asset,
-            "quote": quote_asset,
-            "amount": f"{amount:.18f}",
-            "side": side.name,
-            "allowedSlippage": "0/1",  # hummingbot applies slippage itself
-        }, fail_silently=fail_silently)
+        def fetch_price():
+            # XXX(martin_kou): The amount is always output with 18 decimal places.
+            return self.api_request("post", "amm/price", {
+                "chain": chain,
+                "network": network,
+                "connector": connector,
+                "base": base_asset,
+                "quote": quote_asset,
+                "amount": f"{amount:.18f}",
+                "side": side.name,
+                "allowedSlippage": "0/1",  # hummingbot applies slippage itself
+            }, fail_silently=fail_silently)
+
+        if not use_cache:
+            return await fetch_price()
+        # Read on every request, so the changes of the setting apply to the running client
+        self._quote_cache.ttl = self._client_config_map.gateway.gateway_quote_cache_ttl
+        quote_key = self._quote_cache.quote_key(
+            connector, chain, network, base_asset, quote_asset, side, amount, fail_silently
+        )
+        return await self._quote_cache.get_or_fetch(quote_key, fetch_price)
 
     async def get_transaction_status(
             self,
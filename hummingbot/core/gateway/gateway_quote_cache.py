@@ -0,0 +1,178 @@
+import asyncio
+import time
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+
+from hummingbot.core.event.events import TradeType
+
+
+class QuoteCacheKey(NamedTuple):
+    connector: str
+    chain: str
+    network: str
+    trading_pair: str
+    side: TradeType
+    amount_bucket: Decimal
+    # The silent requests return the error responses instead of raising, so they are not shared with the others
+    fail_silently: bool = False
+
+
+class GatewayQuoteCache:
+    """
+    A short lived cache of the gateway AMM price quotes.
+
+    The quotes are keyed on the connector, chain, network, trading pair, side and the amount rounded to a few
+    significant digits, so near identical amounts share the same quote. A quote expires after `ttl` seconds, or as
+    soon as a new block or a new nonce is seen on its chain and network.
+
+    Concurrent requests of a quote that is not cached share a single gateway call (single-flight), every caller gets
+    the result or the error of that call. Failed calls, empty responses and error responses are not cached.
+    """
+
+    AMOUNT_SIGNIFICANT_DIGITS = 4
+
+    def __init__(self, ttl: float, amount_significant_digits: int = AMOUNT_SIGNIFICANT_DIGITS):
+        self._ttl = ttl
+        self._amount_significant_digits = amount_significant_digits
+        self._quotes: Dict[QuoteCacheKey, Tuple[float, Dict[str, Any]]] = {}
+        self._in_flight: Dict[QuoteCacheKey, asyncio.Future] = {}
+        self._chain_states: Dict[Tuple[str, str, str], Any] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, ttl: float):
+        self._ttl = ttl
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def coalesced(self) -> int:
+        return self._coalesced
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "size": len(self._quotes),
+        }
+
+    def reset_metrics(self):
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def amount_bucket(self, amount: Decimal) -> Decimal:
+        amount = Decimal(str(amount))
+        if amount.is_zero():
+            return Decimal("0")
+        exponent = amount.adjusted() - self._amount_significant_digits + 1
+        return amount.quantize(Decimal(1).scaleb(exponent), rounding=ROUND_HALF_UP).normalize()
+
+    def quote_key(self,
+                  connector: str,
+                  chain: str,
+                  network: str,
+                  base_asset: str,
+                  quote_asset: str,
+                  side: TradeType,
+                  amount: Decimal,
+                  fail_silently: bool = False) -> QuoteCacheKey:
+        return QuoteCacheKey(
+            connector=connector,
+            chain=chain,
+            network=network,
+            trading_pair=f"{base_asset}-{quote_asset}",
+            side=side,
+            amount_bucket=self.amount_bucket(amount),
+            fail_silently=fail_silently,
+        )
+
+    def get(self, key: QuoteCacheKey) -> Optional[Dict[str, Any]]:
+        entry = self._quotes.get(key)
+        if entry is None:
+            return None
+        expiration, quote = entry
+        if time.monotonic() >= expiration:
+            del self._quotes[key]
+            return None
+        return quote
+
+    async def get_or_fetch(self,
+                           key: QuoteCacheKey,
+                           fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Returns the cached quote of the key, or fetches it. Only one fetch per key runs at a time, the callers
+        requesting the same key while it runs get its result (or its error).
+        """
+        quote = self.get(key)
+        if quote is not None:
+            self._hits += 1
+            return quote
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._coalesced += 1
+        else:
+            self._misses += 1
+            in_flight = asyncio.ensure_future(self._fetch(key, fetch))
+            self._in_flight[key] = in_flight
+        # Shielded, so a cancelled caller does not cancel the gateway call shared with the other callers
+        return await asyncio.shield(in_flight)
+
+    async def _fetch(self,
+                     key: QuoteCacheKey,
+                     fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        task = asyncio.current_task()
+        try:
+            quote = await fetch()
+            # Not cached if the chain state changed while fetching (the key was invalidated), or if it is the error
+            # response returned to a silent request
+            cacheable = isinstance(quote, dict) and len(quote) > 0 and "error" not in quote
+            if cacheable and self._ttl > 0 and self._in_flight.get(key) is task:
+                self._quotes[key] = (time.monotonic() + self._ttl, quote)
+            return quote
+        finally:
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+
+    def invalidate(self, chain: Optional[str] = None, network: Optional[str] = None):
+        """
+        Drops the cached quotes of a chain and network, or all of them if no chain is given. Fetches in progress are
+        not cancelled, but their results are not cached.
+        """
+        def matches(key: QuoteCacheKey) -> bool:
+            return chain is None or (key.chain == chain and (network is None or key.network == network))
+
+        for key in [key for key in self._quotes if matches(key)]:
+            del self._quotes[key]
+        for key in [key for key in self._in_flight if matches(key)]:
+            del self._in_flight[key]
+
+    def update_block_number(self, chain: str, network: str, block_number: int):
+        self._update_chain_state(chain, network, "block_number", block_number)
+
+    def update_nonce(self, chain: str, network: str, nonce: int):
+        self._update_chain_state(chain, network, "nonce", nonce)
+
+    def _update_chain_state(self, chain: str, network: str, state: str, value: Any):
+        if value is None:
+            return
+        state_key = (chain, network, state)
+        previous_value = self._chain_states.get(state_key)
+        self._chain_states[state_key] = value
+        if previous_value is not None and previous_value != value:
+            self.invalidate(chain, network)
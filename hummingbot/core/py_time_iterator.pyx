@@ -1,5 +1,7 @@
 # distutils: language=c++
 
+NaN = float("nan")
+
 
 cdef class PyTimeIterator(TimeIterator):
     def tick(self, double timestamp):
@@ -8,3 +10,9 @@ cdef class PyTimeIterator(TimeIterator):
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self.tick(timestamp)
+
+    def next_event_timestamp(self) -> float:
+        return NaN
+
+    cdef double c_next_event_timestamp(self):
+        return self.next_event_timestamp()
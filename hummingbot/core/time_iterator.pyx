@@ -25,6 +25,18 @@ cdef class TimeIterator(PubSub):
     def tick(self, timestamp: float):
         self.c_tick(timestamp)
 
+    cdef double c_next_event_timestamp(self):
+        """
+        Used by the clock fast-forward mode in back testing, to skip the ticks where nothing happens.
+
+        :return: NaN if the iterator needs to be ticked periodically (the default), otherwise the timestamp of the next
+        tick it needs (infinity if it doesn't need any)
+        """
+        return NaN
+
+    def next_event_timestamp(self) -> float:
+        return self.c_next_event_timestamp()
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
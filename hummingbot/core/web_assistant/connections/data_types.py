@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from copy import copy
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Mapping, Optional
@@ -6,6 +7,8 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 import aiohttp
 import ujson
 
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodecBase, get_default_json_codec
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -35,6 +38,22 @@ class RESTRequest:
     is_auth_required: bool = False
     throttler_limit_id: Optional[str] = None
 
+    def shallow_copy(self) -> "RESTRequest":
+        """Returns a copy of the request that can be changed without affecting the original one.
+
+        Only the top level of `params`, `headers` and `data` is copied. Pre-processors and `AuthBase` implementations
+        are expected to add, replace or remove entries of those collections (or to reassign them), never to mutate
+        the nested values in place.
+        """
+        request = copy(self)
+        if self.params is not None:
+            request.params = copy(self.params)
+        if self.headers is not None:
+            request.headers = copy(self.headers)
+        if isinstance(self.data, (dict, list)):
+            request.data = copy(self.data)
+        return request
+
 
 @dataclass
 class EndpointRESTRequest(RESTRequest, ABC):
@@ -87,8 +106,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_codec: Optional[JSONCodecBase] = None):
         self._aiohttp_response = aiohttp_response
+        self._json_codec = json_codec or get_default_json_codec()
 
     @property
     def url(self) -> str:
@@ -111,7 +131,7 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=self._json_codec.loads)
         return json_
 
     async def text(self) -> str:
@@ -0,0 +1,116 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+
+class JSONCodecBase(ABC):
+    """Encodes and decodes the JSON payloads of the `web_assistant` layer.
+
+    The connections, assistants and post-processors use the codec they are given instead of calling a JSON library
+    directly, so a faster implementation can be plugged in without changing the connectors.
+    """
+
+    name: str = ""
+    decode_errors: Tuple[Type[Exception], ...] = (json.JSONDecodeError,)
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        ...
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        ...
+
+
+class StdlibJSONCodec(JSONCodecBase):
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonJSONCodec(JSONCodecBase):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self.decode_errors = (orjson.JSONDecodeError,)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj).decode("utf-8")
+
+
+class MsgspecJSONCodec(JSONCodecBase):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self.decode_errors = (msgspec.DecodeError,)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode("utf-8")
+
+
+JSON_CODECS: Dict[str, Type[JSONCodecBase]] = {
+    StdlibJSONCodec.name: StdlibJSONCodec,
+    OrjsonJSONCodec.name: OrjsonJSONCodec,
+    MsgspecJSONCodec.name: MsgspecJSONCodec,
+}
+
+# The codec names accepted by `get_json_codec`
+JSON_CODEC_NAMES: List[str] = list(JSON_CODECS.keys()) + ["fastest"]
+
+_default_json_codec: JSONCodecBase = StdlibJSONCodec()
+
+
+def get_json_codec(name: str) -> JSONCodecBase:
+    """
+    Creates the codec registered with the given name.
+
+    :param name: one of the keys of `JSON_CODECS`, or "fastest" to use the fastest library installed
+    :return: the codec instance
+    :raises ValueError: if the name is unknown
+    :raises ImportError: if the library of the codec is not installed
+    """
+    if name == "fastest":
+        for codec_name in (MsgspecJSONCodec.name, OrjsonJSONCodec.name):
+            try:
+                return JSON_CODECS[codec_name]()
+            except ImportError:
+                continue
+        return StdlibJSONCodec()
+    if name not in JSON_CODECS:
+        raise ValueError(f"Invalid JSON codec {name}, please choose a value from {JSON_CODEC_NAMES}.")
+    return JSON_CODECS[name]()
+
+
+def get_default_json_codec() -> JSONCodecBase:
+    return _default_json_codec
+
+
+def set_default_json_codec(codec: Optional[Union[str, JSONCodecBase]]):
+    """
+    Sets the codec used by the connections and assistants that are not given one explicitly.
+
+    :param codec: a codec instance, the name of a codec (see `get_json_codec`) or None to go back to the stdlib one
+    """
+    global _default_json_codec
+    if codec is None:
+        codec = StdlibJSONCodec()
+    elif isinstance(codec, str):
+        codec = get_json_codec(codec)
+    _default_json_codec = codec
@@ -1,16 +1,27 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodecBase, get_default_json_codec
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    """
+    :param json_codec: the codec used to encode the JSON requests and decode the text messages (the default codec if
+        not specified)
+    :param decode_json: if False the responses contain the raw message data (str or bytes), so the connector can
+        inspect it and decode only the messages it needs, with `json_codec.loads`
+    """
+    def __init__(self,
+                 aiohttp_client_session: aiohttp.ClientSession,
+                 json_codec: Optional[JSONCodecBase] = None,
+                 decode_json: bool = True):
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec or get_default_json_codec()
+        self._decode_json = decode_json
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -24,6 +35,10 @@ class WSConnection:
     def connected(self) -> bool:
         return self._connected
 
+    @property
+    def json_codec(self) -> JSONCodecBase:
+        return self._json_codec
+
     async def connect(
         self,
         ws_url: str,
@@ -117,19 +132,18 @@ class WSConnection:
         self._last_recv_time = time.time()
 
     async def _send_json(self, payload: Mapping[str, Any]):
-        await self._connection.send_json(payload)
+        await self._connection.send_json(payload, dumps=self._json_codec.dumps)
 
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
-        if msg.type == aiohttp.WSMsgType.BINARY:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
+        if msg.type == aiohttp.WSMsgType.BINARY or not self._decode_json:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = self._json_codec.loads(msg.data)
+            except self._json_codec.decode_errors:
                 data = msg.data
         response = WSResponse(data)
         return response
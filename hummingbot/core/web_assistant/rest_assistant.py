@@ -1,6 +1,4 @@
-import json
 from asyncio import wait_for
-from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
@@ -17,6 +15,9 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    The pre-processors and the auth work on a `RESTRequest.shallow_copy` of the request passed to `call`, so they
+    should only add, replace or remove the entries of its `params`, `headers` and `data`.
     """
     def __init__(
         self,
@@ -71,18 +72,17 @@ class RESTAssistant:
             headers: Optional[Dict[str, Any]] = None,
     ) -> RESTResponse:
 
-        headers = headers or {}
-
         local_headers = {
             "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
-        local_headers.update(headers)
+        if headers:
+            local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        data = self._connection.json_codec.dumps(data) if data is not None else data
 
         request = RESTRequest(
             method=method,
             url=url,
-            params=params,
+            params=params.copy() if params is not None else None,
             data=data,
             headers=local_headers,
             is_auth_required=is_auth_required,
@@ -90,7 +90,8 @@ class RESTAssistant:
         )
 
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
+            # The request only holds new (or copied) collections, so it does not need the copy made by `call`
+            response = await self._call(request=request, timeout=timeout)
 
             if 400 <= response.status:
                 if not return_err:
@@ -101,7 +102,9 @@ class RESTAssistant:
             return response
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
+        return await self._call(request=request.shallow_copy(), timeout=timeout)
+
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         resp = await wait_for(self._connection.call(request), timeout)
@@ -3,6 +3,7 @@ from typing import AsyncGenerator, Dict, List, Optional
 
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodecBase
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
@@ -32,6 +33,10 @@ class WSAssistant:
     def last_recv_time(self) -> float:
         return self._connection.last_recv_time
 
+    @property
+    def json_codec(self) -> JSONCodecBase:
+        return self._connection.json_codec
+
     async def connect(
         self,
         ws_url: str,
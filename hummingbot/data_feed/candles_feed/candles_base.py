@@ -1,8 +1,8 @@
 import asyncio
 import os
-from collections import deque
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from bidict import bidict
 
@@ -12,12 +12,14 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a numpy ring buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -46,7 +48,9 @@ class CandlesBase(NetworkBase):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesRingBuffer(maxlen=max_records, n_columns=len(self.columns))
+        self._candles_array: Optional[np.ndarray] = None
+        self._candles_array_version: Optional[int] = None
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -75,7 +79,7 @@ class CandlesBase(NetworkBase):
     @property
     def is_ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -110,12 +114,35 @@ class CandlesBase(NetworkBase):
     async def check_network(self) -> NetworkStatus:
         raise NotImplementedError
 
+    @property
+    def candles_version(self) -> int:
+        """
+        This property returns a counter that changes every time a candle is added or updated, so the consumers can skip
+        recomputing their indicators when the candles didn't change.
+        """
+        return self._candles.version
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns a read-only snapshot of the candles as a numpy array. The snapshot is only copied from
+        the buffer when the candles have changed since the last call.
+        """
+        if self._candles_array_version != self._candles.version:
+            candles_array = self._candles.values.copy()
+            candles_array.flags.writeable = False
+            self._candles_array = candles_array
+            self._candles_array_version = self._candles.version
+        return self._candles_array
+
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame. Every call returns a new
+        writable copy, so the candles can be modified in place without changing the buffer or the other consumers'
+        DataFrames. Use candles_array for read-only access without copies.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        return pd.DataFrame(self.candles_array, columns=self.columns, copy=True)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -130,8 +157,42 @@ class CandlesBase(NetworkBase):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File '{file_path}' does not exist.")
         df = pd.read_csv(file_path)
-        df.sort_values(by="timestamp", ascending=False, inplace=True)
-        self._candles.extendleft(df.values.tolist())
+        self.load_candles_from_df(df)
+
+    def load_candles_from_df(self, df: pd.DataFrame):
+        """
+        This method loads the candles from a DataFrame with the same columns as candles_df.
+        :param df: DataFrame with the candles
+        """
+        df = df.sort_values(by="timestamp", ascending=False)
+        self._candles.extendleft(df.values)
+
+    def get_candles_store(self, data_path: str) -> CandlesStore:
+        return CandlesStore(data_path=data_path, columns=self.columns)
+
+    def load_candles_from_store(self, data_path: str, start_time: Optional[float] = None,
+                                end_time: Optional[float] = None):
+        """
+        This method loads the last max_records candles of a time range from the local candles store, reading only
+        that window from disk.
+        :param data_path: data path that holds the candles store
+        :param start_time: first timestamp of the range (inclusive)
+        :param end_time: last timestamp of the range (inclusive)
+        """
+        store = self.get_candles_store(data_path)
+        if not store.exists(self.name, self.interval):
+            raise FileNotFoundError(f"File '{store.get_file_path(self.name, self.interval)}' does not exist.")
+        candles = store.read(self.name, self.interval, start_time=start_time, end_time=end_time,
+                             max_records=self._candles.maxlen)
+        self._candles.extend(candles)
+
+    def save_candles_to_store(self, data_path: str) -> int:
+        """
+        This method appends the candles that are not in the local candles store yet.
+        :param data_path: data path that holds the candles store
+        :return: the number of candles appended
+        """
+        return self.get_candles_store(data_path).append(self.name, self.interval, self.candles_df.values)
 
     async def fetch_candles(self,
                             start_time: Optional[int] = None,
@@ -148,7 +209,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
+        This is an abstract method that must be implemented by a subclass to fill the _candles buffer with historical candles.
         """
         raise NotImplementedError
 
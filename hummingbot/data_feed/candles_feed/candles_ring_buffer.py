@@ -0,0 +1,118 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+class CandlesRingBuffer:
+    """
+    Fixed capacity buffer of candles backed by a 2D numpy array, with the same interface as the deque(maxlen=...) used
+    before by the candles feeds (append, appendleft, extend, extendleft, pop, popleft, clear, indexing and len).
+
+    The rows are kept contiguous in a storage of twice the capacity: new candles are written after the last one and,
+    when the end of the storage is reached, the last `maxlen` rows are moved back to the start. That keeps append and
+    update of the last candle O(1) amortized, and the candles always available as an array view without copies.
+    Every change increments `version`, so the consumers can skip recomputations when no candle has changed.
+    """
+
+    def __init__(self, maxlen: int, n_columns: int):
+        self._maxlen = maxlen
+        self._n_columns = n_columns
+        self._storage = np.zeros((2 * max(maxlen, 1), n_columns), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self._version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Returns a view of the candles (oldest first). The view is only valid until the next change of the buffer.
+        """
+        return self._storage[self._start:self._end]
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.values.copy())
+
+    def _position(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("candles index out of range")
+        return self._start + index
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._storage[self._position(index)].copy()
+
+    def __setitem__(self, index: int, candle: Iterable[float]):
+        self._storage[self._position(index)] = candle
+        self._version += 1
+
+    def append(self, candle: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        if self._end == len(self._storage):
+            # Move the candles that will remain after the append to the start of the storage
+            keep = min(len(self), self._maxlen - 1)
+            self._storage[:keep] = self._storage[self._end - keep:self._end]
+            self._start, self._end = 0, keep
+        elif len(self) == self._maxlen:
+            self._start += 1
+        self._storage[self._end] = candle
+        self._end += 1
+        self._version += 1
+
+    def extend(self, candles: Iterable[Iterable[float]]):
+        candles = np.asarray(list(candles) if not isinstance(candles, np.ndarray) else candles, dtype=np.float64)
+        if len(candles) == 0 or self._maxlen == 0:
+            return
+        candles = candles.reshape(-1, self._n_columns)
+        self._set_values(np.concatenate([self.values, candles[-self._maxlen:]])[-self._maxlen:])
+
+    def appendleft(self, candle: Iterable[float]):
+        self.extendleft([candle])
+
+    def extendleft(self, candles: Iterable[Iterable[float]]):
+        """
+        Same semantics as deque.extendleft: the candles are added one by one to the left, so they end up in reverse
+        order, and the candles on the right are discarded when the buffer is full.
+        """
+        candles = np.asarray(list(candles) if not isinstance(candles, np.ndarray) else candles, dtype=np.float64)
+        if len(candles) == 0 or self._maxlen == 0:
+            return
+        candles = candles.reshape(-1, self._n_columns)
+        self._set_values(np.concatenate([candles[::-1], self.values])[:self._maxlen])
+
+    def pop(self) -> np.ndarray:
+        if len(self) == 0:
+            raise IndexError("pop from an empty candles buffer")
+        self._end -= 1
+        self._version += 1
+        return self._storage[self._end].copy()
+
+    def popleft(self) -> np.ndarray:
+        if len(self) == 0:
+            raise IndexError("pop from an empty candles buffer")
+        self._start += 1
+        self._version += 1
+        return self._storage[self._start - 1].copy()
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+        self._version += 1
+
+    def _set_values(self, candles: np.ndarray):
+        self._storage[:len(candles)] = candles
+        self._start, self._end = 0, len(candles)
+        self._version += 1
@@ -0,0 +1,109 @@
+import os
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class CandlesStore:
+    """
+    Local columnar store of historical candles, with one file per connector / trading pair / interval.
+    Each file holds the raw float64 rows of the candles sorted by timestamp (first column), so it can be memory-mapped
+    and range-queried with a binary search over the timestamps without loading the whole history. New candles are
+    appended to the end of the file.
+    """
+    file_extension = "bin"
+    dtype = np.float64
+
+    def __init__(self, data_path: str, columns: List[str]):
+        """
+        :param data_path: directory where the store files are saved
+        :param columns: columns of the candles, the first one has to be the timestamp
+        """
+        self.data_path = data_path
+        self.columns = columns
+
+    @property
+    def row_size(self) -> int:
+        return len(self.columns) * np.dtype(self.dtype).itemsize
+
+    def get_file_path(self, name: str, interval: str) -> str:
+        return os.path.join(self.data_path, f"candles_{name}_{interval}.{self.file_extension}")
+
+    def exists(self, name: str, interval: str) -> bool:
+        return os.path.exists(self.get_file_path(name, interval))
+
+    def get_candles_array(self, name: str, interval: str) -> np.ndarray:
+        """
+        Returns a read-only memory-mapped view of all the candles stored (no data is read until it is accessed).
+        """
+        file_path = self.get_file_path(name, interval)
+        if not os.path.exists(file_path):
+            return np.empty((0, len(self.columns)), dtype=self.dtype)
+        # A partially written row (e.g. an interrupted append) is ignored
+        n_rows = os.path.getsize(file_path) // self.row_size
+        if n_rows == 0:
+            return np.empty((0, len(self.columns)), dtype=self.dtype)
+        return np.memmap(file_path, dtype=self.dtype, mode="r", shape=(n_rows, len(self.columns)))
+
+    def last_timestamp(self, name: str, interval: str) -> Optional[float]:
+        candles = self.get_candles_array(name, interval)
+        return float(candles[-1, 0]) if len(candles) > 0 else None
+
+    def append(self, name: str, interval: str, candles: np.ndarray) -> int:
+        """
+        Appends the candles that are newer than the last candle stored.
+        :param name: name of the candles (connector and trading pair)
+        :param interval: interval of the candles
+        :param candles: array (or DataFrame) with the candles, with the same columns as the store
+        :return: the number of candles appended
+        """
+        candles = np.asarray(candles, dtype=self.dtype).reshape(-1, len(self.columns))
+        candles = candles[np.argsort(candles[:, 0], kind="stable")]
+        if len(candles) > 0:
+            # Keep the last version of duplicated timestamps
+            is_last = np.append(candles[1:, 0] != candles[:-1, 0], True)
+            candles = candles[is_last]
+        last_timestamp = self.last_timestamp(name, interval)
+        if last_timestamp is not None:
+            candles = candles[candles[:, 0] > last_timestamp]
+        if len(candles) == 0:
+            return 0
+        file_path = self.get_file_path(name, interval)
+        os.makedirs(self.data_path, exist_ok=True)
+        with open(file_path, "ab") as f:
+            # Drop a partially written row before appending, so the file stays aligned to whole rows
+            f.truncate(os.path.getsize(file_path) // self.row_size * self.row_size)
+            f.write(np.ascontiguousarray(candles).tobytes())
+        return len(candles)
+
+    def read(self,
+             name: str,
+             interval: str,
+             start_time: Optional[float] = None,
+             end_time: Optional[float] = None,
+             max_records: Optional[int] = None) -> np.ndarray:
+        """
+        Reads the candles of a time range. Only the rows of the range are read from disk.
+        :param name: name of the candles (connector and trading pair)
+        :param interval: interval of the candles
+        :param start_time: first timestamp (inclusive), in the same unit as the stored timestamps
+        :param end_time: last timestamp (inclusive), in the same unit as the stored timestamps
+        :param max_records: if set, only the last max_records candles of the range are returned
+        :return: array with the candles
+        """
+        candles = self.get_candles_array(name, interval)
+        timestamps = candles[:, 0]
+        start = np.searchsorted(timestamps, start_time, side="left") if start_time is not None else 0
+        end = np.searchsorted(timestamps, end_time, side="right") if end_time is not None else len(candles)
+        if max_records is not None:
+            start = max(start, end - max_records)
+        return np.array(candles[start:end])
+
+    def read_df(self,
+                name: str,
+                interval: str,
+                start_time: Optional[float] = None,
+                end_time: Optional[float] = None,
+                max_records: Optional[int] = None) -> pd.DataFrame:
+        return pd.DataFrame(self.read(name, interval, start_time, end_time, max_records), columns=self.columns)
@@ -1,11 +1,14 @@
+import asyncio
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from os.path import join
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
+from sqlalchemy.pool import SingletonThreadPool
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
 
 from hummingbot import data_path
@@ -17,6 +20,8 @@ from hummingbot.model.transaction_base import TransactionBase
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
+T = TypeVar("T")
+
 
 class SQLConnectionType(Enum):
     TRADE_FILLS = 1
@@ -29,6 +34,14 @@ class SQLConnectionManager(TransactionBase):
     LOCAL_DB_VERSION_KEY = "local_db_version"
     LOCAL_DB_VERSION_VALUE = "20230516"
 
+    # Write-ahead logging lets the readers work while a transaction is being written, and makes each commit cheaper
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+    }
+    READER_THREADS_COUNT = 2
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._scm_logger is None:
@@ -73,6 +86,8 @@ class SQLConnectionManager(TransactionBase):
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            if self._engine.dialect.name == "sqlite":
+                event.listen(self._engine, "connect", self._configure_sqlite_connection)
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -92,6 +107,8 @@ class SQLConnectionManager(TransactionBase):
                             conn.execute(DropConstraint(fk_constraint))
 
         self._session_cls = sessionmaker(bind=self._engine)
+        self._writer_executor: Optional[ThreadPoolExecutor] = None
+        self._reader_executor: Optional[ThreadPoolExecutor] = None
 
         if connection_type is SQLConnectionType.TRADE_FILLS and (not called_from_migrator):
             self.check_and_migrate_db(client_config_map)
@@ -100,9 +117,82 @@ class SQLConnectionManager(TransactionBase):
     def engine(self) -> Engine:
         return self._engine
 
+    @property
+    def uses_worker_threads(self) -> bool:
+        # Each thread has its own database with the in-memory SQLite engines, so the work is done on the calling thread
+        return not isinstance(self._engine.pool, SingletonThreadPool)
+
     def get_new_session(self) -> Session:
         return self._session_cls()
 
+    async def run_query(self, query_function: Callable[[Session], T]) -> T:
+        """
+        Executes the query function with a new session on a reader thread, so the event loop is not blocked.
+        The returned records are detached from the session, everything needed from them (e.g. relationships) has to be
+        loaded by the query function.
+        """
+        if not self.uses_worker_threads:
+            return self._run_in_session(query_function)
+        if self._reader_executor is None:
+            self._reader_executor = ThreadPoolExecutor(max_workers=self.READER_THREADS_COUNT,
+                                                       thread_name_prefix="SQLReader")
+        return await asyncio.get_event_loop().run_in_executor(
+            self._reader_executor, self._run_in_session, query_function)
+
+    async def run_transaction(self, write_function: Callable[[Session], T]) -> T:
+        """
+        Executes the write function in a new transaction on the writer thread, without blocking the event loop.
+        """
+        return await asyncio.wrap_future(self.submit_transaction(write_function))
+
+    def execute_transaction(self, write_function: Callable[[Session], T]) -> T:
+        """
+        Executes the write function in a new transaction on the writer thread and waits for the result, for the callers
+        that are not on the event loop (e.g. the background threads).
+        """
+        return self.submit_transaction(write_function).result()
+
+    def submit_transaction(self, write_function: Callable[[Session], T]) -> Future:
+        """
+        Queues the write function to be executed in a new transaction on the writer thread. The transactions are
+        executed one at a time, in the order they are submitted.
+        """
+        if not self.uses_worker_threads:
+            future = Future()
+            try:
+                future.set_result(self._run_in_transaction(write_function))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        if self._writer_executor is None:
+            self._writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SQLWriter")
+        return self._writer_executor.submit(self._run_in_transaction, write_function)
+
+    def shutdown(self):
+        """
+        Waits for the submitted transactions and queries, and stops the worker threads.
+        """
+        for executor in (self._writer_executor, self._reader_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._writer_executor = None
+        self._reader_executor = None
+
+    def _run_in_session(self, query_function: Callable[[Session], T]) -> T:
+        with self.get_new_session() as session:
+            return query_function(session)
+
+    def _run_in_transaction(self, write_function: Callable[[Session], T]) -> T:
+        with self.get_new_session() as session:
+            with session.begin():
+                return write_function(session)
+
+    def _configure_sqlite_connection(self, dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in self.SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
     def get_local_db_version(self, session: Session):
         query: Query = (session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
@@ -299,6 +299,9 @@ class MQTTCommands:
                     timeout=timeout
                 )
                 response.msg = res if res is not None else ''
+            clock = self._hb_app.clock
+            if clock is not None and clock.tick_profiling_enabled:
+                response.data = {"clock_tick_stats": clock.tick_stats.to_dict()}
         except asyncio.exceptions.TimeoutError:
             response.msg = f'Hummingbot status command timed out after {timeout} seconds'
             response.status = MQTT_STATUS_CODE.ERROR
@@ -1,8 +1,6 @@
 import time
 from decimal import Decimal
 
-import pandas_ta as ta  # noqa: F401
-
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.smart_components.executors.position_executor.data_types import PositionConfig, TrailingStop
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
@@ -11,6 +9,7 @@ from hummingbot.smart_components.strategy_frameworks.market_making.market_making
     MarketMakingControllerBase,
     MarketMakingControllerConfigBase,
 )
+from hummingbot.smart_components.utils.incremental_indicators import NATR, CandlesIndicators
 
 
 class DManV1Config(MarketMakingControllerConfigBase):
@@ -26,6 +25,8 @@ class DManV1(MarketMakingControllerBase):
     def __init__(self, config: DManV1Config):
         super().__init__(config)
         self.config = config
+        self.indicators = CandlesIndicators(indicators=[NATR(length=config.natr_length)],
+                                            max_records=config.candles_config[0].max_records)
 
     def refresh_order_condition(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
         """
@@ -56,8 +57,10 @@ class DManV1(MarketMakingControllerBase):
         """
         Gets the price and spread multiplier from the last candlestick.
         """
-        candles_df = self.candles[0].candles_df
-        natr = ta.natr(candles_df["high"], candles_df["low"], candles_df["close"], length=self.config.natr_length) / 100
+        candles = self.candles[0]
+        self.indicators.update(candles.candles_array, candles.columns)
+        candles_df = self.indicators.add_to_df(candles.candles_df)
+        natr = candles_df[f"NATR_{self.config.natr_length}"] / 100
 
         candles_df["spread_multiplier"] = natr
         candles_df["price_multiplier"] = 0.0
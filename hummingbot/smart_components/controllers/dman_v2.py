@@ -1,8 +1,6 @@
 import time
 from decimal import Decimal
 
-import pandas_ta as ta  # noqa: F401
-
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.smart_components.executors.position_executor.data_types import PositionConfig, TrailingStop
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
@@ -11,6 +9,7 @@ from hummingbot.smart_components.strategy_frameworks.market_making.market_making
     MarketMakingControllerBase,
     MarketMakingControllerConfigBase,
 )
+from hummingbot.smart_components.utils.incremental_indicators import MACD, NATR, CandlesIndicators
 
 
 class DManV2Config(MarketMakingControllerConfigBase):
@@ -29,6 +28,10 @@ class DManV2(MarketMakingControllerBase):
     def __init__(self, config: DManV2Config):
         super().__init__(config)
         self.config = config
+        self.indicators = CandlesIndicators(
+            indicators=[NATR(length=config.natr_length),
+                        MACD(fast=config.macd_fast, slow=config.macd_slow, signal=config.macd_signal)],
+            max_records=config.candles_config[0].max_records)
 
     def refresh_order_condition(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
         """
@@ -59,12 +62,12 @@ class DManV2(MarketMakingControllerBase):
         """
         Gets the price and spread multiplier from the last candlestick.
         """
-        candles_df = self.candles[0].candles_df
-        natr = ta.natr(candles_df["high"], candles_df["low"], candles_df["close"], length=self.config.natr_length) / 100
-
-        macd_output = ta.macd(candles_df["close"], fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal)
-        macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
-        macdh = macd_output[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        candles = self.candles[0]
+        self.indicators.update(candles.candles_array, candles.columns)
+        candles_df = self.indicators.add_to_df(candles.candles_df)
+        natr = candles_df[f"NATR_{self.config.natr_length}"] / 100
+        macd = candles_df[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        macdh = candles_df[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
         macd_signal = - (macd - macd.mean()) / macd.std()
         macdh_signal = macdh.apply(lambda x: 1 if x > 0 else -1)
         max_price_shift = natr / 2
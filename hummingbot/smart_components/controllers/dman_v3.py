@@ -1,8 +1,6 @@
 import time
 from decimal import Decimal
 
-import pandas_ta as ta  # noqa: F401
-
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.smart_components.executors.position_executor.data_types import PositionConfig, TrailingStop
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
@@ -11,6 +9,7 @@ from hummingbot.smart_components.strategy_frameworks.market_making.market_making
     MarketMakingControllerBase,
     MarketMakingControllerConfigBase,
 )
+from hummingbot.smart_components.utils.incremental_indicators import BollingerBands, CandlesIndicators
 
 
 class DManV3Config(MarketMakingControllerConfigBase):
@@ -33,6 +32,8 @@ class DManV3(MarketMakingControllerBase):
     def __init__(self, config: DManV3Config):
         super().__init__(config)
         self.config = config
+        self.indicators = CandlesIndicators(indicators=[BollingerBands(length=config.bb_length, std=config.bb_std)],
+                                            max_records=config.candles_config[0].max_records)
 
     def refresh_order_condition(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
         """
@@ -63,11 +64,12 @@ class DManV3(MarketMakingControllerBase):
         """
         Gets the price and spread multiplier from the last candlestick.
         """
-        candles_df = self.candles[0].candles_df
-        bbp = ta.bbands(candles_df["close"], length=self.config.bb_length, std=self.config.bb_std)
+        candles = self.candles[0]
+        self.indicators.update(candles.candles_array, candles.columns)
+        candles_df = self.indicators.add_to_df(candles.candles_df)
 
-        candles_df["price_multiplier"] = bbp[f"BBM_{self.config.bb_length}_{self.config.bb_std}"]
-        candles_df["spread_multiplier"] = bbp[f"BBB_{self.config.bb_length}_{self.config.bb_std}"] / 200
+        candles_df["price_multiplier"] = candles_df[f"BBM_{self.config.bb_length}_{self.config.bb_std}"]
+        candles_df["spread_multiplier"] = candles_df[f"BBB_{self.config.bb_length}_{self.config.bb_std}"] / 200
         return candles_df
 
     def get_position_config(self, order_level: OrderLevel) -> PositionConfig:
@@ -10,6 +10,7 @@ from hummingbot.smart_components.strategy_frameworks.directional_trading.directi
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
 )
+from hummingbot.smart_components.utils.incremental_indicators import MACD, BollingerBands, CandlesIndicators
 
 
 class MACDBBV1Config(DirectionalTradingControllerConfigBase):
@@ -32,6 +33,10 @@ class MACDBBV1(DirectionalTradingControllerBase):
     def __init__(self, config: MACDBBV1Config):
         super().__init__(config)
         self.config = config
+        self.indicators = CandlesIndicators(
+            indicators=[BollingerBands(length=config.bb_length, std=config.bb_std),
+                        MACD(fast=config.macd_fast, slow=config.macd_slow, signal=config.macd_signal)],
+            max_records=config.candles_config[0].max_records)
 
     def early_stop_condition(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
         """
@@ -50,11 +55,10 @@ class MACDBBV1(DirectionalTradingControllerBase):
         return False
 
     def get_processed_data(self) -> pd.DataFrame:
-        df = self.candles[0].candles_df
-
         # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
-        df.ta.macd(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal, append=True)
+        candles = self.candles[0]
+        self.indicators.update(candles.candles_array, candles.columns)
+        df = self.indicators.add_to_df(candles.candles_df)
         bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
         macdh = df[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
         macd = df[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
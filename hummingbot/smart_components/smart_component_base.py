@@ -1,15 +1,13 @@
 import asyncio
 from decimal import Decimal
 from enum import Enum
-from typing import List, Tuple, Union
+from typing import Dict, List, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
-    MarketEvent,
     MarketOrderFailureEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
@@ -17,6 +15,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.smart_components.smart_component_event_dispatcher import SmartComponentEventDispatcher
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
@@ -35,23 +34,7 @@ class SmartComponentBase:
         self._status: SmartComponentStatus = SmartComponentStatus.NOT_STARTED
         self._states: list = []
 
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
-
-        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
-            (MarketEvent.OrderCancelled, self._cancel_order_forwarder),
-            (MarketEvent.BuyOrderCreated, self._create_buy_order_forwarder),
-            (MarketEvent.SellOrderCreated, self._create_sell_order_forwarder),
-            (MarketEvent.OrderFilled, self._fill_order_forwarder),
-            (MarketEvent.BuyOrderCompleted, self._complete_buy_order_forwarder),
-            (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder),
-            (MarketEvent.OrderFailure, self._failed_order_forwarder),
-        ]
+        self._event_dispatchers: Dict[str, SmartComponentEventDispatcher] = {}
         self.register_events()
         self.terminated = asyncio.Event()
         safe_ensure_future(self.control_loop())
@@ -88,16 +71,16 @@ class SmartComponentBase:
         pass
 
     def register_events(self):
-        """Start listening to events from the given market."""
-        for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.add_listener(event_pair[0], event_pair[1])
+        """Start receiving the order events of the connectors through their shared event dispatchers."""
+        for connector_name, connector in self.connectors.items():
+            event_dispatcher = SmartComponentEventDispatcher.get_instance(connector)
+            event_dispatcher.register_component(self)
+            self._event_dispatchers[connector_name] = event_dispatcher
 
     def unregister_events(self):
-        """Stop listening to events from the given market."""
-        for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.remove_listener(event_pair[0], event_pair[1])
+        """Stop receiving the order events of the connectors."""
+        for event_dispatcher in self._event_dispatchers.values():
+            event_dispatcher.unregister_component(self)
 
     def place_order(self,
                     connector_name: str,
@@ -109,9 +92,12 @@ class SmartComponentBase:
                     price=Decimal("NaN"),
                     ):
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        # The events of the order are now only routed to this component
+        self._event_dispatchers[connector_name].register_order(order_id, self)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         return self.connectors[connector_name].get_price_by_type(trading_pair, price_type)
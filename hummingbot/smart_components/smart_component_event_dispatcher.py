@@ -0,0 +1,107 @@
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.smart_components.smart_component_base import SmartComponentBase
+
+
+class SmartComponentEventDispatcher:
+    """
+    Routes the order events of a connector to the smart components that placed the orders.
+
+    There is a single dispatcher per connector, listening once to the connector events. Events of orders registered
+    with `register_order` are only delivered to the component owning the order, while events of unknown orders (e.g.
+    an order whose events are triggered before `place_order` returns its id) are broadcast to every component.
+    """
+    _dispatchers: Dict[ConnectorBase, "SmartComponentEventDispatcher"] = {}
+
+    @classmethod
+    def get_instance(cls, connector: ConnectorBase) -> "SmartComponentEventDispatcher":
+        if connector not in cls._dispatchers:
+            cls._dispatchers[connector] = SmartComponentEventDispatcher(connector)
+        return cls._dispatchers[connector]
+
+    def __init__(self, connector: ConnectorBase):
+        self._connector = connector
+        # The order ids of each component, the dict keeps the components in their registration order
+        self._components: Dict["SmartComponentBase", Set[str]] = {}
+        self._order_owners: Dict[str, "SmartComponentBase"] = {}
+
+        self._create_order_forwarder = SourceInfoEventForwarder(self._process_order_created_event)
+        self._fill_order_forwarder = SourceInfoEventForwarder(self._process_order_filled_event)
+        self._complete_order_forwarder = SourceInfoEventForwarder(self._process_order_completed_event)
+        self._cancel_order_forwarder = SourceInfoEventForwarder(self._process_order_canceled_event)
+        self._failed_order_forwarder = SourceInfoEventForwarder(self._process_order_failed_event)
+
+        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
+            (MarketEvent.OrderCancelled, self._cancel_order_forwarder),
+            (MarketEvent.BuyOrderCreated, self._create_order_forwarder),
+            (MarketEvent.SellOrderCreated, self._create_order_forwarder),
+            (MarketEvent.OrderFilled, self._fill_order_forwarder),
+            (MarketEvent.BuyOrderCompleted, self._complete_order_forwarder),
+            (MarketEvent.SellOrderCompleted, self._complete_order_forwarder),
+            (MarketEvent.OrderFailure, self._failed_order_forwarder),
+        ]
+        self._listening = False
+
+    @property
+    def components(self) -> List["SmartComponentBase"]:
+        return list(self._components)
+
+    def register_component(self, component: "SmartComponentBase"):
+        self._components.setdefault(component, set())
+        if not self._listening:
+            for event, forwarder in self._event_pairs:
+                self._connector.add_listener(event, forwarder)
+            self._listening = True
+
+    def unregister_component(self, component: "SmartComponentBase"):
+        for order_id in self._components.pop(component, set()):
+            self._order_owners.pop(order_id, None)
+        if len(self._components) == 0:
+            if self._listening:
+                for event, forwarder in self._event_pairs:
+                    self._connector.remove_listener(event, forwarder)
+                self._listening = False
+            if self._dispatchers.get(self._connector) is self:
+                del self._dispatchers[self._connector]
+
+    def register_order(self, order_id: str, component: "SmartComponentBase"):
+        if order_id is not None and component in self._components:
+            self._order_owners[order_id] = component
+            self._components[component].add(order_id)
+
+    def unregister_order(self, order_id: str):
+        owner = self._order_owners.pop(order_id, None)
+        if owner is not None:
+            self._components[owner].discard(order_id)
+
+    def _event_targets(self, order_id: str) -> List["SmartComponentBase"]:
+        owner = self._order_owners.get(order_id)
+        if owner is not None:
+            return [owner]
+        # Copied because the components can unregister themselves while processing the event
+        return list(self._components)
+
+    def _process_order_created_event(self, event_tag: int, market: ConnectorBase, event):
+        for component in self._event_targets(event.order_id):
+            component.process_order_created_event(event_tag, market, event)
+
+    def _process_order_filled_event(self, event_tag: int, market: ConnectorBase, event):
+        for component in self._event_targets(event.order_id):
+            component.process_order_filled_event(event_tag, market, event)
+
+    def _process_order_completed_event(self, event_tag: int, market: ConnectorBase, event):
+        for component in self._event_targets(event.order_id):
+            component.process_order_completed_event(event_tag, market, event)
+
+    def _process_order_canceled_event(self, event_tag: int, market: ConnectorBase, event):
+        for component in self._event_targets(event.order_id):
+            component.process_order_canceled_event(event_tag, market, event)
+
+    def _process_order_failed_event(self, event_tag: int, market: ConnectorBase, event):
+        for component in self._event_targets(event.order_id):
+            component.process_order_failed_event(event_tag, market, event)
@@ -6,6 +6,7 @@ import pandas as pd
 
 from hummingbot import data_path
 from hummingbot.smart_components.strategy_frameworks.controller_base import ControllerBase
+from hummingbot.smart_components.utils.triple_barrier import TripleBarrier
 
 
 class BacktestingEngineBase:
@@ -68,21 +69,27 @@ class BacktestingEngineBase:
 
     @staticmethod
     def apply_tp_sl_on_tl(df: pd.DataFrame, tp: float, sl: float):
-        events = df[df["signal"] != 0].copy()
-        if tp > 0:
-            take_profit = tp * events["target"]
-        else:
-            take_profit = pd.Series(index=df.index)  # NaNs
-        if sl > 0:
-            stop_loss = - sl * events["target"]
-        else:
-            stop_loss = pd.Series(index=df.index)  # NaNs
-
-        for loc, tl in events["tl"].fillna(df.index[-1]).items():
-            df0 = df.close[loc:tl]  # path prices
-            df0 = (df0 / df.close[loc] - 1) * events.at[loc, "signal"]  # path returns
-            df.loc[loc, "stop_loss_time"] = df0[df0 < stop_loss[loc]].index.min()  # earliest stop loss.
-            df.loc[loc, "take_profit_time"] = df0[df0 > take_profit[loc]].index.min()  # earliest profit taking.
+        signal = df["signal"].values
+        events = np.flatnonzero(signal != 0)
+        target = df["target"].values[events].astype(float)
+        no_barrier = np.full(len(events), np.nan)
+        take_profit = tp * target if tp > 0 else no_barrier
+        stop_loss = - sl * target if sl > 0 else no_barrier
+        time_limits = df["tl"].fillna(df.index[-1]).values[events] if len(df) > 0 else df["tl"].values
+
+        take_profit_times, stop_loss_times = TripleBarrier.barrier_times(
+            timestamps=df.index.values,
+            close=df["close"].values.astype(float),
+            events=events,
+            time_limits=time_limits,
+            signal=signal[events].astype(float),
+            take_profit=take_profit,
+            stop_loss=stop_loss,
+        )
+        df["stop_loss_time"] = pd.NaT
+        df["take_profit_time"] = pd.NaT
+        df.iloc[events, df.columns.get_loc("stop_loss_time")] = stop_loss_times
+        df.iloc[events, df.columns.get_loc("take_profit_time")] = take_profit_times
         df["close_time"] = df[["tl", "take_profit_time", "stop_loss_time"]].dropna(how="all").min(axis=1)
         df["close_type"] = df[["take_profit_time", "stop_loss_time", "tl"]].dropna(how="all").idxmin(axis=1)
         df["close_type"].replace({"take_profit_time": "tp", "stop_loss_time": "sl"}, inplace=True)
@@ -96,9 +103,13 @@ class BacktestingEngineBase:
         return self.filter_df_by_time(df, start, end).copy()
 
     def run_backtesting(self, initial_portfolio_usd=1000, trade_cost=0.0006,
-                        start: Optional[str] = None, end: Optional[str] = None):
-        # Load historical candles
-        processed_data = self.get_data(start=start, end=end)
+                        start: Optional[str] = None, end: Optional[str] = None,
+                        processed_data: Optional[pd.DataFrame] = None):
+        # Load historical candles (unless the controller data was already processed, e.g. in a parameter sweep)
+        if processed_data is None:
+            processed_data = self.get_data(start=start, end=end)
+        else:
+            processed_data = self.filter_df_by_time(processed_data, start, end).copy()
 
         # Apply the specific execution logic of the executor handler vectorized
         executors_df = self.simulate_execution(processed_data, initial_portfolio_usd=initial_portfolio_usd, trade_cost=trade_cost)
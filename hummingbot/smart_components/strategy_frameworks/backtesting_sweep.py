@@ -0,0 +1,187 @@
+import itertools
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.smart_components.strategy_frameworks.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.smart_components.strategy_frameworks.controller_base import ControllerBase, ControllerConfigBase
+
+ORDER_LEVELS_PREFIX = "order_levels."
+
+# State of each worker process, set by the pool initializer
+_worker_candles: Dict[Tuple[str, str], np.ndarray] = {}
+_worker_processed_data: Dict[str, pd.DataFrame] = {}
+
+
+def _init_worker(candles_files: Dict[Tuple[str, str], str]):
+    """
+    Opens the candles shared by the parent process as read-only memory-mapped arrays, so the pages are shared between
+    the workers through the OS page cache instead of being pickled for every task.
+    """
+    _worker_candles.clear()
+    _worker_processed_data.clear()
+    for key, file_path in candles_files.items():
+        _worker_candles[key] = np.load(file_path, mmap_mode="r")
+
+
+def _run_backtesting_task(engine_class: Type[BacktestingEngineBase],
+                          controller_class: Type[ControllerBase],
+                          config: ControllerConfigBase,
+                          backtesting_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    controller = controller_class(config=config)
+    # The processed data only depends on the parameters that are not related with the order levels
+    processing_key = config.json(exclude={"order_levels"})
+    processed_data = _worker_processed_data.get(processing_key)
+    if processed_data is None:
+        for candle in controller.candles:
+            values = _worker_candles[(candle.name, candle.interval)]
+            candle.load_candles_from_df(pd.DataFrame(np.array(values), columns=candle.columns))
+        processed_data = controller.get_processed_data()
+        _worker_processed_data[processing_key] = processed_data
+    engine = engine_class(controller)
+    backtesting_results = engine.run_backtesting(processed_data=processed_data, **backtesting_kwargs)
+    return backtesting_results["results"]
+
+
+class BacktestingSweep:
+    """
+    Runs the backtesting of a controller for every combination of a parameter grid in a pool of processes.
+    The candles are loaded once in the parent process and shared with the workers as memory-mapped arrays. Each
+    worker caches the processed data of the controller, so the candles are only processed again when a parameter
+    that is not related with the order levels changes.
+    """
+
+    def __init__(self,
+                 engine_class: Type[BacktestingEngineBase],
+                 controller_class: Type[ControllerBase],
+                 base_config: ControllerConfigBase,
+                 data_path: str = data_path(),
+                 max_workers: Optional[int] = None):
+        """
+        :param engine_class: The backtesting engine class (e.g. DirectionalTradingBacktestingEngine).
+        :param controller_class: The controller class to backtest.
+        :param base_config: The controller config used for the parameters that are not part of the grid.
+        :param data_path: Path of the directory with the candles CSV files.
+        :param max_workers: Number of worker processes (defaults to the number of CPUs).
+        """
+        self.engine_class = engine_class
+        self.controller_class = controller_class
+        self.base_config = base_config
+        self.data_path = data_path
+        self.max_workers = max_workers
+
+    @staticmethod
+    def get_param_combinations(param_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Expands the parameter grid into the list of all the combinations.
+
+        :param param_grid: Dictionary with the values to test for each parameter.
+        :return: List of dictionaries with one value for each parameter.
+        """
+        keys = list(param_grid.keys())
+        return [dict(zip(keys, values)) for values in itertools.product(*[param_grid[key] for key in keys])]
+
+    @staticmethod
+    def _set_parameter(config_dict: Dict[str, Any], path: List[str], value: Any):
+        for key in path[:-1]:
+            config_dict = config_dict[key]
+        config_dict[path[-1]] = value
+
+    def get_config(self, params: Dict[str, Any]) -> ControllerConfigBase:
+        """
+        Builds the controller config of a combination of parameters. The parameters are attributes of the config,
+        or paths prefixed by "order_levels." (e.g. "order_levels.triple_barrier_conf.take_profit") that are applied
+        to all the order levels.
+
+        :param params: Dictionary with the value of each parameter.
+        :return: The controller config.
+        """
+        config_dict = self.base_config.dict(exclude_none=True)
+        for key, value in params.items():
+            if key.startswith(ORDER_LEVELS_PREFIX):
+                for order_level in config_dict["order_levels"]:
+                    self._set_parameter(order_level, key[len(ORDER_LEVELS_PREFIX):].split("."), value)
+            else:
+                self._set_parameter(config_dict, key.split("."), value)
+        return type(self.base_config)(**config_dict)
+
+    def dump_candles(self, directory: str) -> Dict[Tuple[str, str], str]:
+        """
+        Loads the candles of the base config and saves them as numpy files to be memory-mapped by the workers.
+
+        :param directory: Directory where the files are saved.
+        :return: Dictionary with the file path of each (candle name, interval).
+        """
+        controller = self.controller_class(config=self.base_config)
+        controller.load_historical_data(data_path=self.data_path)
+        candles_files = {}
+        for candle in controller.candles:
+            file_path = os.path.join(directory, f"candles_{candle.name}_{candle.interval}.npy")
+            np.save(file_path, candle.candles_df.values.astype(float))
+            candles_files[(candle.name, candle.interval)] = file_path
+        return candles_files
+
+    @staticmethod
+    def format_results(params: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+        row = dict(params)
+        for metric, value in results.items():
+            if metric == "close_types":
+                if isinstance(value, pd.Series):
+                    row.update({f"close_type_{close_type}": count for close_type, count in value.items()})
+            else:
+                row[metric] = value
+        return row
+
+    def run(self,
+            param_grid: Dict[str, List[Any]],
+            initial_portfolio_usd: float = 1000,
+            trade_cost: float = 0.0006,
+            start: Optional[str] = None,
+            end: Optional[str] = None,
+            progress_callback: Optional[Callable[[int, int], None]] = None) -> pd.DataFrame:
+        """
+        Runs the backtesting for all the combinations of the parameter grid.
+
+        :param param_grid: Dictionary with the values to test for each parameter.
+        :param initial_portfolio_usd: Initial portfolio of each backtesting.
+        :param trade_cost: Trade cost of each backtesting.
+        :param start: Start date of the backtesting (%Y-%m-%d).
+        :param end: End date of the backtesting (%Y-%m-%d).
+        :param progress_callback: Function called with the number of completed and total backtests.
+        :return: DataFrame with the parameters and the summarized results of each combination.
+        """
+        combinations = self.get_param_combinations(param_grid)
+        configs = [self.get_config(params) for params in combinations]
+        # Group the combinations that share the processed data, so the workers can reuse it
+        order = sorted(range(len(configs)), key=lambda i: configs[i].json(exclude={"order_levels"}))
+        backtesting_kwargs = {
+            "initial_portfolio_usd": initial_portfolio_usd,
+            "trade_cost": trade_cost,
+            "start": start,
+            "end": end,
+        }
+        rows: List[Optional[Dict[str, Any]]] = [None] * len(configs)
+        with tempfile.TemporaryDirectory() as directory:
+            candles_files = self.dump_candles(directory)
+            with ProcessPoolExecutor(max_workers=self.max_workers,
+                                     initializer=_init_worker,
+                                     initargs=(candles_files,)) as executor:
+                futures = {
+                    executor.submit(_run_backtesting_task, self.engine_class, self.controller_class, configs[i],
+                                    backtesting_kwargs): i
+                    for i in order
+                }
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    i = futures[future]
+                    rows[i] = self.format_results(combinations[i], future.result())
+                    if progress_callback is not None:
+                        progress_callback(completed, len(configs))
+        results_df = pd.DataFrame(rows)
+        close_type_columns = [column for column in results_df.columns if column.startswith("close_type_")]
+        results_df[close_type_columns] = results_df[close_type_columns].fillna(0)
+        return results_df
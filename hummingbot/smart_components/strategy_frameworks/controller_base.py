@@ -36,6 +36,8 @@ class ControllerBase(ABC):
         self._excluded_parameters = excluded_parameters or ["order_levels", "candles_config"]
         self.candles = self.initialize_candles(config.candles_config)
         self.close_price_trading_pair = config.close_price_trading_pair or config.trading_pair
+        self._processed_data = None
+        self._processed_data_version = None
 
     def get_processed_data(self):
         """
@@ -43,6 +45,24 @@ class ControllerBase(ABC):
         """
         pass
 
+    @property
+    def candles_version(self) -> tuple:
+        """
+        Version of all the candles used by the controller, it changes every time a candle is added or updated.
+        """
+        return tuple(candle.candles_version for candle in self.candles)
+
+    def get_cached_processed_data(self):
+        """
+        Get the processed data, computing it again only if the candles have changed since the last call.
+        The returned data is shared between the callers and must not be modified.
+        """
+        candles_version = self.candles_version
+        if self._processed_data is None or self._processed_data_version != candles_version:
+            self._processed_data = self.get_processed_data()
+            self._processed_data_version = candles_version
+        return self._processed_data
+
     def filter_executors_df(self, df):
         """
         In case that you are running the multiple controllers in the same script, you should implement this method
@@ -104,9 +124,17 @@ class ControllerBase(ABC):
         for candle in self.candles:
             candle.start()
 
-    def load_historical_data(self, data_path: str):
+    def load_historical_data(self, data_path: str, start_time: Optional[float] = None,
+                             end_time: Optional[float] = None):
+        """
+        Loads the historical candles from the local candles store, or from the CSV files if they are not in the store.
+        The time range is only applied to the candles loaded from the store.
+        """
         for candle in self.candles:
-            candle.load_candles_from_csv(data_path)
+            if candle.get_candles_store(data_path).exists(candle.name, candle.interval):
+                candle.load_candles_from_store(data_path, start_time=start_time, end_time=end_time)
+            else:
+                candle.load_candles_from_csv(data_path)
 
     def stop(self) -> None:
         """
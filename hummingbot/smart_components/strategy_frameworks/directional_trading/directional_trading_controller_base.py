@@ -47,11 +47,11 @@ class DirectionalTradingControllerBase(ControllerBase):
         return "perpetual" in self.config.exchange
 
     def get_signal(self):
-        df = self.get_processed_data()
+        df = self.get_cached_processed_data()
         return df["signal"].iloc[-1]
 
     def get_spread_multiplier(self):
-        df = self.get_processed_data()
+        df = self.get_cached_processed_data()
         if "target" in df.columns:
             return Decimal(df["target"].iloc[-1])
         else:
@@ -109,7 +109,7 @@ class DirectionalTradingControllerBase(ControllerBase):
     def to_format_status(self) -> list:
         lines = super().to_format_status()
         columns_to_show = ["timestamp", "open", "low", "high", "close", "volume", "signal"] + self.extra_columns_to_show()
-        df = self.get_processed_data()
+        df = self.get_cached_processed_data()
         prices_str = format_df_for_printout(df[columns_to_show].tail(4), table_format="psql")
         lines.extend([f"{prices_str}"])
         return lines
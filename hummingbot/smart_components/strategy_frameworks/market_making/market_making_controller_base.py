@@ -30,7 +30,7 @@ class MarketMakingControllerBase(ControllerBase):
         """
         Gets the price and spread multiplier from the last candlestick.
         """
-        candles_df = self.get_processed_data()
+        candles_df = self.get_cached_processed_data()
         return Decimal(candles_df["price_multiplier"].iloc[-1]), Decimal(candles_df["spread_multiplier"].iloc[-1])
 
     def update_strategy_markets_dict(self, markets_dict: dict[str, Set] = {}):
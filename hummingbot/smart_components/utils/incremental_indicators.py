@@ -0,0 +1,504 @@
+import math
+import sys
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+class ExponentialMovingAverage:
+    """
+    Streaming EMA with the same definition as pandas_ta ema: the first value is the SMA of the first `length` values
+    and then it is updated with alpha = 2 / (length + 1). NaN values are skipped.
+    The SMA can be taken over a different number of values with `sma_length`.
+    """
+
+    def __init__(self, length: int, sma_length: Optional[int] = None):
+        self.length = length
+        self.sma_length = sma_length or length
+        self.alpha = 2 / (length + 1)
+        self.reset()
+
+    def reset(self):
+        self._count = 0
+        self._seed_sum = 0.0
+        self._last = math.nan
+
+    def value(self, x: float) -> float:
+        """
+        Returns the value of the EMA if x is added, without changing the state.
+        """
+        if math.isnan(x):
+            return math.nan
+        count = self._count + 1
+        if count < self.sma_length:
+            return math.nan
+        if count == self.sma_length:
+            return (self._seed_sum + x) / self.sma_length
+        return self.alpha * x + (1 - self.alpha) * self._last
+
+    def commit(self, x: float):
+        if math.isnan(x):
+            return
+        value = self.value(x)
+        self._count += 1
+        if self._count <= self.sma_length:
+            self._seed_sum += x
+        self._last = value
+
+    def seed(self, values: np.ndarray) -> np.ndarray:
+        """
+        Commits all the values with vectorized operations.
+        :return: the EMA after each value
+        """
+        self.reset()
+        result = np.full(len(values), np.nan)
+        is_valid = ~np.isnan(values)
+        valid_values = values[is_valid]
+        self._count = len(valid_values)
+        self._seed_sum = float(np.sum(valid_values[:self.sma_length]))
+        if len(valid_values) >= self.sma_length:
+            series = valid_values.copy()
+            series[:self.sma_length - 1] = np.nan
+            series[self.sma_length - 1] = self._seed_sum / self.sma_length
+            ema = pd.Series(series).ewm(span=self.length, adjust=False).mean().values
+            result[is_valid] = ema
+            self._last = float(ema[-1])
+        return result
+
+
+class RunningMovingAverage:
+    """
+    Streaming exponentially weighted mean with the same definition as pandas_ta rma
+    (pandas ewm with alpha = 1 / length, adjust=True and min_periods = length). NaN values are skipped.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 1 / length
+        self.reset()
+
+    def reset(self):
+        self._count = 0
+        self._numerator = 0.0
+        self._denominator = 0.0
+
+    def value(self, x: float) -> float:
+        if math.isnan(x) or self._count + 1 < self.length:
+            return math.nan
+        decay = 1 - self.alpha
+        return (x + decay * self._numerator) / (1 + decay * self._denominator)
+
+    def commit(self, x: float):
+        if math.isnan(x):
+            return
+        decay = 1 - self.alpha
+        self._count += 1
+        self._numerator = x + decay * self._numerator
+        self._denominator = 1 + decay * self._denominator
+
+    def seed(self, values: np.ndarray) -> np.ndarray:
+        self.reset()
+        is_valid = ~np.isnan(values)
+        valid_values = values[is_valid]
+        result = np.full(len(values), np.nan)
+        if len(valid_values) == 0:
+            return result
+        mean = pd.Series(valid_values).ewm(alpha=self.alpha, adjust=True).mean().values
+        decay = 1 - self.alpha
+        self._count = len(valid_values)
+        self._denominator = (1 - decay ** self._count) / self.alpha
+        self._numerator = float(mean[-1]) * self._denominator
+        mean[:self.length - 1] = np.nan
+        result[is_valid] = mean
+        return result
+
+
+class RollingWindow:
+    """
+    Streaming rolling mean and standard deviation over the last `length` values, kept as running sums.
+    The sums are recalculated from the window every `length` values to avoid accumulating rounding errors.
+    """
+
+    def __init__(self, length: int, ddof: int = 0):
+        self.length = length
+        self.ddof = ddof
+        self.reset()
+
+    def reset(self):
+        self._window: Deque[float] = deque(maxlen=max(self.length - 1, 0))
+        self._sum = 0.0
+        self._sum_squares = 0.0
+        self._commits_since_recalculation = 0
+
+    def value(self, x: float) -> Tuple[float, float]:
+        """
+        :return: mean and standard deviation of the window if x is added
+        """
+        if math.isnan(x) or len(self._window) + 1 < self.length:
+            return math.nan, math.nan
+        total = self._sum + x
+        mean = total / self.length
+        if self.length - self.ddof <= 0:
+            return mean, math.nan
+        variance = (self._sum_squares + x * x - total * mean) / (self.length - self.ddof)
+        return mean, math.sqrt(max(variance, 0.0))
+
+    def commit(self, x: float):
+        if math.isnan(x) or self._window.maxlen == 0:
+            return
+        if len(self._window) == self._window.maxlen:
+            oldest = self._window[0]
+            self._sum -= oldest
+            self._sum_squares -= oldest * oldest
+        self._window.append(x)
+        self._sum += x
+        self._sum_squares += x * x
+        self._commits_since_recalculation += 1
+        if self._commits_since_recalculation >= self.length:
+            self._recalculate()
+
+    def _recalculate(self):
+        window = np.array(self._window)
+        self._sum = float(np.sum(window))
+        self._sum_squares = float(np.sum(window * window))
+        self._commits_since_recalculation = 0
+
+    def seed(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        self.reset()
+        is_valid = ~np.isnan(values)
+        valid_values = values[is_valid]
+        mean = np.full(len(values), np.nan)
+        std = np.full(len(values), np.nan)
+        rolling = pd.Series(valid_values).rolling(self.length)
+        mean[is_valid] = rolling.mean().values
+        std[is_valid] = rolling.std(ddof=self.ddof).values
+        if self._window.maxlen > 0:
+            self._window.extend(valid_values[-self._window.maxlen:].tolist())
+        self._recalculate()
+        return mean, std
+
+
+def non_zero_range(high: float, low: float) -> float:
+    """
+    Same as pandas_ta non_zero_range: adds epsilon to the range if it is zero to avoid divisions by zero.
+    """
+    difference = high - low
+    return difference + sys.float_info.epsilon if difference == 0 else difference
+
+
+class IncrementalIndicator(ABC):
+    """
+    Base class of the incremental indicators.
+    The state of an indicator contains all the committed candles. The last candle is not committed until a newer
+    candle arrives, so it can be amended (e.g. a candle that is still open) recalculating its value in O(1).
+    """
+    input_columns: List[str] = ["close"]
+
+    @property
+    @abstractmethod
+    def output_columns(self) -> List[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def reset(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def value(self, candle: Dict[str, float]) -> List[float]:
+        """
+        Calculates the values of the indicator for a candle that follows the committed candles, without changing the
+        state.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def commit(self, candle: Dict[str, float]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def seed(self, candles: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Resets the indicator and commits all the candles with vectorized operations.
+        :param candles: dictionary with an array for each of the input columns
+        :return: array with the values of the indicator for each candle (one column per output column)
+        """
+        raise NotImplementedError
+
+
+class BollingerBands(IncrementalIndicator):
+    """
+    Bollinger Bands with the pandas_ta bbands columns: BBL, BBM, BBU, BBB (bandwidth) and BBP (percent).
+    """
+
+    def __init__(self, length: int = 5, std: float = 2.0):
+        self.length = length
+        self.std = float(std)
+        self._window = RollingWindow(length=length, ddof=0)
+
+    @property
+    def output_columns(self) -> List[str]:
+        suffix = f"_{self.length}_{self.std}"
+        return [f"{name}{suffix}" for name in ["BBL", "BBM", "BBU", "BBB", "BBP"]]
+
+    def reset(self):
+        self._window.reset()
+
+    def value(self, candle: Dict[str, float]) -> List[float]:
+        close = candle["close"]
+        mid, std_dev = self._window.value(close)
+        lower = mid - self.std * std_dev
+        upper = mid + self.std * std_dev
+        upper_lower_range = non_zero_range(upper, lower)
+        return [lower, mid, upper, 100 * upper_lower_range / mid, non_zero_range(close, lower) / upper_lower_range]
+
+    def commit(self, candle: Dict[str, float]):
+        self._window.commit(candle["close"])
+
+    def seed(self, candles: Dict[str, np.ndarray]) -> np.ndarray:
+        close = candles["close"]
+        mid, std_dev = self._window.seed(close)
+        lower = mid - self.std * std_dev
+        upper = mid + self.std * std_dev
+        upper_lower_range = np.where(upper - lower == 0, sys.float_info.epsilon, upper - lower)
+        close_lower_range = np.where(close - lower == 0, sys.float_info.epsilon, close - lower)
+        return np.column_stack([lower, mid, upper, 100 * upper_lower_range / mid,
+                                close_lower_range / upper_lower_range])
+
+
+class MACD(IncrementalIndicator):
+    """
+    MACD with the pandas_ta macd columns: MACD, MACDh (histogram) and MACDs (signal).
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self._fast_ema = ExponentialMovingAverage(fast)
+        self._slow_ema = ExponentialMovingAverage(slow)
+        self._signal_ema = ExponentialMovingAverage(signal)
+
+    @property
+    def output_columns(self) -> List[str]:
+        suffix = f"_{self.fast}_{self.slow}_{self.signal}"
+        return [f"{name}{suffix}" for name in ["MACD", "MACDh", "MACDs"]]
+
+    def reset(self):
+        self._fast_ema.reset()
+        self._slow_ema.reset()
+        self._signal_ema.reset()
+
+    def _macd(self, close: float) -> float:
+        return self._fast_ema.value(close) - self._slow_ema.value(close)
+
+    def value(self, candle: Dict[str, float]) -> List[float]:
+        macd = self._macd(candle["close"])
+        signal = self._signal_ema.value(macd)
+        return [macd, macd - signal, signal]
+
+    def commit(self, candle: Dict[str, float]):
+        macd = self._macd(candle["close"])
+        self._fast_ema.commit(candle["close"])
+        self._slow_ema.commit(candle["close"])
+        self._signal_ema.commit(macd)
+
+    def seed(self, candles: Dict[str, np.ndarray]) -> np.ndarray:
+        close = candles["close"]
+        macd = self._fast_ema.seed(close) - self._slow_ema.seed(close)
+        signal = self._signal_ema.seed(macd)
+        return np.column_stack([macd, macd - signal, signal])
+
+
+class RSI(IncrementalIndicator):
+    """
+    RSI with the pandas_ta rsi column (RSI), using running moving averages of the gains and losses.
+    """
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self._positive_rma = RunningMovingAverage(length)
+        self._negative_rma = RunningMovingAverage(length)
+        self._previous_close = math.nan
+
+    @property
+    def output_columns(self) -> List[str]:
+        return [f"RSI_{self.length}"]
+
+    def reset(self):
+        self._positive_rma.reset()
+        self._negative_rma.reset()
+        self._previous_close = math.nan
+
+    def _changes(self, close: float) -> Tuple[float, float]:
+        change = close - self._previous_close
+        return (max(change, 0.0), min(change, 0.0)) if not math.isnan(change) else (math.nan, math.nan)
+
+    @staticmethod
+    def _rsi(positive_average, negative_average):
+        return 100 * positive_average / (positive_average + abs(negative_average))
+
+    def value(self, candle: Dict[str, float]) -> List[float]:
+        positive, negative = self._changes(candle["close"])
+        return [self._rsi(self._positive_rma.value(positive), self._negative_rma.value(negative))]
+
+    def commit(self, candle: Dict[str, float]):
+        positive, negative = self._changes(candle["close"])
+        self._positive_rma.commit(positive)
+        self._negative_rma.commit(negative)
+        self._previous_close = candle["close"]
+
+    def seed(self, candles: Dict[str, np.ndarray]) -> np.ndarray:
+        close = candles["close"]
+        change = np.diff(close, prepend=np.nan)
+        positive_average = self._positive_rma.seed(np.where(change < 0, 0.0, change))
+        negative_average = self._negative_rma.seed(np.where(change > 0, 0.0, change))
+        self._previous_close = float(close[-1]) if len(close) > 0 else math.nan
+        return np.column_stack([100 * positive_average / (positive_average + np.abs(negative_average))])
+
+
+class NATR(IncrementalIndicator):
+    """
+    Normalized ATR with the pandas_ta natr column (NATR): 100 * EMA(true range) / close.
+    As in pandas_ta, the EMA is seeded with the SMA of the first `length` candles, and the true range of the first
+    candle is missing, so the SMA is taken over `length - 1` true ranges.
+    """
+    input_columns = ["high", "low", "close"]
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self._ema = ExponentialMovingAverage(length, sma_length=max(length - 1, 1))
+        self._previous_close = math.nan
+
+    @property
+    def output_columns(self) -> List[str]:
+        return [f"NATR_{self.length}"]
+
+    def reset(self):
+        self._ema.reset()
+        self._previous_close = math.nan
+
+    def _true_range(self, candle: Dict[str, float]) -> float:
+        if math.isnan(self._previous_close):
+            return math.nan
+        return max(abs(non_zero_range(candle["high"], candle["low"])),
+                   abs(candle["high"] - self._previous_close),
+                   abs(self._previous_close - candle["low"]))
+
+    def value(self, candle: Dict[str, float]) -> List[float]:
+        return [100 * self._ema.value(self._true_range(candle)) / candle["close"]]
+
+    def commit(self, candle: Dict[str, float]):
+        self._ema.commit(self._true_range(candle))
+        self._previous_close = candle["close"]
+
+    def seed(self, candles: Dict[str, np.ndarray]) -> np.ndarray:
+        high, low, close = candles["high"], candles["low"], candles["close"]
+        previous_close = np.concatenate([[np.nan], close[:-1]])
+        high_low_range = np.where(high - low == 0, sys.float_info.epsilon, high - low)
+        true_range = np.fmax(np.abs(high_low_range),
+                             np.fmax(np.abs(high - previous_close), np.abs(previous_close - low)))
+        if len(true_range) > 0:
+            true_range[0] = np.nan
+        atr = self._ema.seed(true_range)
+        self._previous_close = float(close[-1]) if len(close) > 0 else math.nan
+        return np.column_stack([100 * atr / close])
+
+
+class CandlesIndicators:
+    """
+    Keeps the values of a set of incremental indicators for the candles of a candles feed.
+    The indicators are seeded once from the history with vectorized operations, and then each update only processes
+    the amended last candle and the new candles (O(1) per candle instead of recalculating the whole window).
+    The values are exposed with the same column names as pandas_ta, so they can be added to the candles DataFrame.
+    """
+
+    def __init__(self, indicators: List[IncrementalIndicator], max_records: int):
+        """
+        :param indicators: the indicators to calculate
+        :param max_records: number of values kept (usually the max_records of the candles feed)
+        """
+        self.indicators = indicators
+        self.output_columns: List[str] = [column for indicator in indicators for column in indicator.output_columns]
+        self._values = CandlesRingBuffer(maxlen=max_records, n_columns=len(self.output_columns))
+        self._pending_timestamp: Optional[float] = None
+        self._pending_candle: Optional[Dict[str, float]] = None
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Values of the indicators for the last candles (one column per output column, oldest first).
+        """
+        return self._values.values
+
+    def _candle_values(self, candle: Dict[str, float]) -> List[float]:
+        return [value for indicator in self.indicators for value in indicator.value(candle)]
+
+    def reset(self):
+        for indicator in self.indicators:
+            indicator.reset()
+        self._values.clear()
+        self._pending_timestamp = None
+        self._pending_candle = None
+
+    def seed(self, candles: np.ndarray, columns: List[str]):
+        """
+        Calculates the indicators for all the candles. The last candle is kept as pending, so it can be amended.
+        """
+        self.reset()
+        if len(candles) == 0:
+            return
+        history = {column: candles[:-1, i] for i, column in enumerate(columns)}
+        if len(candles) > 1:
+            self._values.extend(np.column_stack([indicator.seed(history) for indicator in self.indicators]))
+        self._set_pending(candles[-1], columns)
+        self._values.append(self._candle_values(self._pending_candle))
+
+    def _set_pending(self, candle: np.ndarray, columns: List[str]):
+        self._pending_candle = dict(zip(columns, candle.tolist()))
+        self._pending_timestamp = self._pending_candle["timestamp"]
+
+    def update(self, candles: np.ndarray, columns: List[str]):
+        """
+        Updates the indicators with the candles of the feed (sorted by timestamp). Only the candles from the pending
+        one are processed. If the pending candle is no longer in the candles (e.g. the feed was restarted) the
+        indicators are seeded again.
+        :param candles: array with the candles
+        :param columns: names of the columns of the candles
+        """
+        if len(candles) == 0:
+            return
+        timestamp_index = columns.index("timestamp")
+        timestamps = candles[:, timestamp_index]
+        if (self._pending_timestamp is None or timestamps[0] > self._pending_timestamp or
+                timestamps[-1] < self._pending_timestamp):
+            self.seed(candles, columns)
+            return
+        start = int(np.searchsorted(timestamps, self._pending_timestamp, side="left"))
+        if timestamps[start] != self._pending_timestamp:
+            self.seed(candles, columns)
+            return
+        for candle in candles[start:]:
+            if candle[timestamp_index] == self._pending_timestamp:
+                self._set_pending(candle, columns)
+                self._values[-1] = self._candle_values(self._pending_candle)
+            else:
+                for indicator in self.indicators:
+                    indicator.commit(self._pending_candle)
+                self._set_pending(candle, columns)
+                self._values.append(self._candle_values(self._pending_candle))
+
+    def add_to_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adds the columns of the indicators to the candles DataFrame, aligned with its last rows.
+        """
+        values = self.values[-len(df):] if len(df) > 0 else self.values[:0]
+        padding = np.full((len(df) - len(values), len(self.output_columns)), np.nan)
+        values = np.concatenate([padding, values])
+        for i, column in enumerate(self.output_columns):
+            df[column] = values[:, i]
+        return df
@@ -0,0 +1,144 @@
+from typing import List, Tuple
+
+import numpy as np
+
+
+class RangeExtremaTable:
+    """
+    Sparse table with the maximum and minimum of every window of 2^k consecutive values (k = 0..max_level).
+    It is used to locate the first value in a range that crosses a threshold with a binary search over the window
+    sizes, instead of walking the range value by value.
+    """
+
+    def __init__(self, values: np.ndarray, max_window: int):
+        """
+        :param values: the series of values (NaNs are ignored)
+        :param max_window: the size of the biggest range that will be queried
+        """
+        self.values = values
+        self.levels = max(int(max_window), 1).bit_length() - 1
+        self.max_tables: List[np.ndarray] = [values]
+        self.min_tables: List[np.ndarray] = [values]
+        for level in range(1, self.levels + 1):
+            half = 1 << (level - 1)
+            previous_max = self.max_tables[-1]
+            previous_min = self.min_tables[-1]
+            self.max_tables.append(np.fmax(previous_max[:-half], previous_max[half:]))
+            self.min_tables.append(np.fmin(previous_min[:-half], previous_min[half:]))
+
+
+class TripleBarrier:
+    """
+    Vectorized implementation of the triple barrier method used by the backtesting engines.
+    """
+
+    @classmethod
+    def first_hit_positions(cls,
+                            close: np.ndarray,
+                            start: np.ndarray,
+                            end: np.ndarray,
+                            signal: np.ndarray,
+                            threshold: np.ndarray,
+                            upper: bool,
+                            table: RangeExtremaTable = None) -> np.ndarray:
+        """
+        For each event, finds the first position j in [start, end] where the path return
+        (close[j] / close[start] - 1) * signal is above (upper=True) or below (upper=False) the threshold.
+
+        The path return is a monotonic function of the close price, so the extreme return of a window is the return of
+        the window max (or min) close price. That allows to skip windows of 2^k prices without a hit, from the biggest
+        to the smallest, which finds the first hit in O(log(window)) vectorized steps.
+
+        :param close: array of close prices
+        :param start: position of each event
+        :param end: last position (inclusive) of the path of each event
+        :param signal: signal of each event (the sign defines the direction of the position)
+        :param threshold: return threshold of each event (NaN to disable the barrier)
+        :param upper: True to look for returns above the threshold, False to look for returns below it
+        :param table: optional precomputed RangeExtremaTable for the close prices
+        :return: array with the position of the first hit of each event, or -1 if the barrier was not hit
+        """
+        if len(start) == 0:
+            return np.empty(0, dtype=np.int64)
+        if table is None:
+            table = RangeExtremaTable(close, max_window=int(np.max(end - start)) + 1)
+        entry_price = close[start]
+        # Windows to inspect when looking for the max return (use the max close when the signal is positive)
+        use_max = (signal > 0) if upper else ~(signal > 0)
+        position = start.copy()
+        for level in range(table.levels, -1, -1):
+            window = 1 << level
+            max_table = table.max_tables[level]
+            min_table = table.min_tables[level]
+            in_range = position + window - 1 <= end
+            safe_position = np.where(in_range, position, 0)
+            extreme_price = np.where(use_max, max_table[safe_position], min_table[safe_position])
+            extreme_return = (extreme_price / entry_price - 1) * signal
+            hit = extreme_return > threshold if upper else extreme_return < threshold
+            position = np.where(in_range & ~hit, position + window, position)
+        return np.where(position <= end, position, -1)
+
+    @classmethod
+    def barrier_times(cls,
+                      timestamps: np.ndarray,
+                      close: np.ndarray,
+                      events: np.ndarray,
+                      time_limits: np.ndarray,
+                      signal: np.ndarray,
+                      take_profit: np.ndarray,
+                      stop_loss: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the take profit and stop loss hit times for all the events in one pass.
+
+        :param timestamps: sorted datetime64 index of the prices
+        :param close: array of close prices
+        :param events: positions of the events
+        :param time_limits: datetime64 time limit of each event
+        :param signal: signal of each event
+        :param take_profit: take profit return threshold of each event (NaN if disabled)
+        :param stop_loss: stop loss return threshold of each event, as a negative return (NaN if disabled)
+        :return: take profit times and stop loss times of each event (NaT if the barrier was not hit)
+        """
+        end = np.searchsorted(timestamps, time_limits, side="right") - 1
+        if len(events) > 0:
+            table = RangeExtremaTable(close, max_window=int(np.max(end - events, initial=0)) + 1)
+        else:
+            table = None
+        take_profit_positions = cls.first_hit_positions(
+            close=close, start=events, end=end, signal=signal, threshold=take_profit, upper=True, table=table)
+        stop_loss_positions = cls.first_hit_positions(
+            close=close, start=events, end=end, signal=signal, threshold=stop_loss, upper=False, table=table)
+        take_profit_times = np.where(take_profit_positions >= 0, timestamps[take_profit_positions],
+                                     np.datetime64("NaT"))
+        stop_loss_times = np.where(stop_loss_positions >= 0, timestamps[stop_loss_positions], np.datetime64("NaT"))
+        return take_profit_times, stop_loss_times
+
+    @classmethod
+    def cooldown_filter(cls,
+                        timestamps: np.ndarray,
+                        close_times: np.ndarray,
+                        cooldown: np.timedelta64,
+                        last_close_time: np.datetime64) -> np.ndarray:
+        """
+        Selects the events that can be executed when only one position is allowed at a time: an event is accepted if it
+        starts at least `cooldown` after the close time of the previously accepted event.
+        The next candidate of every event is found with a single searchsorted call, so only the accepted events are
+        visited when following the chain.
+
+        :param timestamps: sorted datetime64 start time of each event
+        :param close_times: datetime64 close time of each event
+        :param cooldown: time to wait after a position is closed
+        :param last_close_time: close time of the last position executed before the first event
+        :return: positions of the accepted events
+        """
+        if len(timestamps) == 0:
+            return np.empty(0, dtype=np.int64)
+        next_candidates = np.searchsorted(timestamps, close_times + cooldown, side="left")
+        # A position can't block events that start before it
+        next_candidates = np.maximum(next_candidates, np.arange(1, len(timestamps) + 1))
+        accepted = []
+        position = int(np.searchsorted(timestamps, last_close_time + cooldown, side="left"))
+        while position < len(timestamps):
+            accepted.append(position)
+            position = int(next_candidates[position])
+        return np.array(accepted, dtype=np.int64)
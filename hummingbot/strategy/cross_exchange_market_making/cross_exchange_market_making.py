@@ -363,6 +363,17 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         super().start(clock, timestamp)
         self._last_timestamp = timestamp
 
+    def enable_taker_depth_indexes(self):
+        """
+        Enables the depth index of the taker order books, which are queried for VWAP and price for volume several
+        times per tick. Checked every tick since the connectors may replace their order books.
+        """
+        for market_pair in self._market_pairs.values():
+            if not self.is_gateway_market(market_pair.taker):
+                order_book = market_pair.taker.order_book
+                if not order_book.depth_index_enabled:
+                    order_book.enable_depth_index()
+
     def tick(self, timestamp: float):
         """
         Clock tick entry point.
@@ -415,6 +426,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         if self._gateway_quotes_task is None or self._gateway_quotes_task.done():
             self._gateway_quotes_task = safe_ensure_future(self.get_gateway_quotes())
 
+        self.enable_taker_depth_indexes()
+
         if self.ready_for_new_trades():
             if self._main_task is None or self._main_task.done():
                 self._main_task = safe_ensure_future(self.main(timestamp))
@@ -0,0 +1,71 @@
+"""
+Measures the ticks per second of a paper trade exchange holding M resting limit orders on each of N trading pairs.
+
+Each tick applies an order book diff to every trading pair, either deeper in the book (the limit orders crossing
+checks are skipped) or moving the best prices (every trading pair is checked again).
+
+    python -m scripts.benchmarks.benchmark_paper_trade_exchange_tick --pairs 50 --orders 20
+"""
+import argparse
+import time
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+def create_exchange(pairs_count: int, orders_count: int) -> MockPaperExchange:
+    exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    for pair_index in range(pairs_count):
+        trading_pair = f"COIN{pair_index}-HBOT"
+        exchange.set_balanced_order_book(trading_pair=trading_pair, mid_price=100, min_price=50, max_price=150,
+                                         price_step_size=1, volume_step_size=10)
+        exchange.set_balance(f"COIN{pair_index}", Decimal("1e9"))
+        exchange.set_balance("HBOT", Decimal("1e12"))
+        # A grid of resting orders on both sides, none of them crossing the book
+        for order_index in range(orders_count // 2):
+            exchange.buy(trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(str(95 - order_index * 0.1)))
+            exchange.sell(trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(str(105 + order_index * 0.1)))
+    return exchange
+
+
+def run(pairs_count: int, orders_count: int, ticks_count: int, move_best_prices: bool) -> float:
+    exchange = create_exchange(pairs_count, orders_count)
+    clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=0, end_time=ticks_count)
+    clock.add_iterator(exchange)
+    clock.backtest_til(1)
+    order_books = list(exchange.order_books.values())
+
+    elapsed = 0
+    for tick in range(2, ticks_count + 2):
+        for order_book in order_books:
+            if move_best_prices:
+                # Alternates the best bid between 99.5 and 99.6
+                order_book.apply_diffs([OrderBookRow(99.6, tick % 2, tick)], [], tick)
+            else:
+                order_book.apply_diffs([OrderBookRow(90.5, tick % 2 + 1, tick)], [], tick)
+        start = time.perf_counter()
+        clock.backtest_til(tick)
+        elapsed += time.perf_counter() - start
+    return ticks_count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=50)
+    parser.add_argument("--orders", type=int, default=20)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    for move_best_prices in (False, True):
+        ticks_per_second = run(args.pairs, args.orders, args.ticks, move_best_prices)
+        best_prices = "moving" if move_best_prices else "unchanged"
+        print(f"{args.pairs} pairs x {args.orders} orders, best prices {best_prices}: {ticks_per_second:,.0f} ticks/s")
+
+
+if __name__ == "__main__":
+    main()
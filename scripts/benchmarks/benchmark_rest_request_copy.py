@@ -0,0 +1,44 @@
+"""
+Measures the time taken to copy a signed REST request with RESTRequest.shallow_copy, which the REST assistant does on
+every call, against copy.deepcopy.
+
+    python -m scripts.benchmarks.benchmark_rest_request_copy --copies 100000
+"""
+import argparse
+import timeit
+from copy import deepcopy
+
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+
+
+def create_request() -> RESTRequest:
+    return RESTRequest(
+        method=RESTMethod.GET,
+        url="https://www.test.com/url",
+        params={"symbol": "BTCUSDT", "orderId": "123456789", "timestamp": 1640000000000},
+        headers={"Content-Type": "application/x-www-form-urlencoded", "X-MBX-APIKEY": "someKey"},
+        is_auth_required=True,
+        throttler_limit_id="limit_id",
+    )
+
+
+def run(copies_count: int, use_deepcopy: bool) -> float:
+    request = create_request()
+    copy_function = (lambda: deepcopy(request)) if use_deepcopy else request.shallow_copy
+    elapsed = min(timeit.repeat(copy_function, number=copies_count, repeat=3))
+    return copies_count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, default=100000)
+    args = parser.parse_args()
+
+    for use_deepcopy in (False, True):
+        copies_per_second = run(args.copies, use_deepcopy)
+        copy_name = "deepcopy" if use_deepcopy else "shallow_copy"
+        print(f"{copy_name}: {copies_per_second:,.0f} copies/s")
+
+
+if __name__ == "__main__":
+    main()
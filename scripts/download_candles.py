@@ -12,7 +12,8 @@ class DownloadCandles(ScriptStrategyBase):
     """
     This script provides an example of how to use the Candles Feed to download and store historical data.
     It downloads 3-minute candles for 3 Binance trading pairs ["APE-USDT", "BTC-USDT", "BNB-USDT"] and stores them in
-    CSV files in the /data directory. The script stops after it has downloaded 50,000 max_records records for each pair.
+    CSV files in the /data directory. The candles are also appended to the local candles store (only the candles that
+    are not stored yet), which can be range-queried by the backtests without loading the whole file. The script stops after it has downloaded 50,000 max_records records for each pair.
     Is important to notice that the component will fail if all the candles are not available since the idea of it is to
     use it in production based on candles needed to compute technical indicators.
     """
@@ -53,6 +54,7 @@ class DownloadCandles(ScriptStrategyBase):
             else:
                 df = candles_info["candles"].candles_df
                 df.to_csv(candles_info["csv_path"], index=False)
+                candles_info["candles"].save_candles_to_store(data_path())
         if all(candles_info["candles"].is_ready for candles_info in self.candles.values()):
             HummingbotApplication.main_application().stop()
 
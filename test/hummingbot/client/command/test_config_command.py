@@ -86,6 +86,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | gateway                           |                      |\n"
                            "    | ∟ gateway_api_host                | localhost            |\n"
                            "    | ∟ gateway_api_port                | 15888                |\n"
+                           "    | ∟ gateway_quote_cache_ttl         | 2.0                  |\n"
                            "    | rate_oracle_source                | binance              |\n"
                            "    | global_token                      |                      |\n"
                            "    | ∟ global_token_name               | USDT                 |\n"
@@ -96,10 +97,21 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ other_commands_timeout          | 30                   |\n"
                            "    | tables_format                     | psql                 |\n"
                            "    | tick_size                         | 1.0                  |\n"
+                           "    | connectors_tick_interval          | 0                    |\n"
+                           "    | clock_profiling                   |                      |\n"
+                           "    | ∟ tick_profiling_enabled          | False                |\n"
+                           "    | ∟ slow_tick_warning_threshold     | 0                    |\n"
                            "    | market_data_collection            |                      |\n"
                            "    | ∟ market_data_collection_enabled  | True                 |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | ∟ market_data_recording_enabled   | False                |\n"
+                           "    | ∟ market_data_recording_interval  | 1.0                  |\n"
+                           "    | markets_recorder                  |                      |\n"
+                           "    | ∟ write_behind_enabled            | False                |\n"
+                           "    | ∟ write_behind_flush_interval     | 1.0                  |\n"
+                           "    | ∟ write_behind_batch_size         | 100                  |\n"
+                           "    | json_codec                        | json                 |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
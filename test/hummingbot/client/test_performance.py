@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import MarketPerformanceAccumulator, PerformanceMetrics
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
@@ -341,3 +341,67 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         performance_metric = PerformanceMetrics()
         returned_impact = performance_metric._process_deducted_fees_impact_in_quote_vol(dummy_trade)
         self.assertEqual(returned_impact, Decimal("-100.0"))
+
+    def trade_fill(self, order_id, trade_type, price, amount, position=PositionAction.NIL.value, trade_fee=None):
+        trade_fee = trade_fee or AddedToCostTradeFee(percent=Decimal("0.01"),
+                                                     flat_fees=[TokenAmount("BNB", Decimal("0.1"))])
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market="binance",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=int(time.time()),
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"{order_id}-{price}-{amount}",
+            position=position,
+        )
+
+    def assert_accumulator_metrics_equal_trades_metrics(self, trades):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        accumulator = MarketPerformanceAccumulator(trading_pair)
+        for trade in trades:
+            accumulator.add_trade_fill(trade)
+
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+        metrics = self.async_run_with_timeout(PerformanceMetrics.create_from_accumulator(accumulator, cur_bals))
+
+        for field in ("num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base",
+                      "b_vol_quote", "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price",
+                      "start_base_bal", "start_quote_bal", "start_price", "cur_price", "hold_value", "cur_value",
+                      "trade_pnl", "fee_in_quote", "total_pnl", "return_pct"):
+            self.assertEqual(getattr(expected, field), getattr(metrics, field), field)
+        self.assertEqual(dict(expected.fees), dict(metrics.fees))
+
+    def test_accumulator_metrics_for_spot_trades(self):
+        self.assert_accumulator_metrics_equal_trades_metrics([
+            self.trade_fill("someId0", "BUY", Decimal("100"), Decimal("10")),
+            self.trade_fill("someId1", "SELL", Decimal("120"), Decimal("15"),
+                            trade_fee=DeductedFromReturnsTradeFee(percent=Decimal("0.001"))),
+            self.trade_fill("someId1", "SELL", Decimal("121"), Decimal("5"),
+                            trade_fee=DeductedFromReturnsTradeFee(percent=Decimal("0.001"))),
+        ])
+
+    def test_accumulator_metrics_for_derivatives_trades(self):
+        # Only flat fees, PerformanceMetrics.create calculates the percent fees after aggregating the orders fills
+        trade_fee = AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.1"))])
+        self.assert_accumulator_metrics_equal_trades_metrics([
+            self.trade_fill("order1", "BUY", Decimal("10"), Decimal("60"), PositionAction.OPEN.value, trade_fee),
+            self.trade_fill("order2", "SELL", Decimal("20"), Decimal("100"), PositionAction.OPEN.value, trade_fee),
+            self.trade_fill("order1", "BUY", Decimal("11"), Decimal("40"), PositionAction.OPEN.value, trade_fee),
+            self.trade_fill("order3", "SELL", Decimal("15"), Decimal("50"), PositionAction.CLOSE.value, trade_fee),
+            self.trade_fill("order4", "BUY", Decimal("15"), Decimal("100"), PositionAction.CLOSE.value, trade_fee),
+            # A second fill of an already paired close order changes the position PnL
+            self.trade_fill("order3", "SELL", Decimal("16"), Decimal("50"), PositionAction.CLOSE.value, trade_fee),
+            # Not closed yet
+            self.trade_fill("order5", "BUY", Decimal("12"), Decimal("10"), PositionAction.OPEN.value, trade_fee),
+        ])
@@ -0,0 +1,108 @@
+import asyncio
+import time
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import MagicMock
+
+from hummingbot.client.performance_tracker import PerformanceTracker
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.trade_fill import TradeFill
+
+trading_pair = "HBOT-USDT"
+base, quote = trading_pair.split("-")
+
+
+class PerformanceTrackerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.market = MagicMock(spec=ConnectorBase)
+        self.market.display_name = "binance"
+        self.tracker = PerformanceTracker([self.market])
+        self.trade_fee = AddedToCostTradeFee(percent=Decimal("0.01"))
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def trade_fill(self, order_id: str, trade_type: TradeType, price: Decimal, amount: Decimal) -> TradeFill:
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market="binance",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=int(time.time() * 1e3),
+            order_id=order_id,
+            trade_type=trade_type.name,
+            order_type=OrderType.LIMIT.name,
+            price=price,
+            amount=amount,
+            trade_fee=self.trade_fee.to_json(),
+            exchange_trade_id=f"trade-{order_id}",
+            position=PositionAction.NIL.value,
+        )
+
+    def fill_event(self, order_id: str, trade_type: TradeType, price: Decimal, amount: Decimal) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=time.time(),
+            order_id=order_id,
+            trading_pair=trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=price,
+            amount=amount,
+            trade_fee=self.trade_fee,
+            exchange_trade_id=f"trade-{order_id}",
+        )
+
+    def test_start_and_stop_listen_to_fills(self):
+        self.tracker.start()
+        self.market.add_listener.assert_called_once_with(MarketEvent.OrderFilled, self.tracker._fill_order_forwarder)
+
+        self.tracker.stop()
+        self.market.remove_listener.assert_called_once_with(
+            MarketEvent.OrderFilled, self.tracker._fill_order_forwarder)
+
+    def test_seeded_trades_and_fill_events_are_aggregated_once(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices[trading_pair] = Decimal("110")
+        RateOracle._shared_instance = rate_oracle
+
+        self.tracker.add_trade_fills([self.trade_fill("OID1", TradeType.BUY, Decimal("100"), Decimal("10"))])
+        # The fill event of a trade already read from the database
+        self.tracker._did_fill_order(MarketEvent.OrderFilled.value,
+                                     self.market,
+                                     self.fill_event("OID1", TradeType.BUY, Decimal("100"), Decimal("10")))
+        self.tracker._did_fill_order(MarketEvent.OrderFilled.value,
+                                     self.market,
+                                     self.fill_event("OID2", TradeType.SELL, Decimal("120"), Decimal("4")))
+
+        self.assertEqual(2, self.tracker.trades_count)
+        self.assertEqual([("binance", trading_pair)], self.tracker.market_trading_pairs)
+
+        metrics = self.async_run_with_timeout(self.tracker.performance_metrics(
+            "binance", trading_pair, {base: Decimal("6"), quote: Decimal("520")}))
+
+        self.assertEqual(1, metrics.num_buys)
+        self.assertEqual(1, metrics.num_sells)
+        self.assertEqual(Decimal("6"), metrics.tot_vol_base)
+        self.assertEqual(Decimal("-520"), metrics.tot_vol_quote)
+        self.assertEqual(Decimal("0"), metrics.start_base_bal)
+        self.assertEqual(Decimal("1040"), metrics.start_quote_bal)
+        self.assertEqual(Decimal("100"), metrics.start_price)
+        self.assertEqual(Decimal("140"), metrics.trade_pnl)
+        self.assertEqual(Decimal("14.8"), metrics.fee_in_quote)
+        self.assertEqual(Decimal("125.2"), metrics.total_pnl)
@@ -215,6 +215,25 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             "Subscribed to public order book and trade channels..."
         ))
 
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_decodes_messages_and_skips_invalid_ones(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message="invalid message")
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self._trade_update_event()))
+
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        trade_messages = self.data_source._message_queue[self.data_source._trade_messages_queue_key]
+        self.assertEqual(1, trade_messages.qsize())
+        self.assertEqual(self._trade_update_event(), trade_messages.get_nowait())
+        self.assertTrue(self._is_logged(
+            "WARNING", "Invalid message received from the order book stream: invalid message"))
+
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     @patch("aiohttp.ClientSession.ws_connect")
     def test_listen_for_subscriptions_raises_cancel_exception(self, mock_ws, _: AsyncMock):
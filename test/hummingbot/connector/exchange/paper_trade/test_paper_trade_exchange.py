@@ -1,3 +1,5 @@
+import math
+from decimal import Decimal
 from unittest import TestCase
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -5,7 +7,12 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.time_iterator import TimeIterator
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -29,3 +36,94 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+    def test_next_event_timestamp_depends_on_open_orders(self):
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange.set_balanced_order_book(
+            trading_pair="COINALPHA-HBOT",
+            mid_price=100,
+            min_price=50,
+            max_price=150,
+            price_step_size=1,
+            volume_step_size=10,
+        )
+        exchange.set_balance("HBOT", Decimal("1000"))
+
+        self.assertTrue(math.isinf(exchange.next_event_timestamp()))
+
+        order_id = exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("60"))
+        self.assertTrue(math.isnan(exchange.next_event_timestamp()))
+
+        exchange.cancel("COINALPHA-HBOT", order_id)
+        self.assertTrue(math.isinf(exchange.next_event_timestamp()))
+
+    def test_orders_placed_after_idle_fast_forward_period_use_clock_time(self):
+        exchange = self._crossing_test_exchange()
+        clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=1000, end_time=2000, fast_forward=True)
+        clock.add_iterator(exchange)
+        # Stands for the strategy, ticked every tick
+        clock.add_iterator(TimeIterator())
+
+        clock.backtest_til(1500)
+        self.assertEqual(1500, exchange.current_timestamp)
+
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("60"))
+        self.assertEqual(int(1500 * 1e6), exchange.limit_orders[0].creation_timestamp)
+
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.MARKET)
+        clock.backtest_til(1500 + exchange.TRADE_EXECUTION_DELAY - 1)
+        self.assertEqual(Decimal("10"), exchange.get_balance("COINALPHA"))
+        clock.backtest_til(1500 + exchange.TRADE_EXECUTION_DELAY)
+        self.assertEqual(Decimal("11"), exchange.get_balance("COINALPHA"))
+
+    def _crossing_test_exchange(self) -> MockPaperExchange:
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange.set_balanced_order_book(
+            trading_pair="COINALPHA-HBOT",
+            mid_price=100,
+            min_price=50,
+            max_price=150,
+            price_step_size=1,
+            volume_step_size=10,
+        )
+        exchange.set_balance("HBOT", Decimal("1000"))
+        exchange.set_balance("COINALPHA", Decimal("10"))
+        return exchange
+
+    def test_limit_orders_fill_when_the_best_price_crosses_them(self):
+        exchange = self._crossing_test_exchange()
+        clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=0, end_time=10)
+        clock.add_iterator(exchange)
+
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        exchange.sell("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("102"))
+        clock.backtest_til(1)
+        self.assertEqual(2, len(exchange.limit_orders))
+
+        order_book = exchange.get_order_book("COINALPHA-HBOT")
+        # A change deeper in the book does not cross the orders
+        order_book.apply_diffs([], [OrderBookRow(103.5, 1, 2)], 2)
+        clock.backtest_til(2)
+        self.assertEqual(2, len(exchange.limit_orders))
+
+        order_book.apply_diffs([], [OrderBookRow(98.5, 1, 3)], 3)
+        clock.backtest_til(3)
+        self.assertEqual(1, len(exchange.limit_orders))
+        self.assertFalse(exchange.limit_orders[0].is_buy)
+
+    def test_new_limit_orders_are_checked_without_best_price_changes(self):
+        exchange = self._crossing_test_exchange()
+        clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=0, end_time=10)
+        clock.add_iterator(exchange)
+
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        exchange.sell("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("102"))
+        clock.backtest_til(1)
+        self.assertEqual(2, len(exchange.limit_orders))
+
+        # Both orders cross the unchanged book
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("101"))
+        exchange.sell("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        clock.backtest_til(2)
+
+        self.assertEqual([Decimal("99"), Decimal("102")], [order.price for order in exchange.limit_orders])
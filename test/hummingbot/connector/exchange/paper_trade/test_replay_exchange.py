@@ -0,0 +1,218 @@
+import gzip
+import json
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest import TestCase
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.replay_data_feed import (
+    ReplayDataFeed,
+    read_json_objects,
+    read_order_book_snapshots,
+    read_trades,
+)
+from hummingbot.connector.exchange.paper_trade.replay_exchange import ReplayExchange
+from hummingbot.connector.market_data_recorder import MarketDataRecorder
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
+
+
+class ReplayExchangeTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1640000000.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.snapshots_file_path = Path(self.temp_dir.name) / "snapshots.txt"
+        self.trades_file_path = Path(self.temp_dir.name) / "trades.txt"
+        self.write_json_lines(self.snapshots_file_path, [
+            {"ts": self.start_timestamp, "bids": [[99, 1], [98, 2]], "asks": [[101, 1], [102, 2]]},
+            {"ts": self.start_timestamp + 10, "bids": [[97, 1]], "asks": [[103, 1]]},
+        ])
+        self.write_json_lines(self.trades_file_path, [
+            {"ts": self.start_timestamp + 5, "price": 95, "q_base": 3, "side": "sell"},
+            {"ts": self.start_timestamp + 10, "price": 104, "q_base": 1, "side": "buy"},
+        ])
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def write_json_lines(file_path: Path, json_objects: List[Dict[str, Any]]):
+        with open(file_path, "w") as file:
+            file.write("\n".join(json.dumps(json_object) for json_object in json_objects))
+
+    def create_exchange(self) -> ReplayExchange:
+        data_feed = ReplayDataFeed.from_recording_files(
+            trading_pair=self.trading_pair,
+            snapshots_file_path=self.snapshots_file_path,
+            trades_file_path=self.trades_file_path,
+        )
+        exchange = ReplayExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            data_feed=data_feed,
+            trading_pairs=[self.trading_pair],
+            exchange_name="binance",
+        )
+        exchange.set_balance("COINALPHA", Decimal("10"))
+        exchange.set_balance("HBOT", Decimal("1000"))
+        return exchange
+
+    def test_read_json_objects_accepts_concatenated_dumps(self):
+        file_path = Path(self.temp_dir.name) / "concatenated.txt"
+        with open(file_path, "w") as file:
+            file.write('{"ts": 1}\n{"ts": 2}{"ts": 3}\n\n{"ts": 4}')
+
+        self.assertEqual([1, 2, 3, 4], [json_object["ts"] for json_object in read_json_objects(file_path)])
+
+    def test_read_gzip_compressed_recordings(self):
+        file_path = Path(self.temp_dir.name) / "trades.txt.gz"
+        with gzip.open(file_path, "wt") as file:
+            file.write(json.dumps({"ts": self.start_timestamp, "price": 100, "q_base": 2, "side": "sell"}))
+
+        trades = list(read_trades(file_path, self.trading_pair))
+
+        self.assertEqual(1, len(trades))
+        self.assertEqual(OrderBookMessageType.TRADE, trades[0].type)
+        self.assertEqual(float(TradeType.SELL.value), trades[0].content["trade_type"])
+        self.assertEqual(2, trades[0].content["amount"])
+
+    def test_data_feed_merges_messages_in_timestamp_order(self):
+        data_feed = ReplayDataFeed([
+            read_order_book_snapshots(self.snapshots_file_path, self.trading_pair),
+            read_trades(self.trades_file_path, self.trading_pair),
+        ])
+
+        self.assertEqual(self.start_timestamp, data_feed.next_timestamp)
+        messages = list(data_feed.messages_until(self.start_timestamp + 10))
+
+        self.assertEqual(
+            [OrderBookMessageType.SNAPSHOT, OrderBookMessageType.TRADE,
+             OrderBookMessageType.SNAPSHOT, OrderBookMessageType.TRADE],
+            [message.type for message in messages])
+        self.assertEqual(
+            [self.start_timestamp, self.start_timestamp + 5, self.start_timestamp + 10, self.start_timestamp + 10],
+            [message.timestamp for message in messages])
+        self.assertTrue(data_feed.exhausted)
+        self.assertEqual(float("inf"), data_feed.next_timestamp)
+
+    def test_data_feed_from_market_data_files(self):
+        recorder = MarketDataRecorder(directory=self.temp_dir.name,
+                                      exchange="binance",
+                                      trading_pairs=[self.trading_pair, "ETH-USDT"],
+                                      rotation_interval=5)
+        recorder.record_order_book_levels(self.trading_pair, self.start_timestamp,
+                                          np.array([[99, 1], [98, 2]]), np.array([[101, 1], [102, 2]]))
+        recorder.record_trade(OrderBookTradeEvent(trading_pair=self.trading_pair,
+                                                  timestamp=self.start_timestamp + 5,
+                                                  type=TradeType.SELL,
+                                                  price=95,
+                                                  amount=3))
+        recorder.record_order_book_levels(self.trading_pair, self.start_timestamp + 10,
+                                          np.array([[97, 1]]), np.array([[103, 1]]))
+        recorder.record_order_book_levels("ETH-USDT", self.start_timestamp + 7,
+                                          np.array([[1999, 1]]), np.array([[2001, 1]]))
+        recorder.stop()
+        file_paths = [file_path for file_paths in recorder.file_paths.values() for file_path in file_paths]
+        self.assertEqual(3, len(file_paths))
+
+        data_feed = ReplayDataFeed.from_market_data_files(reversed(file_paths))
+        messages = list(data_feed.messages_until(self.start_timestamp + 10))
+
+        self.assertEqual(
+            [(self.start_timestamp, self.trading_pair, OrderBookMessageType.SNAPSHOT),
+             (self.start_timestamp + 5, self.trading_pair, OrderBookMessageType.TRADE),
+             (self.start_timestamp + 7, "ETH-USDT", OrderBookMessageType.SNAPSHOT),
+             (self.start_timestamp + 10, self.trading_pair, OrderBookMessageType.SNAPSHOT)],
+            [(message.timestamp, message.trading_pair, message.type) for message in messages])
+        self.assertEqual([[97, 1]], [[row.price, row.amount] for row in messages[-1].bids])
+        self.assertTrue(data_feed.exhausted)
+
+    def test_order_book_tracker_is_ready_without_network(self):
+        exchange = self.create_exchange()
+        tracker = exchange.order_book_tracker
+
+        tracker.start()
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual([self.trading_pair], tracker.ready_trading_pairs)
+        self.assertEqual([self.trading_pair], list(tracker.order_books.keys()))
+        self.assertEqual(0, tracker.pending_messages_count(self.trading_pair))
+        self.assertIsNone(tracker._order_book_stream_listener_task)
+        self.assertTrue(exchange.ready)
+
+    def test_replay_updates_order_books(self):
+        exchange = self.create_exchange()
+        clock = Clock(
+            ClockMode.BACKTEST, tick_size=1, start_time=self.start_timestamp, end_time=self.start_timestamp + 5
+        )
+        clock.add_iterator(exchange)
+
+        clock.backtest_til(self.start_timestamp + 5)
+
+        order_book = exchange.get_order_book(self.trading_pair)
+        self.assertEqual([99, 98], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([101, 102], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(95, order_book.last_trade_price)
+
+        clock.backtest_til(self.start_timestamp + 10)
+
+        self.assertEqual([97], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([103], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(104, order_book.last_trade_price)
+
+    def test_recorded_trades_fill_limit_orders(self):
+        exchange = self.create_exchange()
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        clock = Clock(
+            ClockMode.BACKTEST, tick_size=1, start_time=self.start_timestamp, end_time=self.start_timestamp + 20
+        )
+        clock.add_iterator(exchange)
+
+        clock.backtest_til(self.start_timestamp)
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("96"))
+        clock.backtest_til(self.start_timestamp + 4)
+        self.assertEqual(0, len(fill_logger.event_log))
+
+        clock.backtest_til(self.start_timestamp + 5)
+
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(Decimal("96"), fill_logger.event_log[0].price)
+        self.assertEqual(Decimal("1"), fill_logger.event_log[0].amount)
+        self.assertEqual(0, len(exchange.limit_orders))
+
+    def test_clock_stops_at_end_of_data(self):
+        exchange = self.create_exchange()
+        clock = Clock(
+            ClockMode.BACKTEST, tick_size=1, start_time=self.start_timestamp, end_time=self.start_timestamp + 100
+        )
+        clock.add_iterator(exchange)
+
+        clock.backtest()
+
+        self.assertTrue(exchange.data_feed.exhausted)
+        self.assertEqual(self.start_timestamp + 11, clock.current_timestamp)
+
+    def test_fast_forward_jumps_to_recorded_events(self):
+        exchange = self.create_exchange()
+        clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=self.start_timestamp,
+                      end_time=self.start_timestamp + 100, fast_forward=True, tick_profiling_enabled=True)
+        clock.add_iterator(exchange)
+
+        clock.backtest()
+
+        self.assertTrue(exchange.data_feed.exhausted)
+        self.assertEqual(104, exchange.get_order_book(self.trading_pair).last_trade_price)
+        # Ticks at the three distinct event timestamps, then one more tick to stop at the end of the data
+        self.assertEqual(3, clock.tick_stats.ticks_stats.ticks)
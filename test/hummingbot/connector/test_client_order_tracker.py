@@ -1091,3 +1091,119 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def test_fetch_order_by_exchange_order_id_assigned_after_start_tracking(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id.get("someExchangeOrderId"))
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id.get("someExchangeOrderId"))
+
+    def test_orders_by_exchange_order_id_views_follow_order_transitions(self):
+        self.tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=0)
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.assertEqual({"someExchangeOrderId": order}, dict(self.tracker.all_updatable_orders_by_exchange_order_id))
+
+        self.async_run_with_timeout(self.tracker.process_order_not_found(order.client_order_id))
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker.fetch_lost_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIn("someExchangeOrderId", self.tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertIn("someExchangeOrderId", self.tracker.all_updatable_orders_by_exchange_order_id)
+
+        order_cancelation_update: OrderUpdate = OrderUpdate(
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.CANCELED,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update=order_cancelation_update))
+
+        self.assertIsNone(self.tracker.fetch_lost_order(exchange_order_id="someExchangeOrderId"))
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertEqual(0, len(self.tracker.all_updatable_orders_by_exchange_order_id))
+
+    def test_cached_order_not_updatable_by_exchange_order_id(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id["someExchangeOrderId"])
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_updatable_orders_by_exchange_order_id)
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.CACHED_ORDER_TTL", 0.1)
+    def test_expired_cached_order_not_found_by_exchange_order_id(self):
+        tracker = ClientOrderTracker(self.connector)
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
+        self.assertIsNone(tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertNotIn("someExchangeOrderId", tracker.all_fillable_orders_by_exchange_order_id)
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.MAX_CACHE_SIZE", 2)
+    def test_exchange_order_id_index_prunes_untracked_orders(self):
+        tracker = ClientOrderTracker(self.connector)
+        for i in range(20):
+            order: InFlightOrder = InFlightOrder(
+                client_order_id=f"someClientOrderId_{i}",
+                exchange_order_id=f"someExchangeOrderId_{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+            )
+            tracker.start_tracking_order(order)
+            tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertLessEqual(len(tracker._orders_by_exchange_order_id), 2 * (tracker.MAX_CACHE_SIZE + 1))
+        self.assertIsNone(tracker.fetch_order(exchange_order_id="someExchangeOrderId_0"))
+        self.assertIsNotNone(tracker.fetch_order(exchange_order_id="someExchangeOrderId_19"))
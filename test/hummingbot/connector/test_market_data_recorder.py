@@ -0,0 +1,210 @@
+import tempfile
+import unittest
+from typing import List
+
+import numpy as np
+
+from hummingbot.connector.market_data_recorder import (
+    ORDER_BOOK_DIFFS_BLOCK,
+    ORDER_BOOK_KEYFRAME_BLOCK,
+    TRADES_BLOCK,
+    MarketDataReader,
+    MarketDataRecorder,
+    get_block_codec,
+    levels_diff,
+)
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+class MarketDataRecorderTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1640000000.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def create_recorder(self, **kwargs) -> MarketDataRecorder:
+        return MarketDataRecorder(
+            directory=self.temp_dir.name, exchange="binance", trading_pairs=[self.trading_pair], **kwargs
+        )
+
+    @staticmethod
+    def levels(rows: List[List[float]]) -> np.ndarray:
+        return np.array(rows, dtype=np.float64).reshape(-1, 2)
+
+    def trade(self, timestamp: float, price: float, amount: float, trade_type: TradeType) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(
+            trading_pair=self.trading_pair, timestamp=timestamp, type=trade_type, price=price, amount=amount
+        )
+
+    def record_books(self, recorder: MarketDataRecorder):
+        recorder.record_order_book_levels(
+            self.trading_pair, self.start_timestamp,
+            self.levels([[99, 1], [98, 2]]), self.levels([[101, 1], [102, 2]]))
+        recorder.record_trade(self.trade(self.start_timestamp + 1, 101, 0.5, TradeType.BUY))
+        recorder.record_order_book_levels(
+            self.trading_pair, self.start_timestamp + 2,
+            self.levels([[99, 3], [98, 2]]), self.levels([[101, 0.5], [103, 1]]))
+        recorder.record_order_book_levels(
+            self.trading_pair, self.start_timestamp + 4,
+            self.levels([[98, 2]]), self.levels([[101, 0.5], [103, 1]]))
+
+    def test_levels_diff(self):
+        diff = levels_diff(self.levels([[99, 1], [98, 2], [97, 1]]), self.levels([[100, 1], [99, 1], [98, 3]]))
+
+        self.assertEqual([[100, 1], [98, 3], [97, 0]], diff.tolist())
+        self.assertEqual([[99, 1]], levels_diff(self.levels([]), self.levels([[99, 1]])).tolist())
+        self.assertEqual([[99, 0]], levels_diff(self.levels([[99, 1]]), self.levels([])).tolist())
+
+    def test_get_block_codec(self):
+        self.assertEqual("none", get_block_codec("none").name)
+        with self.assertRaises(ValueError):
+            get_block_codec("snappy")
+
+    def test_compressed_blocks_round_trip(self):
+        for codec in ("zstd", "lz4"):
+            try:
+                recorder = self.create_recorder(codec=codec)
+            except ImportError:
+                continue
+            with self.subTest(codec=codec):
+                self.record_books(recorder)
+                recorder.stop()
+                reader = MarketDataReader(recorder.file_paths[self.trading_pair])
+                self.assertEqual([[98, 2]], reader.order_book_at(self.start_timestamp + 4)[0].tolist())
+
+    def test_record_keyframe_then_diffs(self):
+        recorder = self.create_recorder(keyframe_interval=60)
+        self.record_books(recorder)
+        recorder.flush()
+
+        reader = MarketDataReader(recorder.file_paths[self.trading_pair])
+
+        self.assertEqual(self.trading_pair, reader.trading_pair)
+        self.assertEqual(
+            [TRADES_BLOCK, ORDER_BOOK_KEYFRAME_BLOCK, ORDER_BOOK_DIFFS_BLOCK],
+            [block_header.block_type for block_header in reader.block_headers])
+        # Only the changed levels are recorded after the keyframe
+        diffs_header = reader.block_headers[2]
+        self.assertEqual(5, diffs_header.records_count)
+        self.assertEqual(self.start_timestamp + 2, diffs_header.first_timestamp)
+        self.assertEqual(self.start_timestamp + 4, diffs_header.last_timestamp)
+
+    def test_order_book_at_timestamp(self):
+        recorder = self.create_recorder()
+        self.record_books(recorder)
+        recorder.flush()
+        reader = MarketDataReader(recorder.file_paths[self.trading_pair])
+
+        bids, asks = reader.order_book_at(self.start_timestamp + 1)
+        self.assertEqual([[99, 1], [98, 2]], bids.tolist())
+        self.assertEqual([[101, 1], [102, 2]], asks.tolist())
+
+        bids, asks = reader.order_book_at(self.start_timestamp + 3)
+        self.assertEqual([[99, 3], [98, 2]], bids.tolist())
+        self.assertEqual([[101, 0.5], [103, 1]], asks.tolist())
+
+        bids, asks = reader.order_book_at(self.start_timestamp + 10)
+        self.assertEqual([[98, 2]], bids.tolist())
+        self.assertEqual([[101, 0.5], [103, 1]], asks.tolist())
+
+        bids, asks = reader.order_book_at(self.start_timestamp - 1)
+        self.assertEqual(0, len(bids))
+        self.assertEqual(0, len(asks))
+
+    def test_read_trades(self):
+        recorder = self.create_recorder()
+        self.record_books(recorder)
+        recorder.record_trade(self.trade(self.start_timestamp + 5, 98, 1, TradeType.SELL))
+        recorder.flush()
+        reader = MarketDataReader(recorder.file_paths[self.trading_pair])
+
+        trades = reader.trades()
+        self.assertEqual([self.start_timestamp + 1, self.start_timestamp + 5], trades["timestamp"].tolist())
+        self.assertEqual([TradeType.BUY.value, TradeType.SELL.value], trades["side"].tolist())
+        self.assertEqual([101, 98], trades["price"].tolist())
+        self.assertEqual([0.5, 1], trades["amount"].tolist())
+        self.assertEqual(1, len(reader.trades(start_timestamp=self.start_timestamp + 2)))
+
+    def test_keyframes_are_recorded_periodically(self):
+        recorder = self.create_recorder(keyframe_interval=3)
+        self.record_books(recorder)
+        recorder.flush()
+        reader = MarketDataReader(recorder.file_paths[self.trading_pair])
+
+        self.assertEqual(
+            [TRADES_BLOCK, ORDER_BOOK_KEYFRAME_BLOCK, ORDER_BOOK_DIFFS_BLOCK, ORDER_BOOK_KEYFRAME_BLOCK],
+            [block_header.block_type for block_header in reader.block_headers])
+        self.assertEqual([[98, 2]], reader.order_book_at(self.start_timestamp + 4)[0].tolist())
+
+    def test_files_rotation(self):
+        recorder = self.create_recorder(rotation_interval=3)
+        self.record_books(recorder)
+        recorder.flush()
+        recorder.record_order_book_levels(
+            self.trading_pair, self.start_timestamp + 7, self.levels([[97, 1]]), self.levels([[104, 1]]))
+        recorder.stop()
+
+        file_paths = recorder.file_paths[self.trading_pair]
+        self.assertEqual(3, len(file_paths))
+        for file_path in file_paths:
+            # Each file can be read on its own
+            block_types = [block_header.block_type for block_header in MarketDataReader([file_path]).block_headers]
+            self.assertIn(ORDER_BOOK_KEYFRAME_BLOCK, block_types)
+
+        reader = MarketDataReader(file_paths)
+        self.assertEqual([[99, 3], [98, 2]], reader.order_book_at(self.start_timestamp + 3)[0].tolist())
+        self.assertEqual([[98, 2]], reader.order_book_at(self.start_timestamp + 5)[0].tolist())
+        self.assertEqual([[97, 1]], reader.order_book_at(self.start_timestamp + 7)[0].tolist())
+
+    def test_files_rotation_by_size(self):
+        recorder = self.create_recorder(max_file_size=1)
+        self.record_books(recorder)
+        recorder.flush()
+        self.record_books(recorder)
+        recorder.stop()
+
+        self.assertEqual(2, len(recorder.file_paths[self.trading_pair]))
+
+    def test_background_writer(self):
+        recorder = self.create_recorder(flush_interval=0.01)
+        recorder.start()
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        recorder.subscribe_to_order_book(order_book)
+
+        recorder.record_order_book(self.trading_pair, self.start_timestamp, order_book, depth=10)
+        order_book.apply_trade(self.trade(self.start_timestamp + 1, 101, 0.5, TradeType.BUY))
+        recorder.stop()
+
+        reader = MarketDataReader(recorder.file_paths[self.trading_pair])
+        self.assertEqual([[99, 1]], reader.order_book_at(self.start_timestamp)[0].tolist())
+        self.assertEqual([101], reader.trades()["price"].tolist())
+
+    def test_iter_messages(self):
+        recorder = self.create_recorder()
+        self.record_books(recorder)
+        recorder.stop()
+        reader = MarketDataReader(recorder.file_paths[self.trading_pair])
+
+        messages = list(reader.iter_messages())
+
+        self.assertEqual(
+            [OrderBookMessageType.SNAPSHOT, OrderBookMessageType.TRADE, OrderBookMessageType.DIFF,
+             OrderBookMessageType.DIFF],
+            [message.type for message in messages])
+        self.assertEqual([[99, 1], [98, 2]], messages[0].content["bids"])
+        self.assertEqual(float(TradeType.BUY.value), messages[1].content["trade_type"])
+        self.assertEqual([[99, 3]], messages[2].content["bids"])
+        self.assertEqual([[101, 0.5], [103, 1], [102, 0]], messages[2].content["asks"])
+        self.assertEqual([[99, 0]], messages[3].content["bids"])
+        self.assertEqual([], messages[3].content["asks"])
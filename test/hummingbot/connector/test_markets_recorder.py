@@ -1,4 +1,7 @@
 import asyncio
+import os
+import shutil
+import tempfile
 import time
 from decimal import Decimal
 from typing import Awaitable
@@ -7,9 +10,15 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
-from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import (
+    ClientConfigMap,
+    MarketDataCollectionConfigMap,
+    MarketsRecorderConfigMap,
+)
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.market_data_recorder import MarketDataReader
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
@@ -18,11 +27,14 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -87,6 +99,50 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    def get_write_behind_recorder(self, flush_interval: float = 60, batch_size: int = 100) -> MarketsRecorder:
+        return MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(market_data_collection_enabled=False),
+            markets_recorder_config=MarketsRecorderConfigMap(
+                write_behind_enabled=True,
+                write_behind_flush_interval=flush_interval,
+                write_behind_batch_size=batch_size,
+            ),
+        )
+
+    def get_create_and_fill_events(self, order_id: str, exchange_trade_id: str):
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=order_id,
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id=exchange_trade_id,
+        )
+        return create_event, fill_event
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -437,6 +493,43 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
 
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_recording_enabled(self, sleep_mock):
+        sleep_mock.side_effect = [0.1, asyncio.CancelledError]
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_recording_enabled=True,
+            ),
+        )
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64))
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=temp_dir), \
+                patch.object(self, "get_order_book", return_value=order_book):
+            recorder.start()
+            with self.assertRaises(asyncio.CancelledError):
+                self.async_run_with_timeout(recorder._market_data_recording_task)
+            order_book.trigger_event(OrderBookEvent.TradeEvent, OrderBookTradeEvent(
+                trading_pair=self.trading_pair, timestamp=time.time(), type=TradeType.BUY, price=101, amount=1))
+            recorder.stop()
+
+        file_paths = [os.path.join(temp_dir, file_name) for file_name in sorted(os.listdir(temp_dir))]
+        self.assertEqual(1, len(file_paths))
+        self.assertTrue(os.path.basename(file_paths[0]).startswith(f"{self.display_name}_{self.trading_pair}_"))
+        reader = MarketDataReader(file_paths)
+        bids, asks = reader.order_book_at(time.time())
+        self.assertEqual([[99, 1], [98, 2]], bids.tolist())
+        self.assertEqual([[101, 1], [102, 2]], asks.tolist())
+        self.assertEqual([101], reader.trades()["price"].tolist())
+
     def test_store_position_executor(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -492,3 +585,148 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(len(executors_in_db), 1)
         executors_in_db = recorder.get_position_executors(controller_name="test_controller_2")
         self.assertEqual(len(executors_in_db), 1)
+
+    def test_write_behind_queues_records_until_flush(self):
+        recorder = self.get_write_behind_recorder()
+        create_event, fill_event = self.get_create_and_fill_events("OID1", "TradeId1")
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642030000,
+            order_id=create_event.order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=create_event.amount,
+            quote_asset_amount=create_event.amount * create_event.price,
+            order_type=create_event.type)
+
+        with patch("hummingbot.connector.markets_recorder.MarketsRecorder.append_to_csv"):
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+
+            self.assertEqual(3, recorder.pending_writes_count)
+            with self.manager.get_new_session() as session:
+                self.assertEqual(0, session.query(Order).count())
+
+            recorder.stop()
+
+        self.assertEqual(0, recorder.pending_writes_count)
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            order_status = [status.status for status in orders[0].status]
+            trade_fills = orders[0].trade_fills
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(1, len(orders))
+        self.assertEqual(MarketEvent.BuyOrderCompleted.name, orders[0].last_status)
+        self.assertEqual([MarketEvent.BuyOrderCreated.name, MarketEvent.OrderFilled.name,
+                          MarketEvent.BuyOrderCompleted.name], order_status)
+        self.assertEqual(1, len(trade_fills))
+        self.assertEqual(1, len(market_states))
+        self.assertEqual(self.display_name, market_states[0].market)
+
+    def test_write_behind_failing_record_does_not_drop_the_batch(self):
+        recorder = self.get_write_behind_recorder()
+
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        with patch("hummingbot.connector.markets_recorder.MarketsRecorder.append_to_csv"):
+            create_event, _ = self.get_create_and_fill_events("OID1", "TradeId1")
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+            recorder._write(failing_write)
+            create_event, _ = self.get_create_and_fill_events("OID2", "TradeId2")
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+
+            recorder.flush()
+
+        self.assertEqual(0, recorder.pending_writes_count)
+        with self.manager.get_new_session() as session:
+            order_ids = sorted(order.id for order in session.query(Order).all())
+            market_states_count = session.query(MarketState).count()
+        self.assertEqual(["OID1", "OID2"], order_ids)
+        self.assertEqual(1, market_states_count)
+
+    def test_write_behind_retry_exports_each_saved_fill_once(self):
+        recorder = self.get_write_behind_recorder()
+
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        with patch.object(recorder, "append_to_csv") as append_to_csv_mock:
+            create_event, fill_event = self.get_create_and_fill_events("OID1", "TradeId1")
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            recorder._write(failing_write)
+            # Same primary key as the first fill, it can't be saved in the batch nor on its own
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            _, fill_event = self.get_create_and_fill_events("OID1", "TradeId2")
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+            recorder.flush()
+
+        exported_trade_ids = [call.args[2][0] for call in append_to_csv_mock.call_args_list]
+        self.assertEqual(["TradeId1", "TradeId2"], exported_trade_ids)
+        with self.manager.get_new_session() as session:
+            saved_trade_ids = sorted(trade_fill.exchange_trade_id for trade_fill in session.query(TradeFill).all())
+        self.assertEqual(["TradeId1", "TradeId2"], saved_trade_ids)
+
+    def test_stop_closes_csv_writers_when_flush_fails(self):
+        recorder = self.get_write_behind_recorder()
+
+        with patch.object(recorder, "flush", side_effect=ValueError("Database error")), \
+                patch.object(recorder, "_close_csv_writers") as close_csv_writers_mock:
+            with self.assertRaises(ValueError):
+                recorder.stop()
+
+        close_csv_writers_mock.assert_called_once()
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def test_write_behind_flushes_in_background_when_batch_is_full(self, engine_mock):
+        # The background thread needs to share the in-memory database with the test thread
+        engine_mock.return_value = create_engine("sqlite://", connect_args={"check_same_thread": False},
+                                                 poolclass=StaticPool)
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        recorder = self.get_write_behind_recorder(batch_size=2)
+        recorder.start()
+
+        for i in range(2):
+            create_event, _ = self.get_create_and_fill_events(f"OID{i}", f"TradeId{i}")
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+
+        orders_count = 0
+        for _ in range(100):
+            with self.manager.get_new_session() as session:
+                orders_count = session.query(Order).count()
+            if orders_count == 2:
+                break
+            time.sleep(0.01)
+        recorder.stop()
+
+        self.assertEqual(2, orders_count)
+
+    def test_append_to_csv_writes_header_once(self):
+        csv_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, csv_dir)
+        self.config_file_path = "test_config.yml"
+        csv_path = os.path.join(csv_dir, "trades_test_config.csv")
+        with open(csv_path, "w") as csv_file:
+            csv_file.write("old,header\n1,2\n")
+
+        recorder = self.get_write_behind_recorder()
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=csv_dir):
+            for i in range(2):
+                create_event, fill_event = self.get_create_and_fill_events(f"OID{i}", f"TradeId{i}")
+                recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            recorder.stop()
+
+        with open(csv_path) as csv_file:
+            lines = csv_file.read().splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertTrue(lines[0].startswith("exchange_trade_id,"))
+        self.assertTrue(lines[1].startswith("TradeId0,"))
+        self.assertTrue(lines[2].startswith("TradeId1,"))
+        old_files = [file_name for file_name in os.listdir(csv_dir) if "_old_" in file_name]
+        self.assertEqual(1, len(old_files))
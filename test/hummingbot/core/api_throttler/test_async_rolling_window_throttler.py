@@ -0,0 +1,220 @@
+import asyncio
+import math
+import unittest
+from decimal import Decimal
+from typing import Awaitable, List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_rolling_window_throttler import (
+    AsyncRollingWindowThrottler,
+    RollingWindowCounter,
+)
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class RollingWindowCounterTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=1.0)
+        self.counter = RollingWindowCounter(rate_limit=self.rate_limit, safety_margin_pct=0)
+
+    def test_register_updates_used_capacity(self):
+        self.counter.register(timestamp=1000.0, weight=1)
+        self.counter.register(timestamp=1000.1, weight=2)
+
+        self.assertEqual(3, self.counter.capacity_used(now=1000.5))
+
+    def test_flush_only_removes_expired_entries(self):
+        self.counter.register(timestamp=1000.0, weight=1)
+        self.counter.register(timestamp=1000.5, weight=1)
+
+        self.assertEqual(1, self.counter.capacity_used(now=1001.2))
+        self.assertEqual(0, self.counter.capacity_used(now=1001.6))
+
+    def test_has_capacity(self):
+        self.counter.register(timestamp=1000.0, weight=2)
+
+        self.assertTrue(self.counter.has_capacity(weight=1, now=1000.1))
+        self.assertFalse(self.counter.has_capacity(weight=2, now=1000.1))
+
+    def test_task_heavier_than_limit_accepted_only_with_empty_window(self):
+        self.assertTrue(self.counter.has_capacity(weight=5, now=1000.0))
+
+        self.counter.register(timestamp=1000.0, weight=1)
+
+        self.assertFalse(self.counter.has_capacity(weight=5, now=1000.5))
+
+    def test_time_until_capacity(self):
+        self.counter.register(timestamp=1000.0, weight=1)
+        self.counter.register(timestamp=1000.2, weight=1)
+        self.counter.register(timestamp=1000.4, weight=1)
+
+        self.assertAlmostEqual(0.5, self.counter.time_until_capacity(weight=1, now=1000.5))
+        self.assertAlmostEqual(0.7, self.counter.time_until_capacity(weight=2, now=1000.5))
+        self.assertEqual(0.0, self.counter.time_until_capacity(weight=1, now=1001.1))
+
+    def test_safety_margin_extends_window(self):
+        counter = RollingWindowCounter(rate_limit=self.rate_limit, safety_margin_pct=0.1)
+        counter.register(timestamp=1000.0, weight=1)
+
+        self.assertAlmostEqual(1.1, counter.window)
+        self.assertEqual(1, counter.capacity_used(now=1001.05))
+        self.assertEqual(0, counter.capacity_used(now=1001.15))
+
+
+class AsyncRollingWindowThrottlerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = AsyncRollingWindowThrottler(rate_limits=self.rate_limits)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_init_with_rate_limits_share_pct(self):
+        rate_share_pct: Decimal = Decimal("55")
+        rate_limits = self.rate_limits.copy()
+        rate_limits.append(RateLimit(limit_id="ANOTHER_TEST", limit=10, time_interval=5))
+        expected_limit = math.floor(Decimal("10") * rate_share_pct / Decimal("100"))
+
+        throttler = AsyncRollingWindowThrottler(rate_limits=rate_limits, limits_share_percentage=rate_share_pct)
+
+        self.assertEqual(6, len(throttler._counters))
+        self.assertEqual(expected_limit, throttler.get_counter("ANOTHER_TEST").rate_limit.limit)
+
+    def test_acquire_registers_weight_in_all_linked_limits(self):
+        context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        self.async_run_with_timeout(context.acquire())
+
+        now = context._time()
+        self.assertEqual(1, self.throttler.get_counter(TEST_WEIGHTED_TASK_1_ID).capacity_used(now))
+        self.assertEqual(5, self.throttler.get_counter(TEST_WEIGHTED_POOL_ID).capacity_used(now))
+        self.assertEqual(0, self.throttler.get_counter(TEST_WEIGHTED_TASK_2_ID).capacity_used(now))
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).acquire())
+        self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).acquire())
+
+        # Another Task 1 (weight=5) will exceed the capacity (11/10), but Task 2 (weight=1) will not (7/10)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = AsyncRollingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+
+        self.assertTrue(context.within_capacity())
+        self.async_run_with_timeout(context.acquire())
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_PATH_URL).acquire(), timeout=0.5)
+
+        # The cancelled waiter must have been removed from the queues
+        self.assertEqual(0, len(self.throttler.get_counter(TEST_POOL_ID).waiters))
+        self.assertEqual(0, len(self.throttler.get_counter(TEST_PATH_URL).waiters))
+
+    def test_waiters_wake_up_when_capacity_is_freed_in_fifo_order(self):
+        throttler = AsyncRollingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1)],
+            safety_margin_pct=0)
+        completed = []
+
+        async def task(task_id: int):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                completed.append(task_id)
+
+        async def run_tasks():
+            await asyncio.gather(*[task(task_id) for task_id in range(4)])
+
+        start = self.ev_loop.time()
+        self.async_run_with_timeout(run_tasks(), timeout=2)
+        elapsed = self.ev_loop.time() - start
+
+        self.assertEqual([0, 1, 2, 3], completed)
+        self.assertGreaterEqual(elapsed, 0.3)
+        self.assertLess(elapsed, 0.6)
+
+    def test_waiting_task_does_not_poll(self):
+        throttler = AsyncRollingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.2)],
+            safety_margin_pct=0)
+        self.async_run_with_timeout(throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+        context = throttler.execute_task(limit_id=TEST_POOL_ID)
+
+        with patch.object(context, "within_capacity", wraps=context.within_capacity) as within_capacity_mock:
+            self.async_run_with_timeout(context.acquire())
+
+        # One check when the task is enqueued, one when it is woken up at the end of the window
+        self.assertLessEqual(within_capacity_mock.call_count, 3)
+
+    def test_linked_limit_blocks_related_tasks(self):
+        throttler = AsyncRollingWindowThrottler(
+            rate_limits=[
+                RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1),
+                RateLimit(limit_id=TEST_PATH_URL, limit=10, time_interval=0.1,
+                          linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            ],
+            safety_margin_pct=0)
+        self.async_run_with_timeout(throttler.execute_task(limit_id=TEST_PATH_URL).acquire())
+
+        self.assertFalse(throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+        self.async_run_with_timeout(throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+    @patch("hummingbot.core.api_throttler.async_rolling_window_throttler.AsyncRollingWindowRequestContext._time")
+    def test_within_capacity_for_limits_with_milliseconds_interval(self, time_mock):
+        per_second_limit = RateLimit(limit_id="generic_per_second", limit=3, time_interval=1)
+        per_millisecond_limit = RateLimit(limit_id="generic_per_millisecond", limit=2, time_interval=0.2)
+        specific_limit = RateLimit(limit_id="specific_limit", limit=1000, time_interval=1, linked_limits=[
+            LinkedLimitWeightPair(per_second_limit.limit_id),
+            LinkedLimitWeightPair(per_millisecond_limit.limit_id),
+        ])
+        throttler = AsyncRollingWindowThrottler(
+            rate_limits=[per_second_limit, per_millisecond_limit, specific_limit],
+            safety_margin_pct=0)
+
+        time_mock.return_value = 1640000000.0000
+        self.async_run_with_timeout(throttler.execute_task(limit_id=specific_limit.limit_id).acquire())
+
+        time_mock.return_value = 1640000000.0100
+        self.assertTrue(throttler.execute_task(limit_id=specific_limit.limit_id).within_capacity())
+
+        time_mock.return_value = 1640000000.1000
+        self.async_run_with_timeout(throttler.execute_task(limit_id=specific_limit.limit_id).acquire())
+        self.assertFalse(throttler.execute_task(limit_id=specific_limit.limit_id).within_capacity())
+
+        time_mock.return_value = 1640000000.1900
+        self.assertFalse(throttler.execute_task(limit_id=specific_limit.limit_id).within_capacity())
+
+        time_mock.return_value = 1640000000.2100
+        self.assertTrue(throttler.execute_task(limit_id=specific_limit.limit_id).within_capacity())
@@ -1,8 +1,16 @@
 #!/usr/bin/env python
 
 import logging
+import time
 import unittest
+from decimal import Decimal
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
 import numpy as np
 
 
@@ -50,6 +58,236 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_numpy_diffs_with_explicit_update_id(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(
+            np.array([[1, 1, 1]], dtype=np.float64), np.array([[2, 1, 1]], dtype=np.float64), update_id=7
+        )
+        self.assertEqual(7, order_book.snapshot_uid)
+
+        order_book.apply_numpy_diffs(np.empty((0, 3)), np.empty((0, 3)), update_id=8)
+        self.assertEqual(8, order_book.last_diff_uid)
+
+        order_book.apply_numpy_diffs(np.array([[1.5, 1, 9]], dtype=np.float64), np.empty((0, 3)))
+        self.assertEqual(9, order_book.last_diff_uid)
+        self.assertEqual(1.5, order_book.get_price(False))
+
+    def test_restore_from_snapshot_and_diffs_uses_message_arrays(self):
+        order_book = OrderBook()
+        timestamp = time.time()
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"update_id": 2, "bids": [["1", "1"], ["0.9", "2"]], "asks": [["2", "1"]]},
+            timestamp,
+        )
+        diffs = [
+            OrderBookMessage(
+                OrderBookMessageType.DIFF, {"update_id": 3, "bids": [["1.1", "1"]], "asks": []}, timestamp
+            ),
+            OrderBookMessage(
+                OrderBookMessageType.DIFF, {"update_id": 4, "bids": [["1", "0"]], "asks": []}, timestamp
+            ),
+        ]
+
+        order_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+
+        self.assertEqual(2, order_book.snapshot_uid)
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual([(1.1, 1.0), (0.9, 2.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(2.0, 1.0)], [(row.price, row.amount) for row in order_book.ask_entries()])
+
+    def _depth_order_books(self):
+        bids_array = np.array([[100 - i, 1 + i % 3, 1] for i in range(50)], dtype=np.float64)
+        asks_array = np.array([[101 + i, 1 + i % 4, 1] for i in range(50)], dtype=np.float64)
+        order_books = []
+        for depth_index_enabled in (False, True):
+            order_book = OrderBook()
+            order_book.apply_numpy_snapshot(bids_array, asks_array, update_id=1)
+            order_book.enable_depth_index(depth_index_enabled)
+            order_books.append(order_book)
+        return order_books
+
+    def _assert_same_query_results(self, order_book, indexed_order_book):
+        queries = [
+            ("get_price_for_volume", [0, 0.5, 1, 7, 40.5, 1000]),
+            ("get_vwap_for_volume", [0.5, 1, 7, 40.5, 1000]),
+            ("get_price_for_quote_volume", [0, 50, 101, 2500, 1e7]),
+            ("get_quote_volume_for_base_amount", [0, 0.5, 7, 40.5, 1000]),
+            ("get_volume_for_price", [50, 75.5, 99, 100, 101, 120.5, 200]),
+            ("get_quote_volume_for_price", [50, 75.5, 99, 100, 101, 120.5, 200]),
+        ]
+        for method, values in queries:
+            for is_buy in (True, False):
+                for value in values:
+                    expected = getattr(order_book, method)(is_buy, value)
+                    result = getattr(indexed_order_book, method)(is_buy, value)
+                    for field in ("query_price", "query_volume", "result_price", "result_volume"):
+                        expected_value = getattr(expected, field)
+                        result_value = getattr(result, field)
+                        if np.isnan(expected_value):
+                            self.assertTrue(np.isnan(result_value), f"{method}({is_buy}, {value}).{field}")
+                        else:
+                            self.assertAlmostEqual(
+                                expected_value, result_value, places=9, msg=f"{method}({is_buy}, {value}).{field}"
+                            )
+
+    def test_depth_index_query_results_match_order_book_walk(self):
+        order_book, indexed_order_book = self._depth_order_books()
+        self.assertFalse(order_book.depth_index_enabled)
+        self.assertTrue(indexed_order_book.depth_index_enabled)
+
+        self._assert_same_query_results(order_book, indexed_order_book)
+
+    def test_depth_index_is_invalidated_by_order_book_changes(self):
+        order_book, indexed_order_book = self._depth_order_books()
+        self._assert_same_query_results(order_book, indexed_order_book)
+
+        version = indexed_order_book.version
+        for book in (order_book, indexed_order_book):
+            book.apply_numpy_diffs(
+                np.array([[100, 0, 2], [99.5, 3, 2]], dtype=np.float64),
+                np.array([[101, 5, 2], [102, 0, 2]], dtype=np.float64),
+                update_id=2,
+            )
+        self.assertEqual(version + 1, indexed_order_book.version)
+        self._assert_same_query_results(order_book, indexed_order_book)
+
+        for book in (order_book, indexed_order_book):
+            book.apply_numpy_snapshot(
+                np.array([[90, 2, 3]], dtype=np.float64), np.array([[95, 2, 3]], dtype=np.float64), update_id=3
+            )
+        self._assert_same_query_results(order_book, indexed_order_book)
+
+    def test_depth_index_memoizes_query_results_until_the_order_book_changes(self):
+        _, indexed_order_book = self._depth_order_books()
+
+        result = indexed_order_book.get_vwap_for_volume(True, 10)
+        self.assertIs(result, indexed_order_book.get_vwap_for_volume(True, 10))
+        self.assertIsNot(result, indexed_order_book.get_price_for_volume(True, 10))
+
+        indexed_order_book.apply_numpy_diffs(
+            np.array([], dtype=np.float64).reshape(0, 3), np.array([[101, 10, 2]], dtype=np.float64), update_id=2
+        )
+        new_result = indexed_order_book.get_vwap_for_volume(True, 10)
+        self.assertIsNot(result, new_result)
+        self.assertEqual(101, new_result.result_price)
+
+    def test_get_snapshot_arrays_returns_top_levels(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(
+            np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64),
+            np.array([[101, 1, 2], [102, 2, 2], [103, 3, 2]], dtype=np.float64),
+        )
+
+        bids, asks = order_book.get_snapshot_arrays(depth=2)
+        self.assertEqual(np.float64, bids.dtype)
+        self.assertEqual([[99, 1, 1], [98, 2, 1]], bids.tolist())
+        self.assertEqual([[101, 1, 2], [102, 2, 2]], asks.tolist())
+
+        bids, asks = order_book.get_snapshot_arrays()
+        self.assertEqual((3, 3), bids.shape)
+        self.assertEqual((3, 3), asks.shape)
+
+        bids, asks = order_book.get_snapshot_arrays(depth=0)
+        self.assertEqual((0, 3), bids.shape)
+        self.assertEqual((0, 3), asks.shape)
+
+        with self.assertRaises(ValueError):
+            order_book.get_snapshot_arrays(depth=-1)
+
+    def test_get_snapshot_arrays_aggregates_price_buckets(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(
+            np.array([[100.3, 1, 1], [100.1, 2, 3], [100, 1, 2], [99.7, 4, 1], [98.5, 1, 1]], dtype=np.float64),
+            np.array([[100.5, 1, 1], [101, 2, 2], [101.2, 3, 4], [102.9, 1, 1]], dtype=np.float64),
+        )
+
+        bids, asks = order_book.get_snapshot_arrays(price_bucket=1)
+        self.assertEqual([[100, 4, 3], [99, 4, 1], [98, 1, 1]], bids.tolist())
+        self.assertEqual([[101, 3, 2], [102, 3, 4], [103, 1, 1]], asks.tolist())
+
+        bids, asks = order_book.get_snapshot_arrays(depth=1, price_bucket=1)
+        self.assertEqual([[100, 4, 3]], bids.tolist())
+        self.assertEqual([[101, 3, 2]], asks.tolist())
+
+        bids, asks = order_book.get_snapshot_arrays(depth=1, price_bucket=0.1)
+        self.assertEqual([[100.3, 1, 1]], bids.tolist())
+        self.assertAlmostEqual(100.5, asks[0, 0])
+
+    def test_snapshot_data_frames_wrap_snapshot_arrays(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(
+            np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64), np.array([[101, 1, 2]], dtype=np.float64)
+        )
+
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual(["price", "amount", "update_id"], list(bids_df.columns))
+        self.assertEqual([[99, 1, 1], [98, 2, 1]], bids_df.values.tolist())
+        self.assertEqual([[101, 1, 2]], asks_df.values.tolist())
+
+        bids_df, asks_df = order_book.get_snapshot(depth=1)
+        self.assertEqual([[99, 1, 1]], bids_df.values.tolist())
+        self.assertEqual([[101, 1, 2]], asks_df.values.tolist())
+
+    def test_top_of_book_version_changes_with_best_prices(self):
+        order_book = OrderBook()
+        self.assertEqual(0, order_book.top_of_book_version)
+
+        order_book.apply_numpy_snapshot(
+            np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64), np.array([[101, 1, 1]], dtype=np.float64)
+        )
+        self.assertEqual(1, order_book.top_of_book_version)
+
+        # Changes deeper in the book or of the best levels amounts keep the version
+        order_book.apply_numpy_diffs(
+            np.array([[99, 3, 2], [98, 0, 2], [97, 1, 2]], dtype=np.float64),
+            np.array([[102, 1, 2]], dtype=np.float64),
+        )
+        order_book.apply_numpy_snapshot(
+            np.array([[99, 1, 3]], dtype=np.float64), np.array([[101, 2, 3]], dtype=np.float64)
+        )
+        self.assertEqual(1, order_book.top_of_book_version)
+
+        order_book.apply_numpy_diffs(
+            np.array([], dtype=np.float64).reshape(0, 3), np.array([[100.5, 1, 4]], dtype=np.float64)
+        )
+        self.assertEqual(2, order_book.top_of_book_version)
+
+        order_book.apply_numpy_diffs(
+            np.array([[99, 0, 5]], dtype=np.float64), np.array([], dtype=np.float64).reshape(0, 3)
+        )
+        order_book.apply_numpy_diffs(
+            np.array([[99.5, 1, 6]], dtype=np.float64), np.array([], dtype=np.float64).reshape(0, 3)
+        )
+        self.assertEqual(3, order_book.top_of_book_version)
+
+    def test_composite_order_book_top_of_book_version_with_traded_entries(self):
+        order_book = CompositeOrderBook()
+        order_book.apply_numpy_snapshot(
+            np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64), np.array([[101, 1, 1], [102, 1, 1]], dtype=np.float64)
+        )
+        version = order_book.top_of_book_version
+
+        order_book.record_filled_order(OrderFilledEvent(
+            timestamp=1, order_id="buy_1", trading_pair="COINALPHA-HBOT", trade_type=TradeType.BUY,
+            order_type=OrderType.MARKET, price=101, amount=Decimal("1"), trade_fee=AddedToCostTradeFee(),
+        ))
+        self.assertEqual(version + 1, order_book.top_of_book_version)
+        self.assertEqual(102, order_book.get_price(True))
+
+        # The traded entries can hide the best levels, so any change of the book counts
+        order_book.apply_numpy_diffs(
+            np.array([], dtype=np.float64).reshape(0, 3), np.array([[101, 2, 2]], dtype=np.float64)
+        )
+        self.assertEqual(version + 2, order_book.top_of_book_version)
+
+        order_book.clear_traded_order_book()
+        self.assertEqual(version + 3, order_book.top_of_book_version)
+        order_book.apply_numpy_diffs(
+            np.array([], dtype=np.float64).reshape(0, 3), np.array([[102, 2, 3]], dtype=np.float64)
+        )
+        self.assertEqual(version + 3, order_book.top_of_book_version)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
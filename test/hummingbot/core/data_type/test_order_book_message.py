@@ -1,5 +1,8 @@
 import time
 import unittest
+from typing import List
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
     OrderBookMessageType
@@ -119,6 +122,57 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_bids_and_asks_arrays(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 10,
+                "asks": [["1.5", "2"], ["3", "0"]],
+                "bids": [["0.5", "6", "extraField"], ["0.4", "8", "extraField"]],
+            },
+            timestamp=time.time(),
+        )
+
+        asks_array = msg.asks_array
+        bids_array = msg.bids_array
+
+        self.assertEqual(np.float64, asks_array.dtype)
+        self.assertEqual([[1.5, 2, 10], [3, 0, 10]], asks_array.tolist())
+        self.assertEqual([[0.5, 6, 10], [0.4, 8, 10]], bids_array.tolist())
+        self.assertIs(asks_array, msg.asks_array)
+        self.assertIs(msg.bids, msg.bids)
+        self.assertEqual([OrderBookRow(0.5, 6, 10), OrderBookRow(0.4, 8, 10)], msg.bids)
+
+    def test_empty_bids_and_asks_arrays(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 10, "asks": [], "bids": []},
+            timestamp=time.time(),
+        )
+
+        self.assertEqual((0, 3), msg.asks_array.shape)
+        self.assertEqual((0, 3), msg.bids_array.shape)
+        self.assertEqual([], msg.bids)
+
+    def test_bids_and_asks_arrays_of_subclass_with_own_parsing(self):
+        class CustomOrderBookMessage(OrderBookMessage):
+            @property
+            def asks(self) -> List[OrderBookRow]:
+                return [OrderBookRow(float(ask["p"]), float(ask["q"]), self.update_id) for ask in self.content["asks"]]
+
+            @property
+            def bids(self) -> List[OrderBookRow]:
+                return [OrderBookRow(float(bid["p"]), float(bid["q"]), self.update_id) for bid in self.content["bids"]]
+
+        msg = CustomOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 3, "asks": [{"p": "2", "q": "1"}], "bids": [{"p": "1", "q": "4"}]},
+            timestamp=time.time(),
+        )
+
+        self.assertEqual([[2, 1, 3]], msg.asks_array.tolist())
+        self.assertEqual([[1, 4, 3]], msg.bids_array.tolist())
+
     def test_has_update_id(self):
         update_id = "someId"
 
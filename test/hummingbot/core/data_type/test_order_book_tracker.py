@@ -0,0 +1,211 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, Dict, List, Optional
+from unittest.mock import patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    def __init__(self, trading_pairs: List[str], snapshot_delay: float):
+        super().__init__(trading_pairs=trading_pairs)
+        self.snapshot_delay = snapshot_delay
+        self.concurrent_requests = 0
+        self.max_concurrent_requests = 0
+        self.failing_trading_pairs: List[str] = []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: 1.0 for trading_pair in trading_pairs}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.concurrent_requests += 1
+        self.max_concurrent_requests = max(self.max_concurrent_requests, self.concurrent_requests)
+        try:
+            await asyncio.sleep(self.snapshot_delay)
+            if trading_pair in self.failing_trading_pairs:
+                self.failing_trading_pairs.remove(trading_pair)
+                raise IOError("Snapshot request failed")
+        finally:
+            self.concurrent_requests -= 1
+        return OrderBook()
+
+
+class OrderBookTrackerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pairs = [f"COINALPHA{i}-HBOT" for i in range(20)]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MockOrderBookTrackerDataSource(trading_pairs=self.trading_pairs, snapshot_delay=0.05)
+        self.tracker: Optional[OrderBookTracker] = None
+
+    def tearDown(self) -> None:
+        if self.tracker is not None:
+            self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_init_order_books_requests_snapshots_concurrently(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        # All the snapshots were requested before the first one was received
+        self.assertGreater(self.data_source.max_concurrent_requests, 1)
+        self.assertEqual(len(self.trading_pairs), self.data_source.max_concurrent_requests)
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books))
+        self.assertEqual(set(self.trading_pairs), set(self.tracker._tracking_tasks))
+
+    def test_init_order_books_respects_max_concurrent_snapshot_requests(self):
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=self.trading_pairs, max_concurrent_snapshot_requests=5
+        )
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertEqual(5, self.data_source.max_concurrent_requests)
+        self.assertTrue(self.tracker.ready)
+
+    def test_trading_pairs_ready_before_all_order_books_are_initialized(self):
+        trading_pairs = self.trading_pairs[:2]
+        self.data_source.failing_trading_pairs.append(trading_pairs[1])
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=trading_pairs)
+
+        async def short_sleep(delay: float):
+            await asyncio.sleep(0.2)
+
+        with patch.object(self.tracker, "_sleep", side_effect=short_sleep):
+            init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+            self.async_run_with_timeout(self.tracker.wait_trading_pair_ready(trading_pairs[0]))
+
+            self.assertEqual([trading_pairs[0]], self.tracker.ready_trading_pairs)
+            self.assertFalse(self.tracker.ready)
+
+            self.async_run_with_timeout(init_task)
+
+        self.assertEqual(trading_pairs, self.tracker.ready_trading_pairs)
+        self.assertTrue(self.tracker.ready)
+
+    def test_stop_clears_trading_pairs_readiness(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.tracker.stop()
+
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+    def _diff_message(
+        self, trading_pair: str, update_id: int, bids: List, asks: List, timestamp: Optional[float] = None
+    ) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=timestamp if timestamp is not None else time.time(),
+        )
+
+    def _start_tracking(self, tracker: OrderBookTracker, trading_pair: str) -> asyncio.Queue:
+        order_book = OrderBook()
+        order_book.apply_snapshot(
+            [OrderBookRow(99.0, 1.0, 1), OrderBookRow(98.0, 2.0, 1)],
+            [OrderBookRow(101.0, 1.0, 1), OrderBookRow(102.0, 2.0, 1)],
+            1,
+        )
+        tracker._order_books[trading_pair] = order_book
+        tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        return tracker._tracking_message_queues[trading_pair]
+
+    def _diff_messages(self, trading_pair: str) -> List[OrderBookMessage]:
+        return [
+            self._diff_message(trading_pair, 2, bids=[["99.5", "1"], ["98", "0"]], asks=[["101", "3"]]),
+            self._diff_message(trading_pair, 3, bids=[["99.5", "4"]], asks=[["101", "0"], ["103", "1"]]),
+            self._diff_message(trading_pair, 4, bids=[["97", "1"]], asks=[["103", "2"]]),
+        ]
+
+    def test_batched_diffs_give_the_same_order_book_as_sequential_diffs(self):
+        trading_pair = self.trading_pairs[0]
+        results = {}
+
+        for batch_diffs in (False, True):
+            tracker = OrderBookTracker(
+                data_source=self.data_source, trading_pairs=[trading_pair], batch_diffs=batch_diffs
+            )
+            message_queue = self._start_tracking(tracker, trading_pair)
+            for message in self._diff_messages(trading_pair):
+                message_queue.put_nowait(message)
+
+            task = self.ev_loop.create_task(tracker._track_single_book(trading_pair))
+            self.async_run_with_timeout(asyncio.sleep(0.01))
+            task.cancel()
+
+            order_book = tracker.order_books[trading_pair]
+            results[batch_diffs] = (
+                [(row.price, row.amount) for row in order_book.bid_entries()],
+                [(row.price, row.amount) for row in order_book.ask_entries()],
+                order_book.last_diff_uid,
+            )
+            self.assertEqual(3, len(tracker._past_diffs_windows[trading_pair]))
+
+        self.assertEqual(results[False], results[True])
+        self.assertEqual([(99.5, 4.0), (99.0, 1.0), (97.0, 1.0)], results[True][0])
+        self.assertEqual([(102.0, 2.0), (103.0, 2.0)], results[True][1])
+        self.assertEqual(4, results[True][2])
+
+    def test_batched_diffs_register_stats(self):
+        trading_pair = self.trading_pairs[0]
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[trading_pair], batch_diffs=True)
+        message_queue = self._start_tracking(self.tracker, trading_pair)
+        for message in self._diff_messages(trading_pair):
+            message_queue.put_nowait(message)
+        self.assertEqual(3, self.tracker.pending_messages_count(trading_pair))
+
+        task = self.ev_loop.create_task(self.tracker._track_single_book(trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        message_queue.put_nowait(self._diff_message(trading_pair, 5, bids=[], asks=[["104", "1"]]))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        task.cancel()
+
+        stats = self.tracker.diff_batch_stats[trading_pair]
+        self.assertEqual(2, stats.batches_applied)
+        self.assertEqual(4, stats.diffs_applied)
+        self.assertEqual(1, stats.last_batch_size)
+        self.assertEqual(3, stats.max_batch_size)
+        self.assertEqual(2, stats.average_batch_size)
+        self.assertGreaterEqual(stats.max_lag, stats.last_lag)
+        self.assertEqual(0, self.tracker.pending_messages_count(trading_pair))
+
+    def test_batched_diffs_stop_at_snapshot_messages(self):
+        trading_pair = self.trading_pairs[0]
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[trading_pair], batch_diffs=True)
+        message_queue = self._start_tracking(self.tracker, trading_pair)
+        diffs = self._diff_messages(trading_pair)
+        snapshot = OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"trading_pair": trading_pair, "update_id": 10, "bids": [["90", "1"]], "asks": [["110", "1"]]},
+            timestamp=time.time(),
+        )
+        for message in [diffs[0], snapshot, diffs[1]._replace(content={**diffs[1].content, "update_id": 11})]:
+            message_queue.put_nowait(message)
+
+        task = self.ev_loop.create_task(self.tracker._track_single_book(trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        task.cancel()
+
+        order_book = self.tracker.order_books[trading_pair]
+        self.assertEqual(10, order_book.snapshot_uid)
+        self.assertEqual(11, order_book.last_diff_uid)
+        self.assertEqual([(99.5, 4.0), (90.0, 1.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual(2, self.tracker.diff_batch_stats[trading_pair].batches_applied)
@@ -0,0 +1,180 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.core.gateway.gateway_quote_cache import GatewayQuoteCache
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+
+GATEWAY_HOST = "localhost"
+
+
+class GatewayQuoteCacheTest(unittest.TestCase):
+    ev_loop: asyncio.AbstractEventLoop
+    web_app: MockWebServer
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.web_app = MockWebServer.get_instance()
+        cls.web_app.add_host_to_mock(GATEWAY_HOST)
+        cls.web_app.start()
+        cls.ev_loop.run_until_complete(cls.web_app.wait_til_started())
+        cls._patcher = patch("aiohttp.client.URL")
+        cls._url_mock = cls._patcher.start()
+        cls._url_mock.side_effect = MockWebServer.reroute_local
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.web_app.stop()
+        cls._patcher.stop()
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.web_app.clear_responses()
+        self.web_app.update_response("post", GATEWAY_HOST, "/amm/price", {"price": "0.00262343"})
+        self.web_app.update_response("get", GATEWAY_HOST, "/chain/status",
+                                     {"chain": "ethereum", "network": "goerli", "currentBlockNumber": 100})
+
+        self._previous_instance = GatewayHttpClient._GatewayHttpClient__instance
+        self.client = GatewayHttpClient(ClientConfigAdapter(ClientConfigMap()))
+        self.client.base_url = f"https://{GATEWAY_HOST}:15888"
+        self.session = ClientSession()
+        self._client_patcher = patch.object(GatewayHttpClient, "_http_client", return_value=self.session)
+        self._client_patcher.start()
+        self._request_patcher = patch.object(self.client, "api_request", wraps=self.client.api_request)
+        self.api_request_mock = self._request_patcher.start()
+
+    def tearDown(self) -> None:
+        self._request_patcher.stop()
+        self._client_patcher.stop()
+        self.async_run_with_timeout(self.session.close())
+        GatewayHttpClient._GatewayHttpClient__instance = self._previous_instance
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 5):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def get_price(self, amount: Decimal = Decimal("1000"), side: TradeType = TradeType.BUY, **kwargs):
+        return self.client.get_price("ethereum", "goerli", "uniswap", "DAI", "WETH", amount, side, **kwargs)
+
+    def price_requests_count(self) -> int:
+        return len([call for call in self.api_request_mock.call_args_list if call.args[1] == "amm/price"])
+
+    def test_amount_bucket(self):
+        cache = GatewayQuoteCache(ttl=2)
+
+        self.assertEqual(Decimal("1000"), cache.amount_bucket(Decimal("1000.4")))
+        self.assertEqual(Decimal("1235"), cache.amount_bucket(Decimal("1234.5")))
+        self.assertEqual(Decimal("0.0001235"), cache.amount_bucket(Decimal("0.00012345")))
+        self.assertEqual(Decimal("0"), cache.amount_bucket(Decimal("0")))
+
+    def test_repeated_quotes_are_served_from_the_cache(self):
+        first_quote = self.async_run_with_timeout(self.get_price())
+        second_quote = self.async_run_with_timeout(self.get_price(amount=Decimal("1000.1")))
+        self.async_run_with_timeout(self.get_price(side=TradeType.SELL))
+
+        self.assertEqual("0.00262343", first_quote["price"])
+        self.assertEqual(first_quote, second_quote)
+        self.assertEqual(2, self.price_requests_count())
+        self.assertEqual({"hits": 1, "misses": 2, "coalesced": 0, "size": 2}, self.client.quote_cache.metrics)
+
+        self.async_run_with_timeout(self.get_price(use_cache=False))
+        self.assertEqual(3, self.price_requests_count())
+
+    def test_concurrent_quotes_share_one_gateway_call(self):
+        quotes = self.async_run_with_timeout(asyncio.gather(*[self.get_price() for _ in range(5)]))
+
+        self.assertEqual(5 * [{"price": "0.00262343"}], quotes)
+        self.assertEqual(1, self.price_requests_count())
+        self.assertEqual(1, self.client.quote_cache.misses)
+        self.assertEqual(4, self.client.quote_cache.coalesced)
+
+    def test_failed_quotes_are_shared_and_not_cached(self):
+        self.web_app.clear_responses()
+
+        results = self.async_run_with_timeout(
+            asyncio.gather(*[self.get_price() for _ in range(3)], return_exceptions=True))
+
+        self.assertEqual(3, len(results))
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(1, self.price_requests_count())
+
+        self.web_app.update_response("post", GATEWAY_HOST, "/amm/price", {"price": "0.00262343"})
+        quote = self.async_run_with_timeout(self.get_price())
+        self.assertEqual("0.00262343", quote["price"])
+        self.assertEqual(2, self.price_requests_count())
+
+    def test_silent_and_raising_quotes_do_not_share_gateway_calls(self):
+        self.web_app.clear_responses()
+
+        raising_quote, silent_quote = self.async_run_with_timeout(
+            asyncio.gather(self.get_price(), self.get_price(fail_silently=True), return_exceptions=True))
+
+        self.assertIsInstance(raising_quote, ValueError)
+        self.assertNotIsInstance(silent_quote, Exception)
+        self.assertEqual(2, self.price_requests_count())
+        self.assertEqual(0, self.client.quote_cache.coalesced)
+        self.assertEqual(0, self.client.quote_cache.metrics["size"])
+
+    def test_quotes_expire_after_ttl(self):
+        self.client._client_config_map.gateway.gateway_quote_cache_ttl = 0.1
+        self.async_run_with_timeout(self.get_price())
+        self.async_run_with_timeout(asyncio.sleep(0.15))
+        self.async_run_with_timeout(self.get_price())
+
+        self.assertEqual(2, self.price_requests_count())
+        self.assertEqual(0, self.client.quote_cache.hits)
+
+    def test_ttl_follows_the_config(self):
+        self.client._client_config_map.gateway.gateway_quote_cache_ttl = 0
+        self.async_run_with_timeout(self.get_price())
+        self.async_run_with_timeout(self.get_price())
+
+        self.assertEqual(0, self.client.quote_cache.ttl)
+        self.assertEqual(2, self.price_requests_count())
+
+        self.client._client_config_map.gateway.gateway_quote_cache_ttl = 10
+        self.async_run_with_timeout(self.get_price())
+        self.async_run_with_timeout(self.get_price())
+
+        self.assertEqual(10, self.client.quote_cache.ttl)
+        self.assertEqual(3, self.price_requests_count())
+
+    def test_new_block_invalidates_the_network_quotes(self):
+        self.async_run_with_timeout(self.client.get_network_status("ethereum", "goerli"))
+        self.async_run_with_timeout(self.get_price())
+        # Same block, the quote is still valid
+        self.async_run_with_timeout(self.client.get_network_status("ethereum", "goerli"))
+        self.async_run_with_timeout(self.get_price())
+        self.assertEqual(1, self.price_requests_count())
+
+        self.web_app.update_response("get", GATEWAY_HOST, "/chain/status",
+                                     {"chain": "ethereum", "network": "goerli", "currentBlockNumber": 101})
+        self.async_run_with_timeout(self.client.get_network_status("ethereum", "goerli"))
+        self.async_run_with_timeout(self.get_price())
+        self.assertEqual(2, self.price_requests_count())
+
+    def test_nonce_change_invalidates_the_network_quotes(self):
+        cache = self.client.quote_cache
+        cache.update_nonce("ethereum", "goerli", 10)
+        self.async_run_with_timeout(self.get_price())
+
+        cache.update_nonce("ethereum", "mainnet", 3)
+        cache.update_nonce("ethereum", "mainnet", 4)
+        self.async_run_with_timeout(self.get_price())
+        self.assertEqual(1, self.price_requests_count())
+
+        cache.update_nonce("ethereum", "goerli", 11)
+        self.async_run_with_timeout(self.get_price())
+        self.assertEqual(2, self.price_requests_count())
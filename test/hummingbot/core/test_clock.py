@@ -7,9 +7,19 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class SlowTimeIterator(PyTimeIterator):
+    def __init__(self, tick_duration: float):
+        super().__init__()
+        self.tick_duration = tick_duration
+
+    def tick(self, timestamp: float):
+        time.sleep(self.tick_duration)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +134,190 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_tick_profiling_disabled_by_default(self):
+        self.clock_backtest.add_iterator(SlowTimeIterator(0))
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 5 * self.tick_size)
+
+        self.assertFalse(self.clock_backtest.tick_profiling_enabled)
+        self.assertEqual(0, self.clock_backtest.tick_stats.ticks_stats.ticks)
+        self.assertEqual({}, self.clock_backtest.tick_stats.iterators_stats)
+
+    def test_tick_profiling_records_iterator_tick_durations(self):
+        clock = Clock(ClockMode.BACKTEST, 0.01, self.backtest_start_timestamp, self.backtest_end_timestamp,
+                      tick_profiling_enabled=True, slow_tick_warning_threshold=0.015)
+        fast_iterator = TimeIterator()
+        slow_iterator = SlowTimeIterator(0.02)
+        clock.add_iterator(fast_iterator)
+        clock.add_iterator(slow_iterator)
+
+        with self.assertLogs(level="WARNING") as logs:
+            clock.backtest_til(self.backtest_start_timestamp + 0.03)
+
+        stats = clock.tick_stats
+        self.assertEqual(3, stats.ticks_stats.ticks)
+        self.assertEqual(3, stats.late_ticks)
+        self.assertEqual(3, stats.iterators_stats["TimeIterator"].ticks)
+        self.assertEqual(0, stats.iterators_stats["TimeIterator"].slow_ticks)
+        slow_stats = stats.iterators_stats["SlowTimeIterator"]
+        self.assertEqual(3, slow_stats.ticks)
+        self.assertEqual(3, slow_stats.slow_ticks)
+        self.assertGreaterEqual(slow_stats.max_duration, 0.02)
+        self.assertEqual(3, sum(slow_stats.bucket_counts))
+        self.assertEqual(3, len(logs.records))
+        self.assertIn("Slow clock tick: SlowTimeIterator took", logs.records[0].getMessage())
+        self.assertEqual(3, stats.to_dict()["iterators"]["SlowTimeIterator"]["slow_ticks"])
+        self.assertIn("SlowTimeIterator", stats.format_status())
+
+        clock.reset_tick_stats()
+        self.assertEqual(0, clock.tick_stats.ticks_stats.ticks)
+
+    def test_tick_profiling_counts_skipped_ticks_in_real_time_mode(self):
+        clock = Clock(ClockMode.REALTIME, 0.05, tick_profiling_enabled=True, slow_tick_warning_threshold=1)
+        clock.add_iterator(SlowTimeIterator(0.12))
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.5))
+
+        stats = clock.tick_stats
+        self.assertGreater(stats.late_ticks, 0)
+        self.assertGreater(stats.skipped_ticks, 0)
+        self.assertEqual(stats.ticks_stats.ticks, stats.iterators_stats["SlowTimeIterator"].ticks)
+
+    def test_iterators_tick_intervals_in_backtest_mode(self):
+        ticks = []
+
+        class RecordingTimeIterator(PyTimeIterator):
+            def __init__(self, name: str):
+                super().__init__()
+                self.name = name
+
+            def tick(self, timestamp: float):
+                ticks.append((timestamp - ClockUnitTest.backtest_start_timestamp, self.name))
+
+        clock = Clock(ClockMode.BACKTEST, 0.5, self.backtest_start_timestamp, self.backtest_end_timestamp)
+        connector = RecordingTimeIterator("connector")
+        strategy = RecordingTimeIterator("strategy")
+        recorder = RecordingTimeIterator("recorder")
+        clock.add_iterator(connector, tick_interval=1)
+        clock.add_iterator(strategy)
+        clock.add_iterator(recorder, tick_interval=2)
+
+        self.assertEqual(1, clock.get_tick_interval(connector))
+        self.assertEqual(0.5, clock.get_tick_interval(strategy))
+        self.assertEqual(2, clock.get_tick_interval(recorder))
+
+        clock.backtest_til(self.backtest_start_timestamp + 4)
+
+        self.assertEqual(
+            [
+                (0.5, "connector"), (0.5, "strategy"), (0.5, "recorder"),
+                (1, "connector"), (1, "strategy"),
+                (1.5, "strategy"),
+                (2, "connector"), (2, "strategy"), (2, "recorder"),
+                (2.5, "strategy"),
+                (3, "connector"), (3, "strategy"),
+                (3.5, "strategy"),
+                (4, "connector"), (4, "strategy"), (4, "recorder"),
+            ],
+            ticks,
+        )
+
+        clock.set_tick_interval(recorder, None)
+        ticks.clear()
+        clock.backtest_til(self.backtest_start_timestamp + 4.5)
+        self.assertEqual([(4.5, "strategy"), (4.5, "recorder")], ticks)
+
+    def test_tick_interval_smaller_than_tick_size_raises(self):
+        with self.assertRaises(ValueError):
+            self.clock_backtest.add_iterator(TimeIterator(), tick_interval=0.5)
+
+    def test_iterators_tick_intervals_in_real_time_mode(self):
+        class RecordingTimeIterator(PyTimeIterator):
+            def __init__(self):
+                super().__init__()
+                self.ticks = []
+
+            def tick(self, timestamp: float):
+                self.ticks.append(timestamp)
+
+        clock = Clock(ClockMode.REALTIME, 0.05)
+        fast_iterator = RecordingTimeIterator()
+        slow_iterator = RecordingTimeIterator()
+        clock.add_iterator(fast_iterator)
+        clock.add_iterator(slow_iterator, tick_interval=0.2)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.5))
+
+        self.assertLess(len(slow_iterator.ticks), len(fast_iterator.ticks))
+        self.assertGreater(len(slow_iterator.ticks), 0)
+        self.assertTrue(set(slow_iterator.ticks).issubset(fast_iterator.ticks))
+        # The first tick is not aligned on the tick interval
+        self.assertEqual(fast_iterator.ticks[0], slow_iterator.ticks[0])
+        self.assertTrue(all(round(timestamp / 0.05) % 4 == 0 for timestamp in slow_iterator.ticks[1:]))
+
+    def test_fast_forward_jumps_to_next_events(self):
+        class EventTimeIterator(PyTimeIterator):
+            def __init__(self, event_timestamps):
+                super().__init__()
+                self.event_timestamps = list(event_timestamps)
+                self.ticks = []
+
+            def tick(self, timestamp: float):
+                self.ticks.append(timestamp)
+                while len(self.event_timestamps) > 0 and self.event_timestamps[0] <= timestamp:
+                    self.event_timestamps.pop(0)
+
+            def next_event_timestamp(self) -> float:
+                return self.event_timestamps[0] if len(self.event_timestamps) > 0 else float("inf")
+
+        class PeriodicTimeIterator(PyTimeIterator):
+            def __init__(self):
+                super().__init__()
+                self.ticks = []
+
+            def tick(self, timestamp: float):
+                self.ticks.append(timestamp)
+
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 1, start, start + 3600, fast_forward=True)
+        feed = EventTimeIterator([start + 10, start + 10.5, start + 1000])
+        strategy = PeriodicTimeIterator()
+        clock.add_iterator(feed)
+        clock.add_iterator(strategy, tick_interval=600)
+
+        clock.backtest()
+
+        self.assertEqual([start + 10, start + 11, start + 1000], feed.ticks)
+        self.assertEqual([start + 1, start + 600, start + 1200, start + 1800, start + 2400, start + 3000, start + 3600],
+                         strategy.ticks)
+        self.assertEqual(start + 3600, clock.current_timestamp)
+
+    def test_fast_forward_ticks_periodic_iterators_every_tick(self):
+        clock = Clock(ClockMode.BACKTEST, 1, self.backtest_start_timestamp, self.backtest_end_timestamp,
+                      fast_forward=True)
+        self.assertTrue(clock.fast_forward)
+        iterator = SlowTimeIterator(0)
+        clock.add_iterator(iterator)
+        clock.add_iterator(TimeIterator())
+
+        clock.backtest_til(self.backtest_start_timestamp + 5)
+
+        self.assertEqual(self.backtest_start_timestamp + 5, clock.current_timestamp)
+        self.assertEqual(self.backtest_start_timestamp + 5, iterator.current_timestamp)
+
+    def test_fast_forward_stops_when_no_more_events(self):
+        class IdleTimeIterator(PyTimeIterator):
+            def tick(self, timestamp: float):
+                raise AssertionError("Idle iterators should not be ticked.")
+
+            def next_event_timestamp(self) -> float:
+                return float("inf")
+
+        clock = Clock(ClockMode.BACKTEST, 1, self.backtest_start_timestamp, float("nan"), fast_forward=True)
+        clock.add_iterator(IdleTimeIterator())
+
+        clock.backtest()
+
+        self.assertEqual(self.backtest_start_timestamp, clock.current_timestamp)
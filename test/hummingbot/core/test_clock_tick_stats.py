@@ -0,0 +1,54 @@
+import unittest
+
+from hummingbot.core.clock_tick_stats import ClockTickStats, TickDurationHistogram
+
+
+class TickDurationHistogramTest(unittest.TestCase):
+    def test_record(self):
+        histogram = TickDurationHistogram()
+
+        histogram.record(0.00005)
+        histogram.record(0.002)
+        histogram.record(0.003, is_slow=True)
+        histogram.record(2)
+
+        self.assertEqual(4, histogram.ticks)
+        self.assertEqual(1, histogram.slow_ticks)
+        self.assertEqual(2, histogram.max_duration)
+        self.assertAlmostEqual(2.00505 / 4, histogram.average_duration)
+        self.assertEqual([1, 0, 0, 2, 0, 0, 0, 0, 0, 1], histogram.bucket_counts)
+
+        histogram_dict = histogram.to_dict()
+        self.assertEqual(1, histogram_dict["histogram"]["<0.1ms"])
+        self.assertEqual(2, histogram_dict["histogram"]["<5ms"])
+        self.assertEqual(1, histogram_dict["histogram"][">=1000ms"])
+
+    def test_average_duration_without_ticks(self):
+        self.assertEqual(0, TickDurationHistogram().average_duration)
+
+
+class ClockTickStatsTest(unittest.TestCase):
+    def test_record_ticks(self):
+        stats = ClockTickStats()
+
+        stats.record_iterator_tick("TimeIterator", 0.01)
+        stats.record_iterator_tick("TimeIterator", 0.5, is_slow=True)
+        stats.record_tick(0.01, tick_size=0.1)
+        stats.record_tick(0.5, tick_size=0.1)
+        stats.record_skipped_ticks(4)
+
+        self.assertEqual(2, stats.iterators_stats["TimeIterator"].ticks)
+        self.assertEqual(1, stats.iterators_stats["TimeIterator"].slow_ticks)
+        self.assertEqual(2, stats.ticks_stats.ticks)
+        self.assertEqual(1, stats.late_ticks)
+        self.assertEqual(4, stats.skipped_ticks)
+
+        stats_dict = stats.to_dict()
+        self.assertEqual(1, stats_dict["late_ticks"])
+        self.assertEqual(4, stats_dict["skipped_ticks"])
+        self.assertEqual(2, stats_dict["iterators"]["TimeIterator"]["ticks"])
+
+        status = stats.format_status()
+        self.assertIn("Late: 1", status)
+        self.assertIn("Skipped: 4", status)
+        self.assertIn("TimeIterator", status)
@@ -7,7 +7,7 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.web_assistant.connections.data_types import (
-    RESTMethod, RESTResponse, EndpointRESTRequest
+    RESTMethod, RESTRequest, RESTResponse, EndpointRESTRequest
 )
 
 
@@ -76,6 +76,49 @@ class EndpointRESTRequestDummy(EndpointRESTRequest):
         return "https://some.url"
 
 
+class RESTRequestTest(unittest.TestCase):
+    def test_shallow_copy(self):
+        request = RESTRequest(
+            method=RESTMethod.POST,
+            url="https://some.url",
+            params={"one": 1},
+            data={"two": {"three": 3}},
+            headers={"Content-Type": "application/json"},
+        )
+
+        request_copy = request.shallow_copy()
+        request_copy.params["four"] = 4
+        request_copy.headers["Authorization"] = "key"
+        request_copy.data["five"] = 5
+
+        self.assertEqual(request.url, request_copy.url)
+        self.assertEqual({"one": 1}, request.params)
+        self.assertEqual({"Content-Type": "application/json"}, request.headers)
+        self.assertEqual({"two": {"three": 3}}, request.data)
+        self.assertIs(request.data["two"], request_copy.data["two"])
+
+    def test_shallow_copy_of_list_and_missing_collections(self):
+        request = RESTRequest(method=RESTMethod.POST, url="https://some.url", data=[{"one": 1}])
+        json_request = RESTRequest(method=RESTMethod.POST, url="https://some.url", data='{"one": 1}')
+
+        request_copy = request.shallow_copy()
+        request_copy.data.append({"two": 2})
+        json_request_copy = json_request.shallow_copy()
+
+        self.assertEqual([{"one": 1}], request.data)
+        self.assertIsNone(request_copy.params)
+        self.assertIsNone(request_copy.headers)
+        self.assertEqual('{"one": 1}', json_request_copy.data)
+
+    def test_shallow_copy_keeps_endpoint_request_data(self):
+        request = EndpointRESTRequestDummy(method=RESTMethod.POST, endpoint="some/endpoint", data={"one": 1})
+
+        request_copy = request.shallow_copy()
+
+        self.assertIsInstance(request_copy, EndpointRESTRequestDummy)
+        self.assertEqual(request.data, request_copy.data)
+
+
 class EndpointRESTRequestTest(unittest.TestCase):
     def test_constructs_url_from_endpoint(self):
         endpoint = "some/endpoint"
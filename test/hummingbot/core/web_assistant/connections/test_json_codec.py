@@ -0,0 +1,74 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.web_assistant.connections import json_codec
+from hummingbot.core.web_assistant.connections.json_codec import (
+    OrjsonJSONCodec,
+    StdlibJSONCodec,
+    get_default_json_codec,
+    get_json_codec,
+    set_default_json_codec,
+)
+
+
+class JSONCodecTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        set_default_json_codec(None)
+        super().tearDown()
+
+    def test_codecs_encode_and_decode(self):
+        obj = {"symbol": "BTC-USDT", "bids": [["100.1", "2"]], "ts": 1640000000000, "final": True, "id": None}
+        codecs = [StdlibJSONCodec()]
+        try:
+            codecs.append(OrjsonJSONCodec())
+        except ImportError:
+            pass
+
+        for codec in codecs:
+            encoded = codec.dumps(obj)
+            self.assertIsInstance(encoded, str)
+            self.assertEqual(obj, json.loads(encoded))
+            self.assertEqual(obj, codec.loads(json.dumps(obj)))
+            self.assertEqual(obj, codec.loads(json.dumps(obj).encode()))
+            with self.assertRaises(codec.decode_errors):
+                codec.loads("pong")
+
+    def test_get_json_codec(self):
+        self.assertIsInstance(get_json_codec("json"), StdlibJSONCodec)
+        with self.assertRaises(ValueError):
+            get_json_codec("unknown")
+
+    def test_fastest_codec_falls_back_to_stdlib(self):
+        with patch.dict(json_codec.JSON_CODECS, {"msgspec": self._missing_codec, "orjson": self._missing_codec}):
+            self.assertIsInstance(get_json_codec("fastest"), StdlibJSONCodec)
+
+    def test_set_default_json_codec(self):
+        self.assertIsInstance(get_default_json_codec(), StdlibJSONCodec)
+
+        codec = StdlibJSONCodec()
+        set_default_json_codec(codec)
+        self.assertIs(codec, get_default_json_codec())
+
+        set_default_json_codec("json")
+        self.assertIsNot(codec, get_default_json_codec())
+        self.assertIsInstance(get_default_json_codec(), StdlibJSONCodec)
+
+    def test_client_config_sets_default_json_codec(self):
+        config_map = ClientConfigAdapter(ClientConfigMap())
+        self.assertIsInstance(get_default_json_codec(), StdlibJSONCodec)
+
+        with patch.dict(json_codec.JSON_CODECS, {"msgspec": self._missing_codec, "orjson": self._missing_codec}):
+            with self.assertRaises(ValueError):
+                ClientConfigMap(json_codec="orjson")
+
+        codec = StdlibJSONCodec()
+        with patch.dict(json_codec.JSON_CODECS, {"json": lambda: codec}):
+            config_map.json_codec = "json"
+        self.assertIs(codec, get_default_json_codec())
+
+    @staticmethod
+    def _missing_codec():
+        raise ImportError("Codec library not installed")
@@ -100,3 +100,45 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_call_does_not_modify_the_original_request(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class PreProcessor(RESTPreProcessorBase):
+            async def pre_process(self, request: RESTRequest) -> RESTRequest:
+                request.headers["Content-Type"] = "application/json"
+                return request
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "sig"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(
+            connection,
+            throttler=AsyncThrottler(rate_limits=[]),
+            rest_pre_processors=[PreProcessor()],
+            auth=AuthDummy())
+        req = RESTRequest(
+            method=RESTMethod.GET, url=url, params={"symbol": "BTCUSDT"}, headers={}, is_auth_required=True
+        )
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertEqual({"symbol": "BTCUSDT", "signature": "sig"}, call_request.params)
+        self.assertEqual({"Content-Type": "application/json"}, call_request.headers)
+        self.assertEqual({"symbol": "BTCUSDT"}, req.params)
+        self.assertEqual({}, req.headers)
@@ -0,0 +1,119 @@
+import unittest
+from collections import deque
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+class TestCandlesRingBuffer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.buffer = CandlesRingBuffer(maxlen=3, n_columns=2)
+        self.deque = deque(maxlen=3)
+
+    @staticmethod
+    def candle(value: float):
+        return [value, value * 10]
+
+    def assert_same_candles(self):
+        self.assertEqual(len(self.deque), len(self.buffer))
+        self.assertEqual([list(candle) for candle in self.deque], self.buffer.values.tolist())
+
+    def test_append_discards_oldest_candles(self):
+        for value in range(10):
+            self.buffer.append(self.candle(value))
+            self.deque.append(self.candle(value))
+            self.assert_same_candles()
+
+    def test_extend_and_extendleft_follow_deque_semantics(self):
+        operations = [
+            ("extendleft", [self.candle(1), self.candle(2)]),
+            ("extendleft", [self.candle(3), self.candle(4)]),
+            ("extend", [self.candle(5)]),
+            ("extend", [self.candle(value) for value in range(6, 11)]),
+            ("appendleft", self.candle(0)),
+        ]
+        for operation, argument in operations:
+            getattr(self.buffer, operation)(argument)
+            getattr(self.deque, operation)(argument)
+            self.assert_same_candles()
+
+    def test_pop_and_update_last_candle(self):
+        for value in range(5):
+            self.buffer.append(self.candle(value))
+
+        self.assertEqual(self.candle(4), list(self.buffer.pop()))
+        self.buffer.append(self.candle(40))
+        self.assertEqual(self.candle(40), list(self.buffer[-1]))
+
+        self.buffer[-1] = self.candle(41)
+        self.assertEqual([self.candle(2), self.candle(3), self.candle(41)], self.buffer.values.tolist())
+        self.assertEqual(self.candle(2), list(self.buffer.popleft()))
+        self.assertEqual(self.candle(3), list(self.buffer[0]))
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.buffer[0]
+        with self.assertRaises(IndexError):
+            self.buffer.pop()
+
+    def test_version_changes_with_every_modification(self):
+        versions = [self.buffer.version]
+        self.buffer.append(self.candle(1))
+        versions.append(self.buffer.version)
+        self.buffer[-1] = self.candle(2)
+        versions.append(self.buffer.version)
+        self.buffer.clear()
+        versions.append(self.buffer.version)
+
+        self.assertEqual(len(versions), len(set(versions)))
+        self.assertEqual(0, len(self.buffer))
+
+
+class TestCandlesBaseBuffer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.candles_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=5)
+
+    def get_candle(self, value: float):
+        return np.full(len(self.candles_feed.columns), value)
+
+    def test_candles_array_is_cached_until_candles_change(self):
+        self.candles_feed._candles.append(self.get_candle(1))
+        version = self.candles_feed.candles_version
+        candles_array = self.candles_feed.candles_array
+
+        self.assertIs(candles_array, self.candles_feed.candles_array)
+        self.assertFalse(candles_array.flags.writeable)
+
+        self.candles_feed._candles[-1] = self.get_candle(2)
+
+        self.assertNotEqual(version, self.candles_feed.candles_version)
+        self.assertEqual(1, candles_array[-1, 0])
+        self.assertEqual(2, self.candles_feed.candles_array[-1, 0])
+
+    def test_candles_df_columns_can_be_added_without_changing_candles(self):
+        self.candles_feed._candles.append(self.get_candle(1))
+
+        candles_df = self.candles_feed.candles_df
+        candles_df["signal"] = 1
+        candles_df["close"] = candles_df["close"] * 2
+
+        self.assertEqual(self.candles_feed.columns, list(self.candles_feed.candles_df.columns))
+        self.assertEqual(1, self.candles_feed.candles_df["close"].iloc[-1])
+
+    def test_candles_df_can_be_modified_in_place(self):
+        self.candles_feed._candles.append(self.get_candle(1))
+        self.candles_feed._candles.append(self.get_candle(2))
+
+        candles_df = self.candles_feed.candles_df
+        candles_df.loc[0, "close"] = 10
+        candles_df["close"] *= 2
+
+        self.assertEqual([20, 4], list(candles_df["close"]))
+        self.assertEqual([1, 2], list(self.candles_feed.candles_df["close"]))
+        self.assertEqual(1, self.candles_feed.candles_array[0, 4])
@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+
+class TestCandlesStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_path = tempfile.mkdtemp()
+        self.columns = BinanceSpotCandles.columns
+        self.store = CandlesStore(data_path=self.data_path, columns=self.columns)
+        self.name = "binance_BTC-USDT"
+        self.interval = "1m"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.data_path)
+        super().tearDown()
+
+    def get_candles(self, start: int, end: int) -> np.ndarray:
+        candles = np.ones((end - start, len(self.columns)))
+        candles[:, 0] = np.arange(start, end) * 60000
+        candles[:, 4] = np.arange(start, end)
+        return candles
+
+    def test_read_empty_store(self):
+        self.assertFalse(self.store.exists(self.name, self.interval))
+        self.assertEqual((0, len(self.columns)), self.store.read(self.name, self.interval).shape)
+        self.assertIsNone(self.store.last_timestamp(self.name, self.interval))
+
+    def test_append_only_adds_new_candles(self):
+        self.assertEqual(10, self.store.append(self.name, self.interval, self.get_candles(0, 10)))
+        self.assertEqual(5, self.store.append(self.name, self.interval, self.get_candles(5, 15)))
+        self.assertEqual(0, self.store.append(self.name, self.interval, self.get_candles(0, 15)))
+
+        candles = self.store.read(self.name, self.interval)
+        self.assertEqual(list(range(15)), list(candles[:, 4]))
+        self.assertEqual(14 * 60000, self.store.last_timestamp(self.name, self.interval))
+
+    def test_append_sorts_and_deduplicates_candles(self):
+        candles = self.get_candles(0, 5)[[3, 1, 4, 0, 2, 4]]
+
+        self.assertEqual(5, self.store.append(self.name, self.interval, candles))
+        self.assertEqual([0, 1, 2, 3, 4], list(self.store.read(self.name, self.interval)[:, 4]))
+
+    def test_read_time_range(self):
+        self.store.append(self.name, self.interval, self.get_candles(0, 100))
+
+        candles = self.store.read(self.name, self.interval, start_time=10 * 60000, end_time=20 * 60000)
+        self.assertEqual(list(range(10, 21)), list(candles[:, 4]))
+
+        candles = self.store.read(self.name, self.interval, end_time=20 * 60000, max_records=5)
+        self.assertEqual(list(range(16, 21)), list(candles[:, 4]))
+
+        candles_df = self.store.read_df(self.name, self.interval, start_time=95 * 60000)
+        self.assertEqual(self.columns, list(candles_df.columns))
+        self.assertEqual(5, len(candles_df))
+
+    def test_partially_written_row_is_ignored(self):
+        self.store.append(self.name, self.interval, self.get_candles(0, 3))
+        with open(self.store.get_file_path(self.name, self.interval), "ab") as f:
+            f.write(b"\x00" * 12)
+
+        self.assertEqual(3, len(self.store.read(self.name, self.interval)))
+
+        self.store.append(self.name, self.interval, self.get_candles(3, 5))
+        self.assertEqual([0, 1, 2, 3, 4], list(self.store.read(self.name, self.interval)[:, 4]))
+        self.assertEqual(5 * self.store.row_size,
+                         os.path.getsize(self.store.get_file_path(self.name, self.interval)))
+
+    def test_candles_save_and_load_from_store(self):
+        candles_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=10)
+        candles_feed.load_candles_from_df(pd.DataFrame(self.get_candles(0, 10), columns=self.columns))
+
+        self.assertEqual(10, candles_feed.save_candles_to_store(self.data_path))
+
+        new_candles_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=4)
+        new_candles_feed.load_candles_from_store(self.data_path, end_time=6 * 60000)
+        self.assertEqual([3, 4, 5, 6], list(new_candles_feed.candles_df["close"]))
+        self.assertTrue(new_candles_feed.is_ready)
+
+    def test_load_candles_from_store_raises_if_not_stored(self):
+        candles_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=10)
+
+        with self.assertRaises(FileNotFoundError):
+            candles_feed.load_candles_from_store(self.data_path)
@@ -0,0 +1,96 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+from os.path import join
+from typing import Awaitable
+
+from sqlalchemy import text
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=join(self.temp_dir.name, "test.sqlite"),
+        )
+
+    def tearDown(self) -> None:
+        self.manager.shutdown()
+        self.manager.engine.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_sqlite_pragmas(self):
+        with self.manager.get_new_session() as session:
+            self.assertEqual("wal", session.execute(text("PRAGMA journal_mode")).scalar())
+            # NORMAL
+            self.assertEqual(1, session.execute(text("PRAGMA synchronous")).scalar())
+            self.assertEqual(5000, session.execute(text("PRAGMA busy_timeout")).scalar())
+
+    def test_transactions_and_queries_run_on_worker_threads(self):
+        threads = []
+
+        def write(session):
+            threads.append(threading.current_thread().name)
+            session.add(Metadata(key="test_key", value="test_value"))
+
+        def query(session):
+            threads.append(threading.current_thread().name)
+            return session.query(Metadata).filter(Metadata.key == "test_key").one().value
+
+        self.async_run_with_timeout(self.manager.run_transaction(write))
+        value = self.async_run_with_timeout(self.manager.run_query(query))
+
+        self.assertEqual("test_value", value)
+        self.assertTrue(threads[0].startswith("SQLWriter"))
+        self.assertTrue(threads[1].startswith("SQLReader"))
+
+    def test_submitted_transactions_are_serialized(self):
+        for index in range(20):
+            self.manager.submit_transaction(
+                lambda session, index=index: session.add(Metadata(key=f"key_{index}", value=str(index))))
+        self.manager.execute_transaction(
+            lambda session: session.query(Metadata).filter(Metadata.key == "key_0").delete())
+
+        keys = self.async_run_with_timeout(self.manager.run_query(
+            lambda session: {metadata.key for metadata in session.query(Metadata).filter(Metadata.key.like("key_%"))}))
+
+        self.assertEqual({f"key_{index}" for index in range(1, 20)}, keys)
+
+    def test_failed_transaction_is_rolled_back(self):
+        def write(session):
+            session.add(Metadata(key="test_key", value="test_value"))
+            raise ValueError("write error")
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(self.manager.run_transaction(write))
+
+        count = self.async_run_with_timeout(self.manager.run_query(
+            lambda session: session.query(Metadata).filter(Metadata.key == "test_key").count()))
+        self.assertEqual(0, count)
+
+    def test_in_memory_database_is_used_from_the_calling_thread(self):
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=""
+        )
+
+        self.assertFalse(manager.uses_worker_threads)
+        manager.execute_transaction(lambda session: session.add(Metadata(key="test_key", value="test_value")))
+        value = self.async_run_with_timeout(manager.run_query(
+            lambda session: session.query(Metadata).filter(Metadata.key == "test_key").one().value))
+        self.assertEqual("test_value", value)
@@ -11,6 +11,7 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderExpiredEvent, SellOrderCreatedEvent
@@ -827,6 +828,29 @@ class RemoteIfaceMQTTTests(TestCase):
         self.hbapp.strategy = None
         self.ev_loop.run_until_complete(asyncio.sleep(0.2))
 
+    @patch("hummingbot.client.command.status_command.StatusCommand.strategy_status", new_callable=AsyncMock)
+    def test_mqtt_command_status_includes_clock_tick_stats(
+        self,
+        strategy_status_mock: AsyncMock
+    ):
+        strategy_status_mock.side_effect = self._create_exception_and_unlock_test_with_event_async
+        clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=0, end_time=10, tick_profiling_enabled=True)
+        clock.backtest_til(2)
+        self.hbapp.strategy = {}
+        self.hbapp.clock = clock
+        self.start_mqtt()
+        self.fake_mqtt_broker.publish_to_subscription(
+            self.get_topic_for(self.STATUS_URI),
+            {'async_backend': 1}
+        )
+        topic = f"test_reply/hbot/{self.instance_id}/status"
+        data = {"clock_tick_stats": clock.tick_stats.to_dict()}
+        self.ev_loop.run_until_complete(self.wait_for_rcv(topic, data, msg_key='data'))
+        self.assertTrue(self.is_msg_received(topic, data, msg_key='data'))
+        self.hbapp.strategy = None
+        self.hbapp.clock = None
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
     @patch("hummingbot.client.command.status_command.StatusCommand.strategy_status", new_callable=AsyncMock)
     def test_mqtt_command_status_sync(
         self,
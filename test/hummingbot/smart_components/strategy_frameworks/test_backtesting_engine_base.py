@@ -92,3 +92,38 @@ class TestBacktestingEngineBase(unittest.TestCase):
         result = self.backtesting_engine.summarize_results(pd.DataFrame())
         self.assertEqual(result["net_pnl"], 0)
         self.assertEqual(result["net_pnl_quote"], 0)
+
+    def test_apply_tp_sl_on_tl(self):
+        df = pd.DataFrame({
+            "timestamp": [0, 60000, 120000, 180000, 240000],
+            "close": [100, 102, 97, 100, 101],
+            "signal": [1, 0, -1, 0, 0],
+            "target": [1, 1, 1, 1, 1],
+        })
+        df.index = pd.to_datetime(df["timestamp"], unit="ms")
+        df["tl"] = df.index + pd.Timedelta(seconds=120)
+
+        df = self.backtesting_engine.apply_tp_sl_on_tl(df, tp=0.01, sl=0.01)
+
+        self.assertEqual(pd.Timestamp(60000, unit="ms"), df["take_profit_time"].iloc[0])
+        self.assertEqual(pd.Timestamp(120000, unit="ms"), df["stop_loss_time"].iloc[0])
+        self.assertEqual("tp", df["close_type"].iloc[0])
+        self.assertEqual(pd.Timestamp(180000, unit="ms"), df["stop_loss_time"].iloc[2])
+        self.assertEqual("sl", df["close_type"].iloc[2])
+        self.assertEqual("tl", df["close_type"].iloc[1])
+        self.assertEqual(df["tl"].iloc[1], df["close_time"].iloc[1])
+
+    def test_apply_tp_sl_on_tl_without_signals(self):
+        df = pd.DataFrame({
+            "timestamp": [0, 60000],
+            "close": [100, 102],
+            "signal": [0, 0],
+            "target": [1, 1],
+        })
+        df.index = pd.to_datetime(df["timestamp"], unit="ms")
+        df["tl"] = df.index + pd.Timedelta(seconds=120)
+
+        df = self.backtesting_engine.apply_tp_sl_on_tl(df, tp=0.01, sl=0.01)
+
+        self.assertTrue(df["take_profit_time"].isna().all())
+        self.assertEqual(list(df["tl"]), list(df["close_time"]))
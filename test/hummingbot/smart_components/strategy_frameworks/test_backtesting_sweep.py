@@ -0,0 +1,113 @@
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.smart_components.strategy_frameworks.backtesting_sweep import BacktestingSweep
+from hummingbot.smart_components.strategy_frameworks.data_types import OrderLevel, TripleBarrierConf
+from hummingbot.smart_components.strategy_frameworks.directional_trading import (
+    DirectionalTradingBacktestingEngine,
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+
+CANDLES_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
+                   "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+
+
+class MovingAverageConfig(DirectionalTradingControllerConfigBase):
+    strategy_name: str = "moving_average"
+    window: int = 10
+
+
+class MovingAverageController(DirectionalTradingControllerBase):
+    def get_processed_data(self) -> pd.DataFrame:
+        df = self.candles[0].candles_df
+        df["signal"] = np.sign(df["close"] - df["close"].rolling(self.config.window).mean()).fillna(0)
+        return df
+
+
+class TestBacktestingSweep(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.data_path = tempfile.mkdtemp()
+        rng = np.random.default_rng(7)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, 500)))
+        candles = pd.DataFrame(np.ones((500, len(CANDLES_COLUMNS))), columns=CANDLES_COLUMNS)
+        candles["timestamp"] = 1678924800000 + np.arange(500) * 60000
+        candles["close"] = close
+        candles.to_csv(f"{self.data_path}/candles_binance_perpetual_BTC-USDT_1m.csv", index=False)
+        self.base_config = MovingAverageConfig(
+            exchange="binance_perpetual",
+            trading_pair="BTC-USDT",
+            candles_config=[CandlesConfig(connector="binance_perpetual", trading_pair="BTC-USDT", interval="1m",
+                                          max_records=1000)],
+            order_levels=[
+                OrderLevel(level=0, side=side, order_amount_usd=Decimal("10"),
+                           triple_barrier_conf=TripleBarrierConf(take_profit=Decimal("0.01"),
+                                                                 stop_loss=Decimal("0.01"),
+                                                                 time_limit=60 * 30))
+                for side in [TradeType.BUY, TradeType.SELL]
+            ],
+        )
+        self.sweep = BacktestingSweep(engine_class=DirectionalTradingBacktestingEngine,
+                                      controller_class=MovingAverageController,
+                                      base_config=self.base_config,
+                                      data_path=self.data_path,
+                                      max_workers=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_path)
+        super().tearDown()
+
+    def test_get_param_combinations(self):
+        combinations = self.sweep.get_param_combinations({"a": [1, 2], "b": ["x", "y", "z"]})
+
+        self.assertEqual(6, len(combinations))
+        self.assertEqual({"a": 1, "b": "x"}, combinations[0])
+        self.assertEqual({"a": 2, "b": "z"}, combinations[-1])
+
+    def test_get_config_applies_order_level_params_to_all_levels(self):
+        config = self.sweep.get_config({"window": 20, "order_levels.triple_barrier_conf.take_profit": Decimal("0.03")})
+
+        self.assertIsInstance(config, MovingAverageConfig)
+        self.assertEqual(20, config.window)
+        self.assertEqual([Decimal("0.03")] * 2,
+                         [order_level.triple_barrier_conf.take_profit for order_level in config.order_levels])
+        self.assertEqual(10, self.base_config.window)
+        self.assertEqual(Decimal("0.01"), self.base_config.order_levels[0].triple_barrier_conf.take_profit)
+
+    def test_format_results_flattens_close_types(self):
+        row = self.sweep.format_results({"window": 5},
+                                        {"net_pnl": 0.1, "close_types": pd.Series({"tp": 2, "tl": 1})})
+
+        self.assertEqual({"window": 5, "net_pnl": 0.1, "close_type_tp": 2, "close_type_tl": 1}, row)
+
+    def test_run_matches_single_backtests(self):
+        param_grid = {
+            "window": [5, 20],
+            "order_levels.triple_barrier_conf.take_profit": [0.005, 0.02],
+            "order_levels.cooldown_time": [0, 300],
+        }
+        progress = []
+
+        results_df = self.sweep.run(param_grid, progress_callback=lambda done, total: progress.append((done, total)))
+
+        self.assertEqual(8, len(results_df))
+        self.assertEqual([(i, 8) for i in range(1, 9)], progress)
+        self.assertIn("net_pnl_quote", results_df.columns)
+        self.assertIn("close_type_tp", results_df.columns)
+        self.assertNotIn("close_types", results_df.columns)
+        for params, row in zip(self.sweep.get_param_combinations(param_grid), results_df.to_dict("records")):
+            controller = MovingAverageController(config=self.sweep.get_config(params))
+            controller.load_historical_data(data_path=self.data_path)
+            expected = DirectionalTradingBacktestingEngine(controller).run_backtesting()["results"]
+            self.assertEqual(params["window"], row["window"])
+            self.assertAlmostEqual(expected["net_pnl_quote"], row["net_pnl_quote"])
+            self.assertEqual(expected["total_executors"], row["total_executors"])
@@ -65,6 +65,21 @@ class TestControllerBase(unittest.TestCase):
         result = self.controller.get_candle("binance", "BTC-USDT", "1m")
         self.assertEqual(result, mock_candle)
 
+    def test_get_cached_processed_data_recomputes_only_when_candles_change(self):
+        mock_candle = MagicMock()
+        mock_candle.candles_version = 1
+        self.controller.candles = [mock_candle]
+        self.controller.get_processed_data = MagicMock(side_effect=[pd.DataFrame({"close": [1.0]}),
+                                                                    pd.DataFrame({"close": [2.0]})])
+
+        self.assertEqual(1.0, self.controller.get_cached_processed_data()["close"].iloc[-1])
+        self.assertEqual(1.0, self.controller.get_cached_processed_data()["close"].iloc[-1])
+        self.assertEqual(1, self.controller.get_processed_data.call_count)
+
+        mock_candle.candles_version = 2
+        self.assertEqual(2.0, self.controller.get_cached_processed_data()["close"].iloc[-1])
+        self.assertEqual(2, self.controller.get_processed_data.call_count)
+
     def test_all_candles_ready(self):
         mock_candle = MagicMock()
         mock_candle.is_ready = True
@@ -7,7 +7,6 @@ from unittest.mock import MagicMock, PropertyMock
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
@@ -16,6 +15,7 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
 )
 from hummingbot.smart_components.smart_component_base import SmartComponentBase, SmartComponentStatus
+from hummingbot.smart_components.smart_component_event_dispatcher import SmartComponentEventDispatcher
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
@@ -52,7 +52,7 @@ class TestSmartComponentBase(unittest.TestCase):
         self.assertEqual(len(component.connectors), 1)
         self.assertEqual(component._status, SmartComponentStatus.NOT_STARTED)
         self.assertEqual(component._states, [])
-        self.assertIsInstance(component._create_buy_order_forwarder, SourceInfoEventForwarder)
+        self.assertIsInstance(component._event_dispatchers["connector1"], SmartComponentEventDispatcher)
 
     def test_control_loop(self):
         self.component.control_task = MagicMock()
@@ -158,3 +158,47 @@ class TestSmartComponentBase(unittest.TestCase):
             amount=Decimal("1.0"),
         )
         self.assertEqual(sell_order_id, "OID-SELL-1")
+
+    def test_components_share_the_connector_event_dispatcher(self):
+        connector = self.strategy.connectors["connector1"]
+        other_component = SmartComponentBase(self.strategy, ["connector1"], update_interval=0.5)
+        event_dispatcher = self.component._event_dispatchers["connector1"]
+
+        self.assertIs(event_dispatcher, other_component._event_dispatchers["connector1"])
+        # The dispatcher listens once to each of the seven order events
+        self.assertEqual(7, connector.add_listener.call_count)
+
+        self.component.terminate_control_loop()
+        connector.remove_listener.assert_not_called()
+        other_component.terminate_control_loop()
+        self.assertEqual(7, connector.remove_listener.call_count)
+        self.assertNotIn(connector, SmartComponentEventDispatcher._dispatchers)
+
+    def test_order_events_are_routed_to_the_order_owner(self):
+        other_component = SmartComponentBase(self.strategy, ["connector1"], update_interval=0.5)
+        self.component.process_order_filled_event = MagicMock()
+        other_component.process_order_filled_event = MagicMock()
+        order_id = self.component.place_order(
+            connector_name="connector1",
+            trading_pair="ETH-USDT",
+            order_type=OrderType.LIMIT,
+            side=TradeType.BUY,
+            price=Decimal("1000.0"),
+            amount=Decimal("1.0"),
+        )
+        event_dispatcher = self.component._event_dispatchers["connector1"]
+        market = self.strategy.connectors["connector1"]
+
+        owned_order_event = MagicMock(order_id=order_id)
+        event_dispatcher._process_order_filled_event(1, market, owned_order_event)
+        self.component.process_order_filled_event.assert_called_once_with(1, market, owned_order_event)
+        other_component.process_order_filled_event.assert_not_called()
+
+        # The events of unknown orders are broadcast to every component
+        unknown_order_event = MagicMock(order_id="OID-UNKNOWN")
+        event_dispatcher._process_order_filled_event(1, market, unknown_order_event)
+        self.assertEqual(2, self.component.process_order_filled_event.call_count)
+        other_component.process_order_filled_event.assert_called_once_with(1, market, unknown_order_event)
+
+        self.component.terminate_control_loop()
+        other_component.terminate_control_loop()
@@ -0,0 +1,144 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.smart_components.utils.incremental_indicators import (
+    MACD,
+    NATR,
+    RSI,
+    BollingerBands,
+    CandlesIndicators,
+    ExponentialMovingAverage,
+    RollingWindow,
+    RunningMovingAverage,
+)
+
+
+class TestIncrementalIndicators(unittest.TestCase):
+    """
+    The expected values are calculated with the pandas_ta definitions of the indicators.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        rng = np.random.default_rng(1)
+        self.n = 300
+        self.columns = CandlesBase.columns
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, self.n)))
+        self.candles = np.zeros((self.n, len(self.columns)))
+        self.candles[:, self.columns.index("timestamp")] = np.arange(self.n) * 60000
+        self.candles[:, self.columns.index("close")] = close
+        self.candles[:, self.columns.index("high")] = close * (1 + rng.uniform(0, 0.01, self.n))
+        self.candles[:, self.columns.index("low")] = close * (1 - rng.uniform(0, 0.01, self.n))
+        self.df = pd.DataFrame(self.candles, columns=self.columns)
+
+    @staticmethod
+    def ema(close: pd.Series, length: int) -> pd.Series:
+        close = close.copy()
+        sma = close[:length].mean()
+        close[:length - 1] = np.nan
+        close.iloc[length - 1] = sma
+        return close.ewm(span=length, adjust=False).mean()
+
+    @staticmethod
+    def rma(values: pd.Series, length: int) -> pd.Series:
+        return values.ewm(alpha=1 / length, min_periods=length).mean()
+
+    def expected_bbands(self, length, std):
+        close = self.df["close"]
+        mid = close.rolling(length).mean()
+        std_dev = close.rolling(length).std(ddof=0)
+        lower, upper = mid - std * std_dev, mid + std * std_dev
+        return pd.DataFrame({
+            f"BBL_{length}_{float(std)}": lower,
+            f"BBM_{length}_{float(std)}": mid,
+            f"BBU_{length}_{float(std)}": upper,
+            f"BBB_{length}_{float(std)}": 100 * (upper - lower) / mid,
+            f"BBP_{length}_{float(std)}": (close - lower) / (upper - lower),
+        })
+
+    def expected_macd(self, fast, slow, signal):
+        macd = self.ema(self.df["close"], fast) - self.ema(self.df["close"], slow)
+        signal_ma = self.ema(macd.loc[macd.first_valid_index():], signal).reindex(macd.index)
+        suffix = f"_{fast}_{slow}_{signal}"
+        return pd.DataFrame({f"MACD{suffix}": macd, f"MACDh{suffix}": macd - signal_ma, f"MACDs{suffix}": signal_ma})
+
+    def expected_rsi(self, length):
+        change = self.df["close"].diff()
+        positive, negative = change.clip(lower=0), change.clip(upper=0)
+        positive_average, negative_average = self.rma(positive, length), self.rma(negative, length)
+        return pd.DataFrame({f"RSI_{length}": 100 * positive_average / (positive_average + negative_average.abs())})
+
+    def expected_natr(self, length):
+        high, low, close = self.df["high"], self.df["low"], self.df["close"]
+        previous_close = close.shift()
+        true_range = pd.concat([high - low, high - previous_close, previous_close - low], axis=1).abs().max(axis=1)
+        true_range.iloc[0] = np.nan
+        return pd.DataFrame({f"NATR_{length}": 100 * self.ema(true_range, length) / close})
+
+    def get_indicators(self):
+        return [BollingerBands(length=20, std=2), MACD(fast=12, slow=26, signal=9), RSI(length=14), NATR(length=14)]
+
+    def get_expected(self):
+        return pd.concat([self.expected_bbands(20, 2), self.expected_macd(12, 26, 9), self.expected_rsi(14),
+                          self.expected_natr(14)], axis=1)
+
+    def assert_values_equal(self, expected: pd.DataFrame, indicators: CandlesIndicators):
+        self.assertEqual(list(expected.columns), indicators.output_columns)
+        np.testing.assert_allclose(expected.values[-len(indicators.values):], indicators.values, rtol=1e-9)
+
+    def test_seed_matches_pandas_ta_definitions(self):
+        indicators = CandlesIndicators(indicators=self.get_indicators(), max_records=self.n)
+        indicators.seed(self.candles, self.columns)
+
+        self.assert_values_equal(self.get_expected(), indicators)
+
+    def test_incremental_updates_match_seed(self):
+        indicators = CandlesIndicators(indicators=self.get_indicators(), max_records=100)
+        indicators.update(self.candles[:50], self.columns)
+        for i in range(50, self.n):
+            # The candle is first received with a different close and then amended
+            amended_candle = self.candles[i].copy()
+            amended_candle[self.columns.index("close")] *= 1.01
+            indicators.update(np.vstack([self.candles[i - 10:i], amended_candle]), self.columns)
+            indicators.update(self.candles[max(i - 99, 0):i + 1], self.columns)
+
+        self.assertEqual(100, len(indicators.values))
+        self.assert_values_equal(self.get_expected(), indicators)
+
+    def test_update_seeds_again_if_pending_candle_is_not_in_candles(self):
+        indicators = CandlesIndicators(indicators=[RSI(length=14)], max_records=self.n)
+        indicators.update(self.candles[:100], self.columns)
+
+        indicators.update(self.candles[150:], self.columns)
+
+        expected = CandlesIndicators(indicators=[RSI(length=14)], max_records=self.n)
+        expected.seed(self.candles[150:], self.columns)
+        np.testing.assert_allclose(expected.values, indicators.values)
+
+    def test_add_to_df_aligns_with_last_candles(self):
+        indicators = CandlesIndicators(indicators=[MACD(fast=12, slow=26, signal=9)], max_records=10)
+        indicators.update(self.candles, self.columns)
+
+        df = indicators.add_to_df(self.df.tail(20).copy())
+
+        self.assertTrue(df["MACD_12_26_9"].iloc[:10].isna().all())
+        np.testing.assert_allclose(self.expected_macd(12, 26, 9)["MACD_12_26_9"].values[-10:],
+                                   df["MACD_12_26_9"].values[-10:])
+
+    def test_streaming_primitives_match_seed(self):
+        values = self.df["close"].values
+        primitives = [
+            (ExponentialMovingAverage(10), ExponentialMovingAverage(10)),
+            (RunningMovingAverage(10), RunningMovingAverage(10)),
+            (RollingWindow(10, ddof=1), RollingWindow(10, ddof=1)),
+        ]
+        for seeded, streaming in primitives:
+            seeded.seed(values[:-1])
+            for value in values[:-1]:
+                streaming.commit(value)
+
+            np.testing.assert_allclose(np.array(seeded.value(values[-1])), np.array(streaming.value(values[-1])),
+                                       rtol=1e-9)
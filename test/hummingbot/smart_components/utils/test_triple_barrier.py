@@ -0,0 +1,124 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.smart_components.utils.triple_barrier import RangeExtremaTable, TripleBarrier
+
+
+class TestTripleBarrier(unittest.TestCase):
+
+    @staticmethod
+    def brute_force_first_hit(close, start, end, signal, threshold, upper):
+        positions = []
+        for event_start, event_end, event_signal, event_threshold in zip(start, end, signal, threshold):
+            returns = (close[event_start:event_end + 1] / close[event_start] - 1) * event_signal
+            hits = np.flatnonzero(returns > event_threshold if upper else returns < event_threshold)
+            positions.append(event_start + hits[0] if len(hits) > 0 else -1)
+        return np.array(positions)
+
+    def test_range_extrema_table(self):
+        values = np.array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0])
+        table = RangeExtremaTable(values, max_window=4)
+
+        self.assertEqual(2, table.levels)
+        self.assertEqual([4.0, 5.0, 9.0, 9.0, 9.0], list(table.max_tables[2]))
+        self.assertEqual([1.0, 1.0, 1.0, 1.0, 2.0], list(table.min_tables[2]))
+
+    def test_range_extrema_table_ignores_nan(self):
+        values = np.array([3.0, np.nan, 4.0])
+        table = RangeExtremaTable(values, max_window=2)
+
+        self.assertEqual([3.0, 4.0], list(table.max_tables[1]))
+        self.assertEqual([3.0, 4.0], list(table.min_tables[1]))
+
+    def test_first_hit_positions(self):
+        close = np.array([100.0, 101.0, 99.0, 103.0, 97.0, 100.0])
+        start = np.array([0, 0, 1, 2])
+        end = np.array([5, 2, 5, 3])
+        signal = np.array([1.0, -1.0, 1.0, -1.0])
+
+        take_profit_positions = TripleBarrier.first_hit_positions(
+            close=close, start=start, end=end, signal=signal, threshold=np.array([0.02, 0.005, 0.01, 0.01]), upper=True)
+        stop_loss_positions = TripleBarrier.first_hit_positions(
+            close=close, start=start, end=end, signal=signal, threshold=np.array([-0.02, -0.005, -0.03, -0.03]),
+            upper=False)
+
+        self.assertEqual([3, 2, 3, -1], list(take_profit_positions))
+        self.assertEqual([4, 1, 4, 3], list(stop_loss_positions))
+
+    def test_first_hit_positions_disabled_barrier(self):
+        close = np.array([100.0, 120.0, 80.0])
+
+        positions = TripleBarrier.first_hit_positions(
+            close=close, start=np.array([0]), end=np.array([2]), signal=np.array([1.0]),
+            threshold=np.array([np.nan]), upper=True)
+
+        self.assertEqual([-1], list(positions))
+
+    def test_first_hit_positions_matches_path_scan(self):
+        rng = np.random.default_rng(42)
+        close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.003, 2000))), 2)
+        start = np.sort(rng.choice(2000, size=300, replace=False))
+        end = np.minimum(start + rng.integers(0, 150, size=300), 1999)
+        signal = rng.choice([-1.0, 1.0], size=300)
+
+        for upper, threshold in [(True, np.full(300, 0.01)), (False, np.full(300, -0.005))]:
+            expected = self.brute_force_first_hit(close, start, end, signal, threshold, upper)
+            result = TripleBarrier.first_hit_positions(
+                close=close, start=start, end=end, signal=signal, threshold=threshold, upper=upper)
+            self.assertEqual(list(expected), list(result))
+
+    def test_barrier_times(self):
+        timestamps = np.array([0, 60, 120, 180], dtype="datetime64[s]").astype("datetime64[ns]")
+        close = np.array([100.0, 102.0, 97.0, 100.0])
+
+        take_profit_times, stop_loss_times = TripleBarrier.barrier_times(
+            timestamps=timestamps,
+            close=close,
+            events=np.array([0, 2]),
+            time_limits=timestamps[[1, 3]],
+            signal=np.array([1.0, -1.0]),
+            take_profit=np.array([0.01, 0.01]),
+            stop_loss=np.array([-0.01, -0.01]),
+        )
+
+        self.assertEqual(timestamps[1], take_profit_times[0])
+        self.assertTrue(np.isnat(stop_loss_times[0]))
+        self.assertTrue(np.isnat(take_profit_times[1]))
+        self.assertEqual(timestamps[3], stop_loss_times[1])
+
+    def test_cooldown_filter(self):
+        timestamps = np.array([0, 60, 120, 180, 240, 300], dtype="datetime64[s]")
+        close_times = np.array([100, 90, 170, 200, 400, 310], dtype="datetime64[s]")
+
+        accepted = TripleBarrier.cooldown_filter(
+            timestamps=timestamps,
+            close_times=close_times,
+            cooldown=np.timedelta64(20, "s"),
+            last_close_time=np.datetime64(-100, "s"),
+        )
+
+        self.assertEqual([0, 2, 4], list(accepted))
+
+    def test_cooldown_filter_respects_last_close_time(self):
+        timestamps = np.array([0, 60, 120], dtype="datetime64[s]")
+        close_times = np.array([10, 70, 130], dtype="datetime64[s]")
+
+        accepted = TripleBarrier.cooldown_filter(
+            timestamps=timestamps,
+            close_times=close_times,
+            cooldown=np.timedelta64(0, "s"),
+            last_close_time=np.datetime64(30, "s"),
+        )
+
+        self.assertEqual([1, 2], list(accepted))
+
+    def test_cooldown_filter_without_events(self):
+        accepted = TripleBarrier.cooldown_filter(
+            timestamps=np.array([], dtype="datetime64[s]"),
+            close_times=np.array([], dtype="datetime64[s]"),
+            cooldown=np.timedelta64(0, "s"),
+            last_close_time=np.datetime64(0, "s"),
+        )
+
+        self.assertEqual(0, len(accepted))